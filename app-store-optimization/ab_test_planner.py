@@ -3,10 +3,16 @@ A/B testing module for App Store Optimization.
 Plans and tracks A/B tests for metadata and visual assets.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+from statistics import NormalDist
 import math
 
 
+# Shared standard normal distribution (exact inverse CDF)
+_STANDARD_NORMAL = NormalDist()
+_SQRT2 = math.sqrt(2.0)
+
+
 class ABTestPlanner:
     """Plans and tracks A/B tests for ASO elements."""
 
@@ -105,14 +111,11 @@ class ABTestPlanner:
         z_alpha = self._get_z_score(1 - alpha / 2)  # Two-tailed test
         z_beta = self._get_z_score(power)
 
-        # Pooled standard deviation
-        p_pooled = (baseline_conversion + expected_conversion_b) / 2
-        sd_pooled = math.sqrt(2 * p_pooled * (1 - p_pooled))
-
         # Sample size per variant
-        n_per_variant = math.ceil(
-            ((z_alpha + z_beta) ** 2 * sd_pooled ** 2) /
-            ((expected_conversion_b - baseline_conversion) ** 2)
+        n_per_variant = self._sample_size_per_variant(
+            baseline_conversion,
+            expected_conversion_b,
+            z_alpha + z_beta
         )
 
         total_sample_size = n_per_variant * 2
@@ -157,9 +160,13 @@ class ABTestPlanner:
         Returns:
             Significance analysis with decision recommendation
         """
-        # Calculate conversion rates
-        rate_a = variant_a_conversions / variant_a_visitors if variant_a_visitors > 0 else 0
-        rate_b = variant_b_conversions / variant_b_visitors if variant_b_visitors > 0 else 0
+        # Conversion rates and z-score
+        rate_a, rate_b, z_score = self._two_proportion_z(
+            variant_a_conversions,
+            variant_a_visitors,
+            variant_b_conversions,
+            variant_b_visitors
+        )
 
         # Calculate improvement
         if rate_a > 0:
@@ -169,16 +176,8 @@ class ABTestPlanner:
 
         absolute_improvement = rate_b - rate_a
 
-        # Calculate standard error
-        se_a = math.sqrt(rate_a * (1 - rate_a) / variant_a_visitors) if variant_a_visitors > 0 else 0
-        se_b = math.sqrt(rate_b * (1 - rate_b) / variant_b_visitors) if variant_b_visitors > 0 else 0
-        se_diff = math.sqrt(se_a**2 + se_b**2)
-
-        # Calculate z-score
-        z_score = absolute_improvement / se_diff if se_diff > 0 else 0
-
         # Calculate p-value (two-tailed)
-        p_value = 2 * (1 - self._standard_normal_cdf(abs(z_score)))
+        p_value = 2 * self._standard_normal_cdf(-abs(z_score))
 
         # Determine significance
         is_significant_95 = p_value < 0.05
@@ -217,17 +216,162 @@ class ABTestPlanner:
             'decision': decision
         }
 
+    def calculate_significance_batch(
+        self,
+        variant_a_conversions: Sequence[int],
+        variant_a_visitors: Sequence[int],
+        variant_b_conversions: Sequence[int],
+        variant_b_visitors: Sequence[int]
+    ) -> Dict[str, List[Any]]:
+        """
+        Calculate significance for many tests in one call.
+
+        The four sequences are aligned by position (one entry per test). Values
+        are unrounded and equal to what calculate_significance computes for
+        each test. Without numpy there is no vectorized kernel: the batch is one
+        tight loop with the rate, standard error and p-value arithmetic inlined,
+        returning columns instead of one nested report per test.
+
+        Args:
+            variant_a_conversions: Conversions for control, per test
+            variant_a_visitors: Visitors for control, per test
+            variant_b_conversions: Conversions for variation, per test
+            variant_b_visitors: Visitors for variation, per test
+
+        Returns:
+            Column lists: conversion rates, improvements, z-scores, p-values
+            and significance flags in input order (empty lists for no tests)
+
+        Raises:
+            ValueError: If the sequences differ in length
+        """
+        count = len(variant_a_conversions)
+        if not (len(variant_a_visitors) == len(variant_b_conversions) == len(variant_b_visitors) == count):
+            raise ValueError("All conversion and visitor sequences must have the same length")
+
+        sqrt = math.sqrt
+        erfc = math.erfc
+
+        rates_a: List[float] = []
+        rates_b: List[float] = []
+        z_scores: List[float] = []
+        p_values: List[float] = []
+        for conversions_a, visitors_a, conversions_b, visitors_b in zip(
+            variant_a_conversions, variant_a_visitors, variant_b_conversions, variant_b_visitors
+        ):
+            # Same arithmetic as _two_proportion_z and _standard_normal_cdf
+            rate_a = conversions_a / visitors_a if visitors_a > 0 else 0
+            rate_b = conversions_b / visitors_b if visitors_b > 0 else 0
+            se_a = sqrt(rate_a * (1 - rate_a) / visitors_a) if visitors_a > 0 else 0
+            se_b = sqrt(rate_b * (1 - rate_b) / visitors_b) if visitors_b > 0 else 0
+            se_diff = sqrt(se_a**2 + se_b**2)
+            z_score = (rate_b - rate_a) / se_diff if se_diff > 0 else 0
+
+            rates_a.append(rate_a)
+            rates_b.append(rate_b)
+            z_scores.append(z_score)
+            # Two-tailed p-value from the lower tail
+            p_values.append(2 * (0.5 * erfc(abs(z_score) / _SQRT2)))
+
+        return {
+            'conversion_rate_a': rates_a,
+            'conversion_rate_b': rates_b,
+            'absolute_improvement': [rate_b - rate_a for rate_a, rate_b in zip(rates_a, rates_b)],
+            'relative_improvement': [
+                (rate_b - rate_a) / rate_a if rate_a > 0 else 0
+                for rate_a, rate_b in zip(rates_a, rates_b)
+            ],
+            'z_scores': z_scores,
+            'p_values': p_values,
+            'is_significant_95': [p_value < 0.05 for p_value in p_values],
+            'is_significant_90': [p_value < 0.10 for p_value in p_values]
+        }
+
+    def calculate_sample_size_grid(
+        self,
+        baseline_conversions: Sequence[float],
+        minimum_detectable_effects: Sequence[float],
+        powers: Sequence[float] = (0.80,),
+        confidence_level: str = 'standard'
+    ) -> Dict[str, Any]:
+        """
+        Calculate required sample sizes over a baseline x effect x power grid.
+
+        Each cell equals calculate_sample_size for the same parameters. The
+        z-quantiles are looked up once (z_alpha once, z_beta once per power) and
+        the pooled variance and squared difference once per baseline x effect,
+        so each cell costs one multiply, divide and ceil. This is a stdlib loop,
+        not a numpy-style vectorized evaluation.
+
+        Args:
+            baseline_conversions: Current conversion rates (0-1)
+            minimum_detectable_effects: Minimum effect sizes to detect (0-1)
+            powers: Statistical powers
+            confidence_level: 'high', 'standard', or 'exploratory'
+
+        Returns:
+            Grid axes, nested per-variant sample sizes indexed
+            [baseline][effect][power], and one flat row per cell (an empty
+            axis gives an empty grid)
+
+        Raises:
+            ValueError: If a power is not between 0 and 1 (exclusive)
+        """
+        alpha = 1 - self.CONFIDENCE_LEVELS[confidence_level]
+        z_alpha = self._get_z_score(1 - alpha / 2)  # Two-tailed test
+        z_squares = [(z_alpha + z_beta) ** 2 for z_beta in self._get_z_scores(powers)]
+        sample_size_terms = self._sample_size_terms
+        ceil = math.ceil
+
+        sample_sizes: List[List[List[int]]] = []
+        rows: List[Dict[str, Any]] = []
+        for baseline in baseline_conversions:
+            baseline_sizes = []
+            for effect in minimum_detectable_effects:
+                variance, difference_squared = sample_size_terms(baseline, baseline * (1 + effect))
+                effect_sizes = [ceil((z_squared * variance) / difference_squared) for z_squared in z_squares]
+                for power, n_per_variant in zip(powers, effect_sizes):
+                    rows.append({
+                        'baseline_conversion': baseline,
+                        'minimum_detectable_effect': effect,
+                        'statistical_power': power,
+                        'sample_size_per_variant': n_per_variant,
+                        'total_sample_size': n_per_variant * 2
+                    })
+                baseline_sizes.append(effect_sizes)
+            sample_sizes.append(baseline_sizes)
+
+        return {
+            'baseline_conversions': list(baseline_conversions),
+            'minimum_detectable_effects': list(minimum_detectable_effects),
+            'powers': list(powers),
+            'confidence_level': confidence_level,
+            'sample_size_per_variant': sample_sizes,
+            'rows': rows
+        }
+
     def track_test_results(
         self,
         test_id: str,
-        results_data: Dict[str, Any]
+        results_data: Dict[str, Any],
+        sequential: bool = False,
+        mixture_variance: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         Track ongoing test results and provide recommendations.
 
+        In sequential mode each call is treated as one look at cumulative
+        results and an always-valid p-value (mSPRT) is kept on the test, so
+        results can be checked at any time and the test stopped as soon as the
+        p-value drops below 0.05 (the 95% level used for implementation
+        decisions), without inflating false positives.
+
         Args:
             test_id: Test identifier
-            results_data: Current test results
+            results_data: Current (cumulative) test results
+            sequential: Evaluate with the sequential test and allow early stopping
+            mixture_variance: Variance of the normal mixture over the absolute
+                effect (default: squared minimum effect size at the baseline rate)
 
         Returns:
             Test tracking report with next steps
@@ -256,8 +400,12 @@ class ABTestPlanner:
             progress_percentage,
             test['test_type']
         )
+        next_steps = self._determine_next_steps(
+            significance,
+            progress_percentage
+        )
 
-        return {
+        report = {
             'test_id': test_id,
             'test_type': test['test_type'],
             'progress': {
@@ -268,12 +416,33 @@ class ABTestPlanner:
             },
             'current_results': significance,
             'recommendations': recommendations,
-            'next_steps': self._determine_next_steps(
-                significance,
-                progress_percentage
-            )
+            'next_steps': next_steps
         }
 
+        if sequential:
+            sequential_results = self._sequential_analysis(
+                test,
+                results_data,
+                required_sample,
+                mixture_variance
+            )
+            report['sequential'] = sequential_results
+
+            if sequential_results['can_stop_early']:
+                # The fixed-horizon progress advice no longer applies once the test has stopped
+                report['progress']['is_complete'] = True
+                report['recommendations'] = [
+                    f"Sequential boundary crossed at {sequential_results['stopped_at_visitors']:,} visitors "
+                    f"(always-valid p = {sequential_results['always_valid_p_value']:.4f}) - safe to conclude test"
+                ]
+                report['next_steps'] = self._determine_next_steps(sequential_results, 100)
+            elif progress_percentage < 100:
+                recommendations.append(
+                    "Sequential monitoring active - results can be checked at any time without inflating false positives"
+                )
+
+        return report
+
     def generate_test_report(
         self,
         test_id: str,
@@ -424,30 +593,221 @@ class ABTestPlanner:
 
         return recommendations
 
-    def _get_z_score(self, percentile: float) -> float:
-        """Get z-score for given percentile (approximation)."""
-        # Common z-scores
-        z_scores = {
-            0.80: 0.84,
-            0.85: 1.04,
-            0.90: 1.28,
-            0.95: 1.645,
-            0.975: 1.96,
-            0.99: 2.33
+    @staticmethod
+    def _sample_size_per_variant(
+        baseline_conversion: float,
+        expected_conversion_b: float,
+        z_total: float
+    ) -> int:
+        """Per-variant sample size for two rates and z_alpha + z_beta."""
+        variance, difference_squared = ABTestPlanner._sample_size_terms(
+            baseline_conversion,
+            expected_conversion_b
+        )
+        return math.ceil((z_total ** 2 * variance) / difference_squared)
+
+    @staticmethod
+    def _sample_size_terms(baseline_conversion: float, expected_conversion_b: float) -> Tuple[float, float]:
+        """Pooled variance and squared rate difference of the sample size formula."""
+        # Pooled standard deviation
+        p_pooled = (baseline_conversion + expected_conversion_b) / 2
+        sd_pooled = math.sqrt(2 * p_pooled * (1 - p_pooled))
+
+        return sd_pooled ** 2, (expected_conversion_b - baseline_conversion) ** 2
+
+    @staticmethod
+    def _two_proportion_z(
+        variant_a_conversions: int,
+        variant_a_visitors: int,
+        variant_b_conversions: int,
+        variant_b_visitors: int
+    ) -> Tuple[float, float, float]:
+        """Conversion rates of both variants and the unpooled z-score of their difference."""
+        rate_a = variant_a_conversions / variant_a_visitors if variant_a_visitors > 0 else 0
+        rate_b = variant_b_conversions / variant_b_visitors if variant_b_visitors > 0 else 0
+
+        # Calculate standard error
+        se_a = math.sqrt(rate_a * (1 - rate_a) / variant_a_visitors) if variant_a_visitors > 0 else 0
+        se_b = math.sqrt(rate_b * (1 - rate_b) / variant_b_visitors) if variant_b_visitors > 0 else 0
+        se_diff = math.sqrt(se_a**2 + se_b**2)
+
+        z_score = (rate_b - rate_a) / se_diff if se_diff > 0 else 0
+        return rate_a, rate_b, z_score
+
+    def _sequential_analysis(
+        self,
+        test: Dict[str, Any],
+        results_data: Dict[str, Any],
+        required_sample: int,
+        mixture_variance: Optional[float]
+    ) -> Dict[str, Any]:
+        """
+        Mixture sequential probability ratio test (mSPRT) on the difference in rates.
+
+        The running minimum p-value, the mixture variance and the stopping point
+        are kept on the test dict so they persist across looks.
+        """
+        state = test.setdefault('sequential', {
+            'mixture_variance': None,
+            'min_p_value': 1.0,
+            'looks': 0,
+            'stopped_at_visitors': None
+        })
+        # Same level at which _generate_test_decision recommends implementing a variant
+        alpha = 1 - self.CONFIDENCE_LEVELS['high']
+
+        visitors_a = results_data['variant_a_visitors']
+        visitors_b = results_data['variant_b_visitors']
+        total_visitors = visitors_a + visitors_b
+        rate_a, rate_b, _ = self._two_proportion_z(
+            results_data['variant_a_conversions'],
+            visitors_a,
+            results_data['variant_b_conversions'],
+            visitors_b
+        )
+        difference = rate_b - rate_a
+        variance = (
+            (rate_a * (1 - rate_a) / visitors_a if visitors_a > 0 else 0) +
+            (rate_b * (1 - rate_b) / visitors_b if visitors_b > 0 else 0)
+        )
+
+        # The mixture is fixed at the first look where it can be set, so later
+        # looks test the same hypothesis
+        if mixture_variance is not None:
+            if mixture_variance <= 0:
+                raise ValueError("mixture_variance must be positive")
+            state['mixture_variance'] = mixture_variance
+        elif state['mixture_variance'] is None:
+            baseline = results_data.get('baseline_conversion', rate_a)
+            effect = baseline * test.get('minimum_effect_size', 0.05)
+            if effect > 0:
+                state['mixture_variance'] = effect ** 2
+        tau_squared = state['mixture_variance']
+
+        state['looks'] += 1
+        if tau_squared and variance > 0:
+            log_ratio = self._msprt_log_likelihood_ratio(difference, variance, tau_squared)
+            p_value = math.exp(-log_ratio) if log_ratio > 0 else 1.0
+            state['min_p_value'] = min(state['min_p_value'], p_value)
+        if state['stopped_at_visitors'] is None and state['min_p_value'] < alpha:
+            state['stopped_at_visitors'] = total_visitors
+
+        can_stop_early = state['stopped_at_visitors'] is not None
+        if can_stop_early:
+            stopping_sample = state['stopped_at_visitors']
+        elif tau_squared and variance > 0 and difference != 0:
+            stopping_sample = self._projected_stopping_sample(
+                difference, variance, total_visitors, tau_squared, alpha, required_sample
+            )
+        else:
+            stopping_sample = None
+        if stopping_sample is None or stopping_sample >= required_sample:
+            sample_savings = 0
+        else:
+            sample_savings = required_sample - stopping_sample
+
+        if tau_squared and variance > 0:
+            # Always-valid confidence interval at the current look
+            half_width = math.sqrt(
+                variance * (variance + tau_squared) / tau_squared *
+                (math.log((variance + tau_squared) / variance) - 2 * math.log(alpha))
+            )
+            confidence_interval = [round(difference - half_width, 4), round(difference + half_width, 4)]
+        else:
+            confidence_interval = None
+
+        if not can_stop_early:
+            decision = {
+                'decision': 'continue',
+                'rationale': 'Sequential boundary not crossed - keep collecting data',
+                'action': 'Keep test running'
+            }
+        elif difference > 0:
+            decision = {
+                'decision': 'implement_b',
+                'rationale': f'Variant B is better with always-valid p-value below {alpha:.2f}',
+                'action': 'Implement Variant B'
+            }
+        else:
+            decision = {
+                'decision': 'keep_a',
+                'rationale': f'Variant A is better with always-valid p-value below {alpha:.2f}',
+                'action': 'Keep current version (A)'
+            }
+
+        return {
+            'method': 'mSPRT',
+            'alpha': round(alpha, 4),
+            'mixture_variance': tau_squared,
+            'looks': state['looks'],
+            'always_valid_p_value': round(state['min_p_value'], 4),
+            'always_valid_confidence_interval': confidence_interval,
+            'can_stop_early': can_stop_early,
+            'stopped_at_visitors': state['stopped_at_visitors'],
+            'projected_stopping_sample': stopping_sample,
+            'expected_sample_savings': sample_savings,
+            'expected_savings_percentage': round(sample_savings / required_sample * 100, 1) if required_sample > 0 else 0,
+            'decision': decision
         }
-        return z_scores.get(percentile, 1.96)
+
+    @staticmethod
+    def _msprt_log_likelihood_ratio(difference: float, variance: float, tau_squared: float) -> float:
+        """Log of the normal-mixture likelihood ratio for an estimate with the given variance."""
+        return (
+            0.5 * math.log(variance / (variance + tau_squared)) +
+            tau_squared * difference ** 2 / (2 * variance * (variance + tau_squared))
+        )
+
+    def _projected_stopping_sample(
+        self,
+        difference: float,
+        variance: float,
+        total_visitors: int,
+        tau_squared: float,
+        alpha: float,
+        limit: int
+    ) -> Optional[int]:
+        """
+        Total visitors at which the sequential test would stop if the observed
+        difference holds (variance shrinks in proportion to the sample).
+        """
+        threshold = -math.log(alpha)
+        log_ratio = self._msprt_log_likelihood_ratio
+
+        def crosses(visitors: int) -> bool:
+            return log_ratio(difference, variance * total_visitors / visitors, tau_squared) >= threshold
+
+        if limit <= total_visitors or not crosses(limit):
+            return None
+
+        # Smallest crossing sample size between the current look and the limit
+        low, high = total_visitors, limit
+        while high - low > 1:
+            middle = (low + high) // 2
+            if crosses(middle):
+                high = middle
+            else:
+                low = middle
+        return high
+
+    def _get_z_score(self, percentile: float) -> float:
+        """Get z-score for given percentile (exact inverse normal CDF)."""
+        if not 0 < percentile < 1:
+            raise ValueError(f"Percentile must be between 0 and 1 (exclusive), got {percentile}")
+        return _STANDARD_NORMAL.inv_cdf(percentile)
+
+    def _get_z_scores(self, percentiles: Sequence[float]) -> List[float]:
+        """Get z-scores for many percentiles in one call."""
+        inv_cdf = _STANDARD_NORMAL.inv_cdf
+        for percentile in percentiles:
+            if not 0 < percentile < 1:
+                raise ValueError(f"Percentile must be between 0 and 1 (exclusive), got {percentile}")
+        return [inv_cdf(percentile) for percentile in percentiles]
 
     def _standard_normal_cdf(self, z: float) -> float:
-        """Approximate standard normal cumulative distribution function."""
-        # Using error function approximation
-        t = 1.0 / (1.0 + 0.2316419 * abs(z))
-        d = 0.3989423 * math.exp(-z * z / 2.0)
-        p = d * t * (0.3193815 + t * (-0.3565638 + t * (1.781478 + t * (-1.821256 + t * 1.330274))))
-
-        if z > 0:
-            return 1.0 - p
-        else:
-            return p
+        """Standard normal cumulative distribution function."""
+        # erfc keeps full precision in the lower tail, where p-values are computed
+        return 0.5 * math.erfc(-z / _SQRT2)
 
     def _generate_test_decision(
         self,
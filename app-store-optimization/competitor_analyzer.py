@@ -3,25 +3,226 @@ Competitor analysis module for App Store Optimization.
 Analyzes top competitors' ASO strategies and identifies opportunities.
 """
 
-from typing import Dict, List, Any, Optional
-from collections import Counter
+from typing import Dict, List, Any, Optional, Iterable, Tuple
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import accumulate
+import hashlib
+import heapq
+import json
 import re
 
+from similarity import MinHashLSHIndex
+from text_normalizer import get_stem_table, get_tokenizer, KeywordAutomaton
+
+
+CTA_KEYWORDS = ('download', 'try', 'get', 'start', 'join')
+DIFFERENTIATOR_KEYWORDS = (
+    'unique', 'only', 'first', 'best', 'leading', 'exclusive',
+    'revolutionary', 'innovative', 'patent', 'award'
+)
+
+# Compiled once per process and shared by every analyzer
+_CTA_AUTOMATON = KeywordAutomaton(CTA_KEYWORDS)
+_DIFFERENTIATOR_AUTOMATON = KeywordAutomaton(DIFFERENTIATOR_KEYWORDS)
+_BULLET_CHARS = frozenset('•*-✓')
+_BULLET_PREFIX_RE = re.compile(r'^[•*\-✓\d.)\s]+')
+_TITLE_SPLIT_RE = re.compile(r'[-:|]')
+
+
+class KeywordUsageIndex:
+    """Inverted keyword -> app-slot index (sparse keyword x app matrix) for coverage and gap queries."""
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._apps: List[Optional[str]] = []
+        self._app_slots: Dict[str, int] = {}
+        self._app_keywords: Dict[str, frozenset] = {}
+        self._keyword_apps: Dict[str, set] = {}
+
+    def __len__(self) -> int:
+        """Number of indexed apps."""
+        return len(self._app_slots)
+
+    def add_app(self, app_name: str, keywords: Iterable[str]) -> None:
+        """
+        Index (or re-index) an app's keywords.
+
+        Args:
+            app_name: App identifier; re-adding an app replaces its keywords but keeps its position
+            keywords: Keywords the app uses
+        """
+        if app_name in self._app_slots:
+            self._clear_keywords(app_name)
+        else:
+            self._app_slots[app_name] = len(self._apps)
+            self._apps.append(app_name)
+
+        slot = self._app_slots[app_name]
+        keyword_set = frozenset(keywords)
+        self._app_keywords[app_name] = keyword_set
+        keyword_apps = self._keyword_apps
+        for keyword in keyword_set:
+            slots = keyword_apps.get(keyword)
+            if slots is None:
+                keyword_apps[keyword] = {slot}
+            else:
+                slots.add(slot)
+
+    def remove_app(self, app_name: str) -> None:
+        """Drop an app from the index."""
+        if app_name not in self._app_slots:
+            return
+        self._clear_keywords(app_name)
+        self._apps[self._app_slots.pop(app_name)] = None
+        del self._app_keywords[app_name]
+
+    def _clear_keywords(self, app_name: str) -> None:
+        """Remove an app's slot from every keyword it used."""
+        slot = self._app_slots[app_name]
+        for keyword in self._app_keywords[app_name]:
+            slots = self._keyword_apps[keyword]
+            slots.discard(slot)
+            if not slots:
+                del self._keyword_apps[keyword]
+
+    def usage_count(self, keyword: str) -> int:
+        """Number of indexed apps using a keyword."""
+        return len(self._keyword_apps.get(keyword, ()))
+
+    def apps_using(self, keyword: str) -> List[str]:
+        """Apps using a keyword, in indexing order."""
+        return [self._apps[slot] for slot in sorted(self._keyword_apps.get(keyword, ()))]
+
+    def gaps(self, total_apps: Optional[int] = None, top_n: int = 15) -> List[Dict[str, Any]]:
+        """
+        Keywords used by more than one app but not by all of them.
+
+        Args:
+            total_apps: Denominator for usage percentages (default: indexed apps)
+            top_n: Number of gaps to return, most used first
+
+        Returns:
+            List of dicts with keyword, used_by and usage_percentage
+        """
+        total = total_apps or len(self._app_slots)
+        if not total:
+            return []
+
+        top = heapq.nlargest(
+            top_n,
+            (
+                (keyword, len(slots)) for keyword, slots in self._keyword_apps.items()
+                if 1 < len(slots) < total
+            ),
+            key=lambda item: item[1]
+        )
+        return [
+            {
+                'keyword': keyword,
+                'used_by': self.apps_using(keyword),
+                'usage_percentage': round(count / total * 100, 1)
+            }
+            for keyword, count in top
+        ]
+
+    def app_gaps(self, app_name: str, min_apps: int = 2, top_n: int = 15) -> List[Dict[str, Any]]:
+        """
+        Keywords other apps use that a given app does not.
+
+        Args:
+            app_name: App to find gaps for (need not be indexed)
+            min_apps: Minimum number of other apps using the keyword
+            top_n: Number of gaps to return, most used first
+
+        Returns:
+            List of dicts with keyword, used_by_count and usage_percentage
+        """
+        own_slot = self._app_slots.get(app_name)
+        others = len(self._app_slots) - (0 if own_slot is None else 1)
+        if others <= 0:
+            return []
+
+        top = heapq.nlargest(
+            top_n,
+            (
+                (keyword, len(slots)) for keyword, slots in self._keyword_apps.items()
+                if len(slots) >= min_apps and own_slot not in slots
+            ),
+            key=lambda item: item[1]
+        )
+        return [
+            {
+                'keyword': keyword,
+                'used_by_count': count,
+                'usage_percentage': round(count / others * 100, 1)
+            }
+            for keyword, count in top
+        ]
+
 
 class CompetitorAnalyzer:
     """Analyzes competitor apps to identify ASO opportunities."""
 
-    def __init__(self, category: str, platform: str = 'apple'):
+    # Fields of app_data that affect an analysis (the content hash covers only these)
+    ANALYZED_FIELDS = ('app_name', 'title', 'description', 'rating', 'ratings_count', 'keywords')
+
+    # Fewer cache misses than this are analyzed in-process: starting a process pool
+    # (~20ms) costs more than analyzing a hundred-odd apps (~0.2ms each) directly
+    MIN_POOLED_ANALYSES = 128
+
+    def __init__(
+        self,
+        category: str,
+        platform: str = 'apple',
+        language: str = 'en',
+        max_competitors: int = 500,
+        cache_size: int = 2048
+    ):
         """
         Initialize competitor analyzer.
 
         Args:
             category: App category (e.g., "Productivity", "Games")
             platform: 'apple' or 'google'
+            language: Listing language, selects the plural folding table for keywords
+            max_competitors: Maximum apps kept in the competitor registry (oldest evicted)
+            cache_size: Maximum analyses kept in the content-hash cache (least recently used evicted)
         """
         self.category = category
         self.platform = platform
-        self.competitors = []
+        self.language = language
+        self.stem_table = get_stem_table(language)
+        # Folded words of 4+ characters without stop words, for titles and descriptions
+        self.keyword_tokenizer = get_tokenizer(language, 4, stem=True)
+        self.max_competitors = max_competitors
+        self.cache_size = cache_size
+        self._registry: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._analysis_cache: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+
+    @property
+    def competitors(self) -> List[Dict[str, Any]]:
+        """Latest analysis per app (deduplicated by app name, bounded by max_competitors)."""
+        return list(self._registry.values())
+
+    def content_hash(self, app_data: Dict[str, Any]) -> str:
+        """
+        Hash the analyzed fields of an app's data.
+
+        Args:
+            app_data: Dictionary with app_name, title, description, rating, ratings_count, keywords
+
+        Returns:
+            Hex digest identifying the analysis inputs
+        """
+        payload = json.dumps(
+            [app_data.get(field) for field in self.ANALYZED_FIELDS],
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
 
     def analyze_competitor(
         self,
@@ -34,20 +235,97 @@ class CompetitorAnalyzer:
             app_data: Dictionary with app_name, title, description, rating, ratings_count, keywords
 
         Returns:
-            Comprehensive competitor analysis
+            Comprehensive competitor analysis (shared with the cache; treat as read-only)
+        """
+        key = self.content_hash(app_data)
+        analysis = self._analysis_cache.get(key)
+        if analysis is None:
+            analysis = self._analyze_uncached(app_data, key)
+            self._cache_analysis(key, analysis)
+        else:
+            self._analysis_cache.move_to_end(key)
+
+        self._register(analysis['app_name'] or key, analysis)
+        return analysis
+
+    def analyze_competitors(
+        self,
+        competitors_data: List[Dict[str, Any]],
+        max_workers: int = 1,
+        chunk_size: int = 32
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze many competitors, optionally sharding cache misses across processes.
+
+        The pool is only started when at least MIN_POOLED_ANALYSES apps miss the
+        cache; smaller batches are analyzed in this process.
+
+        Args:
+            competitors_data: List of competitor data dictionaries
+            max_workers: Worker processes for uncached apps (1 = this process, None = CPU count)
+            chunk_size: Apps per task sent to a worker
+
+        Returns:
+            Analyses in input order (same records analyze_competitor returns)
         """
+        if max_workers == 1:
+            return [self.analyze_competitor(comp_data) for comp_data in competitors_data]
+
+        keys = [self.content_hash(comp_data) for comp_data in competitors_data]
+
+        # Serve cache hits first; only misses go to the pool (each distinct key once)
+        analyses: Dict[str, Dict[str, Any]] = {}
+        misses: Dict[str, Dict[str, Any]] = {}
+        for key, comp_data in zip(keys, competitors_data):
+            if key in self._analysis_cache:
+                self._analysis_cache.move_to_end(key)
+                analyses[key] = self._analysis_cache[key]
+            else:
+                misses.setdefault(key, comp_data)
+
+        if len(misses) < self.MIN_POOLED_ANALYSES:
+            for key, comp_data in misses.items():
+                analyses[key] = self._analyze_uncached(comp_data, key)
+                self._cache_analysis(key, analyses[key])
+        else:
+            items = list(misses.items())
+            chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+            settings = (self.category, self.platform, self.language)
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                results = pool.map(_analyze_competitor_chunk, [settings] * len(chunks), chunks)
+                for chunk_results in results:
+                    for key, analysis in chunk_results:
+                        analyses[key] = analysis
+                        self._cache_analysis(key, analysis)
+
+        ordered = []
+        for key in keys:
+            analysis = analyses[key]
+            self._register(analysis['app_name'] or key, analysis)
+            ordered.append(analysis)
+        return ordered
+
+    def _cache_analysis(self, key: str, analysis: Dict[str, Any]) -> None:
+        """Store an analysis, evicting the least recently used one when full."""
+        self._analysis_cache[key] = analysis
+        if len(self._analysis_cache) > self.cache_size:
+            self._analysis_cache.popitem(last=False)
+
+    def _analyze_uncached(self, app_data: Dict[str, Any], key: str) -> Dict[str, Any]:
+        """Run the full analysis for one app's data."""
         app_name = app_data.get('app_name', '')
         title = app_data.get('title', '')
         description = app_data.get('description', '')
         rating = app_data.get('rating', 0.0)
         ratings_count = app_data.get('ratings_count', 0)
         keywords = app_data.get('keywords', [])
+        scan = self._scan_description(description)
 
         analysis = {
             'app_name': app_name,
             'title_analysis': self._analyze_title(title),
-            'description_analysis': self._analyze_description(description),
-            'keyword_strategy': self._extract_keyword_strategy(title, description, keywords),
+            'description_analysis': self._analyze_description(description, scan),
+            'keyword_strategy': self._extract_keyword_strategy(title, description, keywords, scan),
             'rating_metrics': {
                 'rating': rating,
                 'ratings_count': ratings_count,
@@ -58,30 +336,36 @@ class CompetitorAnalyzer:
                 ratings_count,
                 len(description)
             ),
-            'key_differentiators': self._identify_differentiators(description)
+            'key_differentiators': self._identify_differentiators(description, scan),
+            'content_hash': key
         }
 
-        self.competitors.append(analysis)
         return analysis
 
+    def _register(self, app_key: str, analysis: Dict[str, Any]) -> None:
+        """Record the latest analysis for an app, evicting the oldest app when full."""
+        self._registry.pop(app_key, None)
+        self._registry[app_key] = analysis
+        if len(self._registry) > self.max_competitors:
+            self._registry.popitem(last=False)
+
     def compare_competitors(
         self,
-        competitors_data: List[Dict[str, Any]]
+        competitors_data: List[Dict[str, Any]],
+        max_workers: int = 1
     ) -> Dict[str, Any]:
         """
         Compare multiple competitors and identify patterns.
 
         Args:
             competitors_data: List of competitor data dictionaries
+            max_workers: Worker processes for per-app analysis (1 = this process, None = CPU count)
 
         Returns:
             Comparative analysis with insights
         """
-        # Analyze each competitor
-        analyses = []
-        for comp_data in competitors_data:
-            analysis = self.analyze_competitor(comp_data)
-            analyses.append(analysis)
+        # Analyze each competitor (sharded across processes when max_workers > 1)
+        analyses = self.analyze_competitors(competitors_data, max_workers=max_workers)
 
         # Extract common keywords across competitors
         all_keywords = []
@@ -154,10 +438,10 @@ class CompetitorAnalyzer:
 
         # Identify description length gap
         avg_competitor_desc_length = sum(
-            len(comp['description_analysis']['text'])
+            comp['description_analysis']['length']
             for comp in competitor_comparison['ranked_competitors']
         ) / len(competitor_comparison['ranked_competitors'])
-        your_desc_length = len(your_analysis['description_analysis']['text'])
+        your_desc_length = your_analysis['description_analysis']['length']
         desc_length_gap = avg_competitor_desc_length - your_desc_length
 
         return {
@@ -186,7 +470,7 @@ class CompetitorAnalyzer:
 
     def _analyze_title(self, title: str) -> Dict[str, Any]:
         """Analyze title structure and keyword usage."""
-        parts = re.split(r'[-:|]', title)
+        parts = _TITLE_SPLIT_RE.split(title)
 
         return {
             'title': title,
@@ -198,32 +482,77 @@ class CompetitorAnalyzer:
             'strategy': 'brand_plus_keywords' if len(parts) > 1 else 'brand_only'
         }
 
-    def _analyze_description(self, description: str) -> Dict[str, Any]:
-        """Analyze description structure and content."""
-        lines = description.split('\n')
-        word_count = len(description.split())
-
-        # Check for structural elements
-        has_bullet_points = '•' in description or '*' in description
-        has_sections = any(line.isupper() for line in lines if len(line) > 0)
-        has_call_to_action = any(
-            cta in description.lower()
-            for cta in ['download', 'try', 'get', 'start', 'join']
-        )
+    def _scan_description(self, description: str) -> Dict[str, Any]:
+        """
+        Tokenize a description once for every description-based analysis.
+
+        Lines, bullets, section headers, CTA and differentiator hits and
+        stemmed word frequencies all come from this single pass.
+        """
+        lower = description.lower()
 
-        # Extract features mentioned
-        features = self._extract_features(description)
+        # One pass over lines: section headers and bullet/numbered features
+        has_sections = False
+        features = []
+        for line in description.split('\n'):
+            if not has_sections and line and line.isupper():
+                has_sections = True
+            if len(features) < 10:
+                stripped = line.strip()
+                if stripped and (stripped[0] in _BULLET_CHARS or stripped[0].isdigit()):
+                    cleaned = _BULLET_PREFIX_RE.sub('', stripped)
+                    if cleaned:
+                        features.append(cleaned)
+
+        # Differentiator hits mapped from text positions to sentences
+        sentences = description.split('.')
+        differentiators = []
+        if len(lower) == len(description):
+            sentence_ends = list(accumulate(len(sentence) + 1 for sentence in sentences))
+            last_index = -1
+            for position, _ in _DIFFERENTIATOR_AUTOMATON.iter_matches(lower):
+                index = bisect_right(sentence_ends, position)
+                if index != last_index:
+                    differentiators.append(sentences[index].strip())
+                    last_index = index
+                    if len(differentiators) == 5:
+                        break
+        else:
+            # Lowercasing changed offsets (rare Unicode); fall back to per-sentence checks
+            for sentence in sentences:
+                if _DIFFERENTIATOR_AUTOMATON.contains_any(sentence.lower()):
+                    differentiators.append(sentence.strip())
+                    if len(differentiators) == 5:
+                        break
+
+        return {
+            'word_count': len(description.split()),
+            'has_bullet_points': '•' in description or '*' in description,
+            'has_sections': has_sections,
+            'has_call_to_action': _CTA_AUTOMATON.contains_any(lower),
+            'features': features,
+            'differentiators': differentiators,
+            'word_freq': Counter(self.keyword_tokenizer.tokens(lower))
+        }
+
+    def _analyze_description(
+        self,
+        description: str,
+        scan: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Analyze description structure and content."""
+        scan = scan or self._scan_description(description)
+        word_count = scan['word_count']
 
         return {
-            'text': description,
             'length': len(description),
             'word_count': word_count,
             'structure': {
-                'has_bullet_points': has_bullet_points,
-                'has_sections': has_sections,
-                'has_call_to_action': has_call_to_action
+                'has_bullet_points': scan['has_bullet_points'],
+                'has_sections': scan['has_sections'],
+                'has_call_to_action': scan['has_call_to_action']
             },
-            'features_mentioned': features,
+            'features_mentioned': scan['features'],
             'readability': 'good' if 50 <= word_count <= 300 else 'needs_improvement'
         }
 
@@ -231,15 +560,15 @@ class CompetitorAnalyzer:
         self,
         title: str,
         description: str,
-        explicit_keywords: List[str]
+        explicit_keywords: List[str],
+        scan: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Extract keyword strategy from metadata."""
-        # Extract keywords from title
-        title_keywords = [word.lower() for word in title.split() if len(word) > 3]
+        # Extract keywords from title (singular forms so plurals match across apps)
+        title_keywords = self.keyword_tokenizer.tokens(title)
 
-        # Extract frequently used words from description
-        desc_words = re.findall(r'\b\w{4,}\b', description.lower())
-        word_freq = Counter(desc_words)
+        # Frequently used description words (from the shared scan)
+        word_freq = (scan or self._scan_description(description))['word_freq']
         frequent_words = [word for word, count in word_freq.most_common(15) if count > 2]
 
         # Combine with explicit keywords
@@ -293,22 +622,13 @@ class CompetitorAnalyzer:
 
         return round(total_score, 1)
 
-    def _identify_differentiators(self, description: str) -> List[str]:
+    def _identify_differentiators(
+        self,
+        description: str,
+        scan: Optional[Dict[str, Any]] = None
+    ) -> List[str]:
         """Identify key differentiators from description."""
-        differentiator_keywords = [
-            'unique', 'only', 'first', 'best', 'leading', 'exclusive',
-            'revolutionary', 'innovative', 'patent', 'award'
-        ]
-
-        differentiators = []
-        sentences = description.split('.')
-
-        for sentence in sentences:
-            sentence_lower = sentence.lower()
-            if any(keyword in sentence_lower for keyword in differentiator_keywords):
-                differentiators.append(sentence.strip())
-
-        return differentiators[:5]
+        return (scan or self._scan_description(description))['differentiators']
 
     def _find_common_keywords(self, all_keywords: List[str]) -> List[str]:
         """Find keywords used by multiple competitors."""
@@ -319,32 +639,11 @@ class CompetitorAnalyzer:
 
     def _identify_keyword_gaps(self, analyses: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Identify keywords used by some competitors but not others."""
-        all_keywords_by_app = {}
-
+        index = KeywordUsageIndex()
         for analysis in analyses:
-            app_name = analysis['app_name']
-            keywords = analysis['keyword_strategy']['primary_keywords']
-            all_keywords_by_app[app_name] = set(keywords)
-
-        # Find keywords used by some but not all
-        all_keywords_set = set()
-        for keywords in all_keywords_by_app.values():
-            all_keywords_set.update(keywords)
-
-        gaps = []
-        for keyword in all_keywords_set:
-            using_apps = [
-                app for app, keywords in all_keywords_by_app.items()
-                if keyword in keywords
-            ]
-            if 1 < len(using_apps) < len(analyses):
-                gaps.append({
-                    'keyword': keyword,
-                    'used_by': using_apps,
-                    'usage_percentage': round(len(using_apps) / len(analyses) * 100, 1)
-                })
+            index.add_app(analysis['app_name'] or analysis['content_hash'], analysis['keyword_strategy']['primary_keywords'])
 
-        return sorted(gaps, key=lambda x: x['usage_percentage'], reverse=True)[:15]
+        return index.gaps(total_apps=len(analyses), top_n=15)
 
     def _analyze_rating_distribution(self, analyses: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Analyze rating distribution across competitors."""
@@ -431,21 +730,8 @@ class CompetitorAnalyzer:
         return opportunities[:5]
 
     def _extract_features(self, description: str) -> List[str]:
-        """Extract feature mentions from description."""
-        # Look for bullet points or numbered lists
-        lines = description.split('\n')
-        features = []
-
-        for line in lines:
-            line = line.strip()
-            # Check if line starts with bullet or number
-            if line and (line[0] in ['•', '*', '-', '✓'] or line[0].isdigit()):
-                # Clean the line
-                cleaned = re.sub(r'^[•*\-✓\d.)\s]+', '', line)
-                if cleaned:
-                    features.append(cleaned)
-
-        return features[:10]
+        """Extract feature mentions (bullet or numbered lines) from description."""
+        return self._scan_description(description)['features']
 
     def _assess_keyword_focus(
         self,
@@ -557,10 +843,344 @@ class CompetitorAnalyzer:
             return "Weak Position: Bottom quartile, major ASO overhaul needed"
 
 
+class CompetitorAggregate:
+    """
+    Incrementally maintained competitor comparison.
+
+    Apps can be added, updated or removed; keyword counts, the keyword usage
+    index, rating sums, sorted ratings (for min/max) and the strength ranking
+    are updated for the changed app only. snapshot() returns the same shape
+    as CompetitorAnalyzer.compare_competitors.
+    """
+
+    def __init__(self, analyzer: CompetitorAnalyzer):
+        """
+        Initialize an empty aggregate.
+
+        Args:
+            analyzer: Analyzer used for per-app analysis (its cache is reused)
+        """
+        self.analyzer = analyzer
+        self._apps: Dict[str, Dict[str, Any]] = {}
+        self._sequence: Dict[str, int] = {}
+        self._next_sequence = 0
+        self._keyword_counts: Counter = Counter()
+        self._keyword_first_seen: Dict[str, int] = {}
+        self._usage_index = KeywordUsageIndex()
+        self._ratings: List[float] = []
+        self._rating_sum = 0.0
+        self._ratings_count_sum = 0
+        self._description_length_sum = 0
+        self._ranking: List[Tuple[float, int, str]] = []
+
+    def __len__(self) -> int:
+        """Number of apps in the aggregate."""
+        return len(self._apps)
+
+    def __contains__(self, app_name: str) -> bool:
+        """True when an app is in the aggregate."""
+        return app_name in self._apps
+
+    def add(self, app_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Add an app, or replace it if an app with the same name is present.
+
+        Args:
+            app_data: Dictionary with app_name, title, description, rating, ratings_count, keywords
+
+        Returns:
+            The app's analysis
+        """
+        analysis = self.analyzer.analyze_competitor(app_data)
+        app_key = analysis['app_name'] or analysis['content_hash']
+        previous = self._apps.get(app_key)
+        if previous is analysis:
+            return analysis
+        if previous is not None:
+            self._retract(app_key, previous)
+        else:
+            self._sequence[app_key] = self._next_sequence
+            self._next_sequence += 1
+
+        self._apps[app_key] = analysis
+        self._apply(app_key, analysis)
+        return analysis
+
+    # Updating is adding with the same app name
+    update = add
+
+    def update_many(self, competitors_data: Iterable[Dict[str, Any]]) -> int:
+        """Add or update several apps; returns how many were processed."""
+        count = 0
+        for app_data in competitors_data:
+            self.add(app_data)
+            count += 1
+        return count
+
+    def remove(self, app_name: str) -> bool:
+        """
+        Remove an app.
+
+        Returns:
+            False when the app was not in the aggregate
+        """
+        analysis = self._apps.pop(app_name, None)
+        if analysis is None:
+            return False
+        self._retract(app_name, analysis)
+        del self._sequence[app_name]
+        return True
+
+    def _apply(self, app_key: str, analysis: Dict[str, Any]) -> None:
+        """Add one app's contribution to the running aggregates."""
+        keywords = analysis['keyword_strategy']['primary_keywords']
+        for keyword in keywords:
+            if not self._keyword_counts[keyword]:
+                self._keyword_first_seen[keyword] = self._next_sequence
+                self._next_sequence += 1
+        self._keyword_counts.update(keywords)
+        self._usage_index.add_app(app_key, keywords)
+
+        rating = analysis['rating_metrics']['rating']
+        insort(self._ratings, rating)
+        self._rating_sum += rating
+        self._ratings_count_sum += analysis['rating_metrics']['ratings_count']
+        self._description_length_sum += analysis['description_analysis']['length']
+        insort(self._ranking, (-analysis['competitive_strength'], self._sequence[app_key], app_key))
+
+    def _retract(self, app_key: str, analysis: Dict[str, Any]) -> None:
+        """Remove one app's contribution from the running aggregates."""
+        keywords = analysis['keyword_strategy']['primary_keywords']
+        self._keyword_counts.subtract(keywords)
+        for keyword in set(keywords):
+            if self._keyword_counts[keyword] <= 0:
+                del self._keyword_counts[keyword]
+                del self._keyword_first_seen[keyword]
+        self._usage_index.remove_app(app_key)
+
+        rating = analysis['rating_metrics']['rating']
+        del self._ratings[bisect_left(self._ratings, rating)]
+        self._rating_sum -= rating
+        self._ratings_count_sum -= analysis['rating_metrics']['ratings_count']
+        self._description_length_sum -= analysis['description_analysis']['length']
+        entry = (-analysis['competitive_strength'], self._sequence[app_key], app_key)
+        del self._ranking[bisect_left(self._ranking, entry)]
+
+    def common_keywords(self, top_n: int = 20) -> List[str]:
+        """Keywords used at least twice, most used first (ties by first appearance)."""
+        common = [
+            (keyword, count) for keyword, count in self._keyword_counts.items() if count >= 2
+        ]
+        first_seen = self._keyword_first_seen
+        common.sort(key=lambda item: (-item[1], first_seen[item[0]]))
+        return [keyword for keyword, _ in common[:top_n]]
+
+    def rating_analysis(self) -> Dict[str, Any]:
+        """Rating distribution from running sums and the sorted rating list."""
+        count = len(self._apps)
+        return {
+            'average_rating': round(self._rating_sum / count, 2),
+            'highest_rating': self._ratings[-1],
+            'lowest_rating': self._ratings[0],
+            'average_ratings_count': int(self._ratings_count_sum / count),
+            'total_ratings_in_category': self._ratings_count_sum
+        }
+
+    def ranked_competitors(self) -> List[Dict[str, Any]]:
+        """Analyses ordered by competitive strength (ties in insertion order)."""
+        return [self._apps[app_key] for _, _, app_key in self._ranking]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Current comparison, in the same shape as compare_competitors.
+
+        Returns:
+            Comparative analysis with insights
+        """
+        analyzer = self.analyzer
+        count = len(self._apps)
+        if not count:
+            return {
+                'category': analyzer.category,
+                'platform': analyzer.platform,
+                'competitors_analyzed': 0,
+                'ranked_competitors': [],
+                'common_keywords': [],
+                'keyword_gaps': [],
+                'rating_analysis': {},
+                'best_practices': [],
+                'opportunities': []
+            }
+
+        ranked = self.ranked_competitors()
+        common_keywords = self.common_keywords()
+        keyword_gaps = self._usage_index.gaps(total_apps=count, top_n=15)
+
+        return {
+            'category': analyzer.category,
+            'platform': analyzer.platform,
+            'competitors_analyzed': count,
+            'ranked_competitors': ranked,
+            'common_keywords': common_keywords,
+            'keyword_gaps': keyword_gaps,
+            'rating_analysis': self.rating_analysis(),
+            'best_practices': analyzer._identify_best_practices(ranked),
+            'opportunities': self._opportunities(keyword_gaps)
+        }
+
+    def _opportunities(self, keyword_gaps: List[Dict[str, Any]]) -> List[str]:
+        """Same rules as CompetitorAnalyzer._identify_opportunities, from running sums."""
+        opportunities = []
+        count = len(self._apps)
+
+        underutilized_keywords = [
+            gap['keyword'] for gap in keyword_gaps if gap['usage_percentage'] < 50
+        ]
+        if underutilized_keywords:
+            opportunities.append(
+                f"Target underutilized keywords: {', '.join(underutilized_keywords[:5])}"
+            )
+
+        avg_rating = self._rating_sum / count
+        if avg_rating < 4.5:
+            opportunities.append(
+                f"Category average rating is {avg_rating:.1f} - opportunity to differentiate with higher ratings"
+            )
+
+        if self._description_length_sum / count < 1500:
+            opportunities.append(
+                "Competitors have relatively short descriptions - opportunity to provide more comprehensive information"
+            )
+
+        return opportunities[:5]
+
+
+class CompetitorSimilarityIndex:
+    """Finds competitors that position themselves alike, from extract_metadata records."""
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, shingle_size: int = 2):
+        """
+        Initialize an empty similarity index.
+
+        Args:
+            num_perm: MinHash signature length
+            bands: LSH bands (more bands = more recall at lower similarity)
+            shingle_size: Words per shingle
+        """
+        self._index = MinHashLSHIndex(num_perm=num_perm, bands=bands, shingle_size=shingle_size)
+        self._listings: Dict[Any, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        """Number of indexed listings."""
+        return len(self._index)
+
+    @staticmethod
+    def _listing_id(record: Dict[str, Any]) -> Any:
+        """Stable id for a listing: app_id when present, otherwise app name."""
+        app_id = record.get('app_id')
+        return app_id if app_id is not None else record.get('app_name')
+
+    @staticmethod
+    def _listing_text(record: Dict[str, Any]) -> str:
+        """Title and description text used for similarity."""
+        return f"{record.get('app_name') or record.get('title') or ''}\n{record.get('description') or ''}"
+
+    def add_listing(self, record: Dict[str, Any]) -> bool:
+        """
+        Index one listing (re-adding the same app replaces it).
+
+        Args:
+            record: extract_metadata-style dict with app_id, app_name, description
+
+        Returns:
+            False when the listing has no text and was not indexed
+        """
+        listing_id = self._listing_id(record)
+        added = self._index.add(listing_id, self._listing_text(record))
+        if added:
+            self._listings[listing_id] = {
+                'app_id': record.get('app_id'),
+                'app_name': record.get('app_name'),
+                'developer': record.get('developer'),
+                'rating': record.get('rating'),
+                'ratings_count': record.get('ratings_count')
+            }
+        else:
+            self._listings.pop(listing_id, None)
+        return added
+
+    def add_listings(self, records: Iterable[Dict[str, Any]]) -> int:
+        """Index many listings; returns how many were indexed."""
+        return sum(1 for record in records if self.add_listing(record))
+
+    def most_similar(
+        self,
+        your_app: Dict[str, Any],
+        top_n: int = 10,
+        min_similarity: float = 0.0
+    ) -> List[Dict[str, Any]]:
+        """
+        Competitors whose title and description are closest to your app's.
+
+        Args:
+            your_app: extract_metadata-style record (indexed or not)
+            top_n: Maximum competitors returned
+            min_similarity: Minimum estimated Jaccard similarity
+
+        Returns:
+            Listing summaries with 'similarity', most similar first
+        """
+        matches = self._index.query(
+            self._listing_text(your_app),
+            top_n=top_n,
+            min_similarity=min_similarity,
+            exclude=self._listing_id(your_app)
+        )
+        return [
+            {**self._listings[listing_id], 'similarity': round(similarity, 3)}
+            for listing_id, similarity in matches
+        ]
+
+    def clusters(self, min_similarity: float = 0.5, min_size: int = 2) -> List[Dict[str, Any]]:
+        """
+        Groups of listings with near-identical positioning.
+
+        Args:
+            min_similarity: Estimated Jaccard similarity needed to link two listings
+            min_size: Smallest cluster returned
+
+        Returns:
+            Clusters (largest first) with size and member listing summaries
+        """
+        return [
+            {
+                'size': len(members),
+                'apps': [self._listings[listing_id] for listing_id in members]
+            }
+            for members in self._index.clusters(min_similarity=min_similarity, min_size=min_size)
+        ]
+
+
+@lru_cache(maxsize=None)
+def _worker_analyzer(category: str, platform: str, language: str) -> CompetitorAnalyzer:
+    """Per-process analyzer reused across chunks with the same settings."""
+    return CompetitorAnalyzer(category, platform, language)
+
+
+def _analyze_competitor_chunk(
+    settings: Tuple[str, str, str],
+    items: List[Tuple[str, Dict[str, Any]]]
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """Analyze (content_hash, app_data) pairs in a worker process."""
+    analyzer = _worker_analyzer(*settings)
+    return [(key, analyzer._analyze_uncached(app_data, key)) for key, app_data in items]
+
+
 def analyze_competitor_set(
     category: str,
     competitors_data: List[Dict[str, Any]],
-    platform: str = 'apple'
+    platform: str = 'apple',
+    max_workers: int = 1
 ) -> Dict[str, Any]:
     """
     Convenience function to analyze a set of competitors.
@@ -569,9 +1189,10 @@ def analyze_competitor_set(
         category: App category
         competitors_data: List of competitor data
         platform: 'apple' or 'google'
+        max_workers: Worker processes for per-app analysis (1 = this process, None = CPU count)
 
     Returns:
         Complete competitive analysis
     """
     analyzer = CompetitorAnalyzer(category, platform)
-    return analyzer.compare_competitors(competitors_data)
+    return analyzer.compare_competitors(competitors_data, max_workers=max_workers)
@@ -4,9 +4,10 @@ Analyzes keyword search volume, competition, and relevance for app discovery.
 """
 
 from typing import Dict, List, Any, Optional, Tuple
-import re
 from collections import Counter
 
+from text_normalizer import get_tokenizer, iter_ngrams
+
 
 class KeywordAnalyzer:
     """Analyzes keywords for ASO effectiveness."""
@@ -206,33 +207,14 @@ class KeywordAnalyzer:
         Returns:
             List of (keyword, frequency) tuples
         """
-        # Clean and normalize text
-        text = text.lower()
-        text = re.sub(r'[^\w\s]', ' ', text)
-
-        # Extract words
-        words = text.split()
-
-        # Filter by length
-        words = [w for w in words if len(w) >= min_word_length]
-
-        # Remove common stop words
-        stop_words = {
-            'the', 'and', 'for', 'with', 'this', 'that', 'from', 'have',
-            'but', 'not', 'you', 'all', 'can', 'are', 'was', 'were', 'been'
-        }
-        words = [w for w in words if w not in stop_words]
+        # Lowercase word tokens, filtered by length and the shared stop words
+        words = get_tokenizer('en', min_word_length).tokens(text)
 
         # Count frequency
         word_counts = Counter(words)
 
         # Extract 2-word phrases
-        phrases = []
-        for i in range(len(words) - 1):
-            phrase = f"{words[i]} {words[i+1]}"
-            phrases.append(phrase)
-
-        phrase_counts = Counter(phrases)
+        phrase_counts = Counter(iter_ngrams(words, 2))
 
         # Combine and sort
         all_keywords = list(word_counts.items()) + list(phrase_counts.items())
@@ -3,7 +3,9 @@ Localization helper module for App Store Optimization.
 Manages multi-language ASO optimization strategies.
 """
 
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Mapping, Optional, Tuple
+
+from metadata_validator import LIMIT_TABLE
 
 
 class LocalizationHelper:
@@ -129,7 +131,7 @@ class LocalizationHelper:
             source_metadata: Original metadata (title, description, etc.)
             source_language: Source language code (e.g., 'en')
             target_language: Target language code (e.g., 'es')
-            platform: 'apple' or 'google'
+            platform: 'apple' or 'google' (any other value uses Google's limits)
 
         Returns:
             Localized metadata with character limit validation
@@ -138,11 +140,8 @@ class LocalizationHelper:
         target_lang_code = target_language.split('-')[0]
         char_multiplier = self.CHAR_MULTIPLIERS.get(target_lang_code, 1.0)
 
-        # Platform-specific limits
-        if platform == 'apple':
-            limits = {'title': 30, 'subtitle': 30, 'description': 4000, 'keywords': 100}
-        else:
-            limits = {'title': 50, 'short_description': 80, 'description': 4000}
+        # Platform-specific limits (shared table with MetadataOptimizer)
+        limits = self._platform_limits(platform)
 
         localized_metadata = {}
         warnings = []
@@ -239,6 +238,11 @@ class LocalizationHelper:
             ]
         }
 
+    @staticmethod
+    def _platform_limits(platform: str) -> Mapping[str, int]:
+        """Shared character limits; any platform other than 'apple' falls back to Google's."""
+        return LIMIT_TABLE.limits_for('apple' if platform == 'apple' else 'google')
+
     def validate_translations(
         self,
         translated_metadata: Dict[str, str],
@@ -251,16 +255,13 @@ class LocalizationHelper:
         Args:
             translated_metadata: Translated text fields
             target_language: Target language code
-            platform: 'apple' or 'google'
+            platform: 'apple' or 'google' (any other value uses Google's limits)
 
         Returns:
             Validation report
         """
-        # Platform limits
-        if platform == 'apple':
-            limits = {'title': 30, 'subtitle': 30, 'description': 4000, 'keywords': 100}
-        else:
-            limits = {'title': 50, 'short_description': 80, 'description': 4000}
+        # Platform limits (shared table with MetadataOptimizer)
+        limits = self._platform_limits(platform)
 
         validation_results = {
             'is_valid': True,
@@ -3,9 +3,268 @@ Metadata optimization module for App Store Optimization.
 Optimizes titles, descriptions, and keyword fields with platform-specific character limit validation.
 """
 
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Callable, Iterable, Iterator, Union
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+import heapq
+import json
+import os
 import re
 
+from text_normalizer import get_stem_table
+
+
+# Platform character limits (single source for every module that validates metadata)
+APPLE_TITLE_LIMIT = 30
+APPLE_SUBTITLE_LIMIT = 30
+APPLE_PROMO_TEXT_LIMIT = 170
+APPLE_DESCRIPTION_LIMIT = 4000
+APPLE_KEYWORDS_LIMIT = 100
+APPLE_WHATS_NEW_LIMIT = 4000
+
+GOOGLE_TITLE_LIMIT = 50
+GOOGLE_SHORT_DESC_LIMIT = 80
+GOOGLE_FULL_DESC_LIMIT = 4000
+
+# Separators between brand name and keyword phrase in titles, in preference order;
+# the shorter ': ' is used when a keyword set does not fit with ' - '
+TITLE_SEPARATORS = [' - ', ': ']
+
+# Each later keyword slot in a title is worth this fraction of the previous one,
+# so the search favors front-loading the strongest keywords
+TITLE_POSITION_DECAY = 0.85
+
+# Default value of the brand name on the keyword value scale; the brand moves
+# after the keywords only when the keyword phrase is worth more than this
+TITLE_BRAND_VALUE = 2.0
+
+
+def _template_builder(template: Any) -> Callable[[], Any]:
+    """
+    Compile a JSON-like template into a factory returning fresh deep copies.
+
+    The template's containers are copied at compile time and never handed out,
+    so a cached factory cannot be corrupted by callers modifying its results.
+    Tuples become lists; scalar leaves are shared.
+    """
+    if isinstance(template, dict):
+        base = {}
+        nested = []
+        for key, value in template.items():
+            if isinstance(value, (dict, list, tuple)):
+                base[key] = None
+                nested.append((key, _template_builder(value)))
+            else:
+                base[key] = value
+        if not nested:
+            return base.copy
+        nested_builders = tuple(nested)
+
+        def build_dict() -> Dict[str, Any]:
+            result = base.copy()
+            for key, build in nested_builders:
+                result[key] = build()
+            return result
+        return build_dict
+
+    if isinstance(template, (list, tuple)):
+        if not any(isinstance(value, (dict, list, tuple)) for value in template):
+            return partial(list, tuple(template))
+        item_builders = tuple(_template_builder(value) for value in template)
+
+        def build_list() -> List[Any]:
+            return [build() for build in item_builders]
+        return build_list
+
+    def build_scalar() -> Any:
+        return template
+    return build_scalar
+
+
+@lru_cache(maxsize=4096)
+def _section_counts(text: str, keywords_lower: Tuple[str, ...]) -> Tuple[int, Tuple[int, ...]]:
+    """Word count and per-keyword occurrences for one section (boilerplate sections hit the cache)."""
+    text_lower = text.lower()
+    return len(text.split()), tuple(text_lower.count(keyword) for keyword in keywords_lower)
+
+
+class _DescriptionBudget:
+    """Running length, word and keyword counts for a description built section by section."""
+
+    def __init__(self, max_length: int, target_keywords: List[str]):
+        """
+        Initialize an empty description budget.
+
+        Args:
+            max_length: Character limit for the finished description
+            target_keywords: Keywords whose occurrences are tracked
+        """
+        self.max_length = max_length
+        self.keywords = list(target_keywords)
+        self.keywords_lower = tuple(keyword.lower() for keyword in target_keywords)
+        self.parts: List[str] = []
+        self.length = 0
+        self.total_words = 0
+        self.counts = [0] * len(self.keywords)
+
+    @property
+    def remaining(self) -> int:
+        """Characters left before the limit."""
+        return self.max_length - self.length
+
+    def append(self, text: str) -> None:
+        """
+        Append a section and update counts from that section only.
+
+        Sections end in whitespace, so word and (single-line) keyword counts
+        never span a section boundary and the sums match a full-text scan.
+        """
+        self.parts.append(text)
+        self.length += len(text)
+        words, counts = _section_counts(text, self.keywords_lower)
+        self.total_words += words
+        self.counts = [total + count for total, count in zip(self.counts, counts)]
+
+    @property
+    def occurrences(self) -> Dict[str, int]:
+        """Keyword -> occurrences so far."""
+        return dict(zip(self.keywords, self.counts))
+
+    def text(self) -> str:
+        """The description built so far."""
+        return "".join(self.parts)
+
+
+class _KeywordSetSearch:
+    """
+    Branch-and-bound search for the top-N keyword sets fitting a character budget.
+
+    Candidates must be sorted by value (descending). Keywords are joined with a
+    single space, so each keyword costs its length plus one against a capacity of
+    budget + 1. Keywords sharing a word with an already chosen keyword are skipped.
+    """
+
+    def __init__(
+        self,
+        candidates: List[Tuple[float, str, frozenset]],
+        top_n: int,
+        max_keywords: int,
+        stats: Dict[str, int]
+    ):
+        """
+        Initialize the search over a sorted candidate list.
+
+        Args:
+            candidates: (value, keyword, words) tuples sorted by value, descending
+            top_n: Number of keyword sets kept
+            max_keywords: Maximum keywords in one set
+            stats: Counters updated in place ('nodes_visited', 'branches_pruned')
+        """
+        self.candidates = candidates
+        self.top_n = top_n
+        self.max_keywords = max_keywords
+        self.stats = stats
+        self.decay = TITLE_POSITION_DECAY
+        self.costs = [len(keyword) + 1 for _, keyword, _ in candidates]
+        self.best: List[Tuple[float, int, Tuple[str, ...]]] = []  # min-heap
+        self._sequence = 0
+        self._suffix_min_cost: List[int] = []
+        self._chosen: List[str] = []
+
+    def run(self, budget: int) -> List[Tuple[float, Tuple[str, ...]]]:
+        """
+        Search one budget.
+
+        Args:
+            budget: Characters available for the space-joined keyword phrase
+
+        Returns:
+            (score, keywords) pairs, best first
+        """
+        # Cheapest keyword from each index onward caps how many more keywords can fit
+        costs = self.costs
+        self._suffix_min_cost = [*costs, budget + 2]
+        for i in range(len(costs) - 1, -1, -1):
+            self._suffix_min_cost[i] = min(costs[i], self._suffix_min_cost[i + 1])
+        self.best = []
+        self._sequence = 0
+        self._chosen = []
+
+        self._visit(0, budget + 1, 0, 0.0, frozenset())
+
+        return [(score, keywords) for score, _, keywords in sorted(self.best, reverse=True)]
+
+    def _threshold(self) -> float:
+        """Score a new set must beat to enter the top-N."""
+        return self.best[0][0] if len(self.best) >= self.top_n else float('-inf')
+
+    def _optimistic(self, start: int, remaining: int, depth: int) -> float:
+        """Largest values that individually fit, at the best positions still open."""
+        costs = self.costs
+        total = 0.0
+        weight = self.decay ** depth
+        slots = min(self.max_keywords - depth, remaining // self._suffix_min_cost[start])
+        for i in range(start, len(costs)):
+            if slots == 0:
+                break
+            if costs[i] <= remaining:
+                total += self.candidates[i][0] * weight
+                weight *= self.decay
+                slots -= 1
+        return total
+
+    def _record(self, score: float) -> None:
+        """Offer the currently chosen keyword set to the top-N heap."""
+        self._sequence += 1
+        entry = (score, -self._sequence, tuple(self._chosen))
+        if len(self.best) < self.top_n:
+            heapq.heappush(self.best, entry)
+        elif score > self.best[0][0]:
+            heapq.heapreplace(self.best, entry)
+
+    def _visit(
+        self,
+        start: int,
+        remaining: int,
+        depth: int,
+        score: float,
+        chosen_words: frozenset
+    ) -> None:
+        """Record the chosen set, then expand it with each candidate from start onward."""
+        self.stats['nodes_visited'] += 1
+        chosen = self._chosen
+        if chosen:
+            self._record(score)
+        if depth == self.max_keywords:
+            return
+
+        decay = self.decay
+        costs = self.costs
+        count = len(costs)
+        weight = decay ** depth
+        # Geometric sum of the weights of all slots still open
+        slot_weights = weight * (1 - decay ** (self.max_keywords - depth)) / (1 - decay)
+
+        for i in range(start, count):
+            value, keyword, words = self.candidates[i]
+            # Values only decrease from here, so no later candidate can do better
+            if score + value * slot_weights <= self._threshold():
+                self.stats['branches_pruned'] += count - i
+                break
+            if costs[i] > remaining or words & chosen_words:
+                continue
+
+            new_score = score + value * weight
+            new_remaining = remaining - costs[i]
+            if new_score + self._optimistic(i + 1, new_remaining, depth + 1) <= self._threshold():
+                self.stats['branches_pruned'] += 1
+                continue
+
+            chosen.append(keyword)
+            self._visit(i + 1, new_remaining, depth + 1, new_score, chosen_words | words)
+            chosen.pop()
+
 
 class MetadataOptimizer:
     """Optimizes app store metadata for maximum discoverability and conversion."""
@@ -13,20 +272,26 @@ class MetadataOptimizer:
     # Platform-specific character limits
     CHAR_LIMITS = {
         'apple': {
-            'title': 30,
-            'subtitle': 30,
-            'promotional_text': 170,
-            'description': 4000,
-            'keywords': 100,
-            'whats_new': 4000
+            'title': APPLE_TITLE_LIMIT,
+            'subtitle': APPLE_SUBTITLE_LIMIT,
+            'promotional_text': APPLE_PROMO_TEXT_LIMIT,
+            'description': APPLE_DESCRIPTION_LIMIT,
+            'keywords': APPLE_KEYWORDS_LIMIT,
+            'whats_new': APPLE_WHATS_NEW_LIMIT
         },
         'google': {
-            'title': 50,
-            'short_description': 80,
-            'full_description': 4000
+            'title': GOOGLE_TITLE_LIMIT,
+            'short_description': GOOGLE_SHORT_DESC_LIMIT,
+            'full_description': GOOGLE_FULL_DESC_LIMIT
         }
     }
 
+    # Alternate field names accepted for the same store field
+    FIELD_ALIASES = {
+        'apple': {},
+        'google': {'description': 'full_description'}
+    }
+
     def __init__(self, platform: str = 'apple'):
         """
         Initialize metadata optimizer.
@@ -124,13 +389,146 @@ class MetadataOptimizer:
                 'cons': ['No brand recognition', 'Generic appearance']
             })
 
+        # Searched combinations beyond the fixed patterns above
+        top_combinations = []
+        if target_keywords:
+            top_combinations = self.search_title_combinations(
+                app_name,
+                target_keywords,
+                include_brand=include_brand
+            )['options']
+
         return {
             'platform': self.platform,
             'max_length': max_length,
             'options': title_options,
+            'top_combinations': top_combinations,
             'recommendation': self._recommend_title_option(title_options)
         }
 
+    def search_title_combinations(
+        self,
+        app_name: str,
+        candidate_keywords: List[str],
+        field: str = 'title',
+        top_n: int = 5,
+        include_brand: bool = True,
+        max_keywords: int = 4,
+        scoring_fn: Optional[Callable[[str, int], float]] = None,
+        brand_value: float = TITLE_BRAND_VALUE
+    ) -> Dict[str, Any]:
+        """
+        Search keyword combinations and brand placement for a title or subtitle.
+
+        Keyword sets are explored with branch-and-bound: candidates are visited in
+        descending value order and a branch is abandoned as soon as its optimistic
+        bound (strongest remaining keywords that still fit) cannot beat the current
+        top-N. Within a set, keywords are ordered strongest-first, which is the
+        best permutation under the position-decayed score.
+
+        Brand placement is scored with the same position decay: whichever of brand
+        and keyword phrase leads counts in full, the one after the separator is
+        discounted by one slot. Each keyword set is returned in its best-scoring
+        placement, with the first separator in TITLE_SEPARATORS that fits it.
+
+        Args:
+            app_name: Your app's brand name
+            candidate_keywords: Candidate keywords in priority order
+            field: 'title' or 'subtitle' (Apple only)
+            top_n: Number of options to return
+            include_brand: Whether to place the brand name in the text
+            max_keywords: Maximum keywords combined in one option
+            scoring_fn: Optional callable (keyword, priority_rank) -> value >= 0.
+                Defaults to a value that decreases with the keyword's rank.
+            brand_value: Value of the brand name on the keyword value scale
+
+        Returns:
+            Top-N options ranked by score with search statistics
+        """
+        if field not in self.limits or field not in ('title', 'subtitle'):
+            raise ValueError(f"Field '{field}' is not searchable on {self.platform}")
+
+        max_length = self.limits[field]
+        score_keyword = scoring_fn or self._default_keyword_value
+
+        # Normalize candidates, drop duplicates and keywords already covered by the brand
+        brand_words = set(app_name.lower().split()) if include_brand else set()
+        candidates = []
+        seen = set()
+        for rank, raw_keyword in enumerate(candidate_keywords):
+            keyword = ' '.join(raw_keyword.split())
+            keyword_lower = keyword.lower()
+            words = frozenset(keyword_lower.split())
+            if not keyword or keyword_lower in seen or words <= brand_words:
+                continue
+            seen.add(keyword_lower)
+            value = float(score_keyword(keyword, rank))
+            if value > 0:
+                candidates.append((value, keyword, words))
+
+        # Visit strongest candidates first so chosen sets are already in score order
+        candidates.sort(key=lambda c: -c[0])
+
+        # Each layout leaves a fixed character budget for the keyword phrase
+        layouts = []
+        if include_brand and app_name:
+            for sep in TITLE_SEPARATORS:
+                budget = max_length - len(app_name) - len(sep)
+                layouts.append(('brand_first', sep, budget))
+                layouts.append(('brand_last', sep, budget))
+        else:
+            layouts.append(('keywords_only', '', max_length))
+
+        stats = {'nodes_visited': 0, 'branches_pruned': 0}
+        sets_by_budget = {}
+        for _, _, budget in layouts:
+            if budget > 0 and budget not in sets_by_budget:
+                sets_by_budget[budget] = self._search_keyword_sets(
+                    candidates, budget, top_n, max_keywords, stats
+                )
+
+        # Keep each keyword set once, in its best-scoring layout
+        best_layouts: Dict[Tuple[str, ...], Tuple[float, str, str, float]] = {}
+        for placement, sep, budget in layouts:
+            for keyword_score, keywords in sets_by_budget.get(budget, []):
+                score = self._layout_score(placement, keyword_score, brand_value)
+                placed = best_layouts.get(keywords)
+                # Strict comparison keeps the earlier (preferred) layout on ties
+                if placed is None or score > placed[0]:
+                    best_layouts[keywords] = (score, placement, sep, keyword_score)
+
+        options = []
+        for keywords, (score, placement, sep, keyword_score) in best_layouts.items():
+            phrase = ' '.join(keywords)
+            if placement == 'brand_first':
+                text = f"{app_name}{sep}{phrase}"
+            elif placement == 'brand_last':
+                text = f"{phrase}{sep}{app_name}"
+            else:
+                text = phrase
+            options.append({
+                'title': text,
+                'length': len(text),
+                'remaining_chars': max_length - len(text),
+                'keywords_included': list(keywords),
+                'strategy': placement,
+                'separator': sep.strip(),
+                'keyword_score': round(keyword_score, 4),
+                'score': round(score, 4)
+            })
+
+        # Stable sort keeps search order among equal scores
+        options.sort(key=lambda o: (-o['score'], o['remaining_chars']))
+
+        return {
+            'platform': self.platform,
+            'field': field,
+            'max_length': max_length,
+            'candidates_considered': len(candidates),
+            'options': options[:top_n],
+            'search_stats': stats
+        }
+
     def optimize_description(
         self,
         app_info: Dict[str, Any],
@@ -159,7 +557,8 @@ class MetadataOptimizer:
         self,
         target_keywords: List[str],
         app_title: str = "",
-        app_description: str = ""
+        app_description: str = "",
+        language: str = 'en'
     ) -> Dict[str, Any]:
         """
         Optimize Apple's 100-character keyword field.
@@ -174,6 +573,7 @@ class MetadataOptimizer:
             target_keywords: List of target keywords
             app_title: Current app title (to avoid duplication)
             app_description: Current description (to check coverage)
+            language: Keyword language, selects the plural folding table
 
         Returns:
             Optimized keyword field (comma-separated, no spaces)
@@ -183,26 +583,31 @@ class MetadataOptimizer:
 
         max_length = self.limits['keywords']
 
-        # Extract words already in title (these don't need to be in keyword field)
-        title_words = set(app_title.lower().split()) if app_title else set()
+        stem = get_stem_table(language).stem
+
+        # Extract words already in title (these don't need to be in keyword field);
+        # compare singular forms since Apple indexes plurals automatically
+        title_words = {stem(word) for word in app_title.lower().split()} if app_title else set()
 
         # Process keywords
         processed_keywords = []
+        processed_set = set()
         for keyword in target_keywords:
             keyword_lower = keyword.lower().strip()
 
             # Skip if already in title
-            if keyword_lower in title_words:
+            if stem(keyword_lower) in title_words:
                 continue
 
             # Remove duplicates and process
             words = keyword_lower.split()
             for word in words:
-                if word not in processed_keywords and word not in title_words:
+                if word not in processed_set and stem(word) not in title_words:
+                    processed_set.add(word)
                     processed_keywords.append(word)
 
         # Remove plurals if singular exists
-        deduplicated = self._remove_plural_duplicates(processed_keywords)
+        deduplicated = self._remove_plural_duplicates(processed_keywords, language)
 
         # Build keyword field within 100 character limit
         keyword_field = self._build_keyword_field(deduplicated, max_length)
@@ -296,12 +701,17 @@ class MetadataOptimizer:
             Density analysis
         """
         text_lower = text.lower()
-        total_words = len(text_lower.split())
+        occurrences = {keyword: text_lower.count(keyword.lower()) for keyword in target_keywords}
+        return self._build_density_report(len(text_lower.split()), occurrences)
 
+    def _build_density_report(
+        self,
+        total_words: int,
+        occurrences: Dict[str, int]
+    ) -> Dict[str, Any]:
+        """Build the density analysis from word and keyword occurrence counts."""
         keyword_densities = {}
-        for keyword in target_keywords:
-            keyword_lower = keyword.lower()
-            count = text_lower.count(keyword_lower)
+        for keyword, count in occurrences.items():
             density = (count / total_words * 100) if total_words > 0 else 0
 
             keyword_densities[keyword] = {
@@ -339,6 +749,30 @@ class MetadataOptimizer:
 
         return None
 
+    def _default_keyword_value(self, _keyword: str, rank: int) -> float:
+        """Default title search value: earlier (higher-priority) keywords are worth more."""
+        return 1.0 / (1.0 + 0.25 * rank)
+
+    @staticmethod
+    def _layout_score(placement: str, keyword_score: float, brand_value: float) -> float:
+        """Title score of a layout: the leading element counts in full, the trailing one decayed."""
+        if placement == 'brand_first':
+            return brand_value + keyword_score * TITLE_POSITION_DECAY
+        if placement == 'brand_last':
+            return keyword_score + brand_value * TITLE_POSITION_DECAY
+        return keyword_score
+
+    def _search_keyword_sets(
+        self,
+        candidates: List[Tuple[float, str, frozenset]],
+        budget: int,
+        top_n: int,
+        max_keywords: int,
+        stats: Dict[str, int]
+    ) -> List[Tuple[float, Tuple[str, ...]]]:
+        """Top-N keyword sets fitting a character budget (see _KeywordSetSearch)."""
+        return _KeywordSetSearch(candidates, top_n, max_keywords, stats).run(budget)
+
     def _optimize_short_description(
         self,
         app_info: Dict[str, Any],
@@ -391,81 +825,155 @@ class MetadataOptimizer:
         app_info: Dict[str, Any],
         target_keywords: List[str]
     ) -> Dict[str, Any]:
-        """Optimize full app description (4000 chars for both platforms)."""
+        """
+        Optimize full app description (4000 chars for both platforms).
+
+        Sections are planned against the character budget before anything is
+        joined: the hook and CTA are always kept, then features, benefits and
+        social proof are added in priority order. Feature bullets are dropped
+        from the end when only part of the list fits, and sections that do not
+        fit are dropped whole rather than truncating mid-sentence. Keyword and
+        word counts are accumulated per section, so no second scan is needed.
+        """
         max_length = self.limits.get('description', self.limits.get('full_description', 4000))
 
         # Structure: Hook → Features → Benefits → Social Proof → CTA
-        sections = []
-
-        # Hook (with primary keyword)
         primary_keyword = target_keywords[0] if target_keywords else ''
         unique_value = app_info.get('unique_value', '')
         hook = f"{unique_value} {primary_keyword.title()} that helps you achieve more.\n\n"
-        sections.append(hook)
-
-        # Features (with keywords naturally integrated)
-        features = app_info.get('key_features', [])
-        if features:
-            sections.append("KEY FEATURES:\n")
-            for i, feature in enumerate(features[:5], 1):
-                # Integrate keywords naturally
-                feature_text = f"• {feature}"
-                if i <= len(target_keywords):
-                    keyword = target_keywords[i-1]
-                    if keyword.lower() not in feature.lower():
-                        feature_text = f"• {feature} with {keyword}"
-                sections.append(f"{feature_text}\n")
-            sections.append("\n")
-
-        # Benefits
-        target_audience = app_info.get('target_audience', 'users')
-        sections.append(f"PERFECT FOR:\n{target_audience}\n\n")
 
-        # Social proof placeholder
-        sections.append("WHY USERS LOVE US:\n")
-        sections.append("Join thousands of satisfied users who have transformed their workflow.\n\n")
+        feature_lines = self._description_feature_lines(
+            app_info.get('key_features', []),
+            target_keywords
+        )
 
-        # CTA
-        sections.append("Download now and start experiencing the difference!")
+        target_audience = app_info.get('target_audience', 'users')
+        benefits = f"PERFECT FOR:\n{target_audience}\n\n"
+        social_proof = (
+            "WHY USERS LOVE US:\n"
+            "Join thousands of satisfied users who have transformed their workflow.\n\n"
+        )
+        cta = "Download now and start experiencing the difference!"
+
+        hook, kept_features, optional, dropped_sections, shortened_sections = (
+            self._allocate_description_sections(
+                max_length,
+                hook,
+                feature_lines,
+                (('benefits', benefits), ('social_proof', social_proof)),
+                cta
+            )
+        )
 
-        # Combine and validate length
-        full_description = "".join(sections)
-        if len(full_description) > max_length:
-            full_description = full_description[:max_length-3] + "..."
+        # Document order: Hook → Features → Benefits → Social Proof → CTA
+        sections = [hook]
+        if kept_features:
+            sections.append("KEY FEATURES:\n" + "".join(kept_features) + "\n")
+        sections.extend(optional.values())
+        sections.append(cta)
+        budget = self._assemble_description(max_length, target_keywords, sections)
 
-        # Calculate keyword density
-        density = self.calculate_keyword_density(full_description, target_keywords)
+        full_description = budget.text()
+        density = self._build_density_report(budget.total_words, budget.occurrences)
 
         return {
             'full_description': full_description,
-            'length': len(full_description),
-            'remaining_chars': max_length - len(full_description),
+            'length': budget.length,
+            'remaining_chars': budget.remaining,
             'keyword_analysis': density,
             'structure': {
                 'has_hook': True,
-                'has_features': len(features) > 0,
-                'has_benefits': True,
+                'has_features': bool(kept_features),
+                'has_benefits': 'benefits' in optional,
                 'has_cta': True
-            }
+            },
+            'dropped_sections': dropped_sections,
+            'shortened_sections': shortened_sections
         }
 
-    def _remove_plural_duplicates(self, keywords: List[str]) -> List[str]:
-        """Remove plural forms if singular exists."""
-        deduplicated = []
-        singular_set = set()
+    @staticmethod
+    def _description_feature_lines(features: List[str], target_keywords: List[str]) -> List[str]:
+        """Feature bullets (up to 5), each naming its matching keyword when missing."""
+        feature_lines = []
+        for i, feature in enumerate(features[:5], 1):
+            feature_text = f"• {feature}"
+            if i <= len(target_keywords):
+                keyword = target_keywords[i-1]
+                if keyword.lower() not in feature.lower():
+                    feature_text = f"• {feature} with {keyword}"
+            feature_lines.append(f"{feature_text}\n")
+        return feature_lines
+
+    @staticmethod
+    def _allocate_description_sections(
+        max_length: int,
+        hook: str,
+        feature_lines: List[str],
+        optional_sections: Tuple[Tuple[str, str], ...],
+        cta: str
+    ) -> Tuple[str, List[str], Dict[str, str], List[str], List[str]]:
+        """
+        Plan which description sections fit the character budget.
 
-        for keyword in keywords:
-            if keyword.endswith('s') and len(keyword) > 1:
-                singular = keyword[:-1]
-                if singular not in singular_set:
-                    deduplicated.append(singular)
-                    singular_set.add(singular)
+        The hook and CTA are always kept (an oversized hook is cut back at a
+        word boundary), then feature bullets and the optional sections are
+        added in priority order.
+
+        Returns:
+            (hook, kept feature lines, kept optional sections by name,
+            dropped section names, shortened section names)
+        """
+        # Required sections first; an oversized hook is cut back at a word boundary
+        hook_budget = max_length - len(cta)
+        if len(hook) > hook_budget:
+            hook = hook[:max(hook_budget - 5, 0)].rsplit(' ', 1)[0] + "...\n\n"
+        remaining = max_length - len(hook) - len(cta)
+
+        # Feature bullets are dropped from the end when only part of the list fits
+        kept_features = []
+        if feature_lines:
+            used = len("KEY FEATURES:\n") + len("\n")
+            for line in feature_lines:
+                if used + len(line) > remaining:
+                    break
+                kept_features.append(line)
+                used += len(line)
+            if kept_features:
+                remaining -= used
+
+        dropped_sections = []
+        shortened_sections = []
+        if feature_lines and not kept_features:
+            dropped_sections.append('features')
+        elif len(kept_features) < len(feature_lines):
+            shortened_sections.append('features')
+
+        # Remaining sections are kept or dropped whole, in priority order
+        optional = {}
+        for name, text in optional_sections:
+            if len(text) <= remaining:
+                optional[name] = text
+                remaining -= len(text)
             else:
-                if keyword not in singular_set:
-                    deduplicated.append(keyword)
-                    singular_set.add(keyword)
+                dropped_sections.append(name)
 
-        return deduplicated
+        return hook, kept_features, optional, dropped_sections, shortened_sections
+
+    @staticmethod
+    def _assemble_description(
+        max_length: int,
+        target_keywords: List[str],
+        sections: List[str]
+    ) -> _DescriptionBudget:
+        """Join planned sections in order, counting words and keywords per section."""
+        budget = _DescriptionBudget(max_length, target_keywords)
+        for text in sections:
+            budget.append(text)
+        return budget
+
+    def _remove_plural_duplicates(self, keywords: List[str], language: str = 'en') -> List[str]:
+        """Remove plural forms if singular exists (via the shared stem table)."""
+        return get_stem_table(language).dedupe(keywords)
 
     def _build_keyword_field(self, keywords: List[str], max_length: int) -> str:
         """Build comma-separated keyword field within character limit."""
@@ -592,6 +1100,16 @@ class MetadataOptimizer:
         'default': 'portrait',
     }
 
+    SCREENSHOT_KEY_PRINCIPLES = (
+        'First 3 screenshots drive 70% of install decisions — make them count',
+        'Each screenshot should convey ONE clear benefit in under 2 seconds',
+        'Text overlays must be readable at thumbnail size (search results)',
+        'Show real app UI — avoid stock photos or abstract graphics',
+        'Use consistent visual branding across all screenshots',
+        'Dark mode screenshots can be a differentiator if competitors use light only',
+        'Seasonal screenshot updates (2-4x/year) keep the listing fresh'
+    )
+
     def generate_screenshot_strategy(
         self,
         app_info: Dict[str, Any],
@@ -614,9 +1132,13 @@ class MetadataOptimizer:
         plat = platform or self.platform
         specs = self.SCREENSHOT_SPECS.get(plat, self.SCREENSHOT_SPECS['apple'])
         category = app_info.get('category', 'default').lower().replace(' ', '_').replace('&', '_')
-        orientation = self.CATEGORY_ORIENTATION.get(category, self.CATEGORY_ORIENTATION['default'])
-        features = app_info.get('key_features', [])
-        has_ipad = app_info.get('has_ipad', False)
+        has_ipad = bool(app_info.get('has_ipad', False))
+
+        # App-independent sections (orientation, counts, text overlay, video
+        # template, device coverage, visual A/B tests) come from a template
+        # compiled once per platform / has_ipad / category; every call gets
+        # fresh containers the caller may modify.
+        shared = self._screenshot_template(plat, has_ipad, category)()
 
         # Build the first-3-screenshot framework (7-second attention window)
         first_three = self._build_first_three_framework(app_info)
@@ -624,20 +1146,37 @@ class MetadataOptimizer:
         # Build full screenshot sequence
         full_sequence = self._build_full_screenshot_sequence(app_info, specs)
 
-        # Text overlay guidelines
-        text_overlay = self._generate_text_overlay_guidelines(plat)
-
-        # App preview video strategy
-        video_strategy = self._generate_video_strategy(plat, app_info)
-
-        # Device coverage
-        device_coverage = self._generate_device_coverage(plat, has_ipad)
-
-        # A/B testing recommendations for visuals
-        ab_visual = self._generate_visual_ab_tests()
+        # App preview video strategy: only the opening hook names the app
+        video_strategy = shared['video_strategy']
+        video_strategy['structure'].insert(0, self._video_hook(app_info))
 
         return {
             'platform': plat,
+            'orientation': shared['orientation'],
+            'orientation_rationale': shared['orientation_rationale'],
+            'screenshot_count': shared['screenshot_count'],
+            'first_three_framework': first_three,
+            'full_sequence': full_sequence,
+            'text_overlay_guidelines': shared['text_overlay_guidelines'],
+            'video_strategy': video_strategy,
+            'device_coverage': shared['device_coverage'],
+            'ab_testing_visuals': shared['ab_testing_visuals'],
+            'key_principles': shared['key_principles']
+        }
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _screenshot_template(
+        cls,
+        platform: str,
+        has_ipad: bool,
+        category: str
+    ) -> Callable[[], Dict[str, Any]]:
+        """Factory for the app-independent screenshot strategy sections."""
+        specs = cls.SCREENSHOT_SPECS.get(platform, cls.SCREENSHOT_SPECS['apple'])
+        orientation = cls.CATEGORY_ORIENTATION.get(category, cls.CATEGORY_ORIENTATION['default'])
+
+        return _template_builder({
             'orientation': orientation,
             'orientation_rationale': (
                 f"'{category}' category apps perform best with {orientation} screenshots. "
@@ -652,22 +1191,12 @@ class MetadataOptimizer:
                     f"First 3 are critical — they appear in search results and determine 70% of conversion decisions."
                 )
             },
-            'first_three_framework': first_three,
-            'full_sequence': full_sequence,
-            'text_overlay_guidelines': text_overlay,
-            'video_strategy': video_strategy,
-            'device_coverage': device_coverage,
-            'ab_testing_visuals': ab_visual,
-            'key_principles': [
-                'First 3 screenshots drive 70% of install decisions — make them count',
-                'Each screenshot should convey ONE clear benefit in under 2 seconds',
-                'Text overlays must be readable at thumbnail size (search results)',
-                'Show real app UI — avoid stock photos or abstract graphics',
-                'Use consistent visual branding across all screenshots',
-                'Dark mode screenshots can be a differentiator if competitors use light only',
-                'Seasonal screenshot updates (2-4x/year) keep the listing fresh'
-            ]
-        }
+            'text_overlay_guidelines': cls._generate_text_overlay_guidelines(platform),
+            'video_strategy': cls._video_strategy_template(platform),
+            'device_coverage': cls._generate_device_coverage(platform, has_ipad),
+            'ab_testing_visuals': cls._generate_visual_ab_tests(),
+            'key_principles': cls.SCREENSHOT_KEY_PRINCIPLES
+        })
 
     def _build_first_three_framework(self, app_info: Dict[str, Any]) -> List[Dict[str, str]]:
         """
@@ -759,7 +1288,8 @@ class MetadataOptimizer:
 
         return sequence
 
-    def _generate_text_overlay_guidelines(self, platform: str) -> Dict[str, Any]:
+    @staticmethod
+    def _generate_text_overlay_guidelines(platform: str) -> Dict[str, Any]:
         """Generate platform-specific text overlay best practices."""
         return {
             'general_rules': [
@@ -793,14 +1323,15 @@ class MetadataOptimizer:
             ]
         }
 
-    def _generate_video_strategy(
-        self,
-        platform: str,
-        app_info: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Generate app preview / promo video strategy."""
+    @staticmethod
+    def _video_hook(app_info: Dict[str, Any]) -> Dict[str, str]:
+        """Opening 0-3s segment of the app preview video (names the app)."""
         name = app_info.get('name', 'App')
+        return {'time': '0-3s', 'content': f'Hook — show {name}\'s most impressive screen or result', 'importance': 'CRITICAL — 50% of viewers drop off after 3 seconds'}
 
+    @staticmethod
+    def _video_strategy_template(platform: str) -> Dict[str, Any]:
+        """Generate app preview / promo video strategy (structure without the opening hook)."""
         base = {
             'recommended': True,
             'rationale': (
@@ -809,7 +1340,6 @@ class MetadataOptimizer:
                 'attention-grabbing tool.'
             ),
             'structure': [
-                {'time': '0-3s', 'content': f'Hook — show {name}\'s most impressive screen or result', 'importance': 'CRITICAL — 50% of viewers drop off after 3 seconds'},
                 {'time': '3-10s', 'content': 'Core workflow — demonstrate the primary use case end-to-end', 'importance': 'High — proves the app delivers on its promise'},
                 {'time': '10-20s', 'content': 'Secondary features — show 2-3 additional capabilities', 'importance': 'Medium — adds depth for engaged viewers'},
                 {'time': '20-30s', 'content': 'Call to action — end with value summary or social proof', 'importance': 'Medium — reinforces the install decision'},
@@ -841,14 +1371,15 @@ class MetadataOptimizer:
 
         return base
 
-    def _generate_device_coverage(self, platform: str, has_ipad: bool) -> Dict[str, Any]:
+    @classmethod
+    def _generate_device_coverage(cls, platform: str, has_ipad: bool) -> Dict[str, Any]:
         """Generate device coverage recommendations."""
-        specs = self.SCREENSHOT_SPECS.get(platform, {})
+        specs = cls.SCREENSHOT_SPECS.get(platform, {})
 
         required_devices = []
         optional_devices = []
 
-        for key, spec in specs.items():
+        for spec in specs.values():
             if isinstance(spec, dict) and 'label' in spec:
                 entry = {'device': spec['label'], 'size': spec['size']}
                 if spec.get('required'):
@@ -869,7 +1400,8 @@ class MetadataOptimizer:
             )
         }
 
-    def _generate_visual_ab_tests(self) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _generate_visual_ab_tests() -> List[Dict[str, Any]]:
         """Generate A/B testing recommendations for visual assets."""
         return [
             {
@@ -927,7 +1459,7 @@ def optimize_app_metadata(
     Returns:
         Complete metadata optimization package
     """
-    optimizer = MetadataOptimizer(platform)
+    optimizer = _get_optimizer(platform)
 
     return {
         'platform': platform,
@@ -944,3 +1476,144 @@ def optimize_app_metadata(
             target_keywords
         ) if platform == 'apple' else None
     }
+
+
+@lru_cache(maxsize=None)
+def _get_optimizer(platform: str) -> MetadataOptimizer:
+    """Return the process-wide optimizer for a platform (optimizers hold no per-app state)."""
+    return MetadataOptimizer(platform)
+
+
+def _warm_worker() -> None:
+    """Build compiled state once per worker process instead of once per app."""
+    for platform in MetadataOptimizer.CHAR_LIMITS:
+        _get_optimizer(platform)
+    get_stem_table('en')
+
+
+def _spec_app_id(spec: Any) -> Any:
+    """app_id of a spec, falling back to its app name (None for malformed specs)."""
+    if not isinstance(spec, dict):
+        return None
+    app_info = spec.get('app_info')
+    return spec.get('app_id', app_info.get('name') if isinstance(app_info, dict) else None)
+
+
+def _optimize_app_chunk(app_specs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Optimize a chunk of app specs; failures are reported per app, not raised."""
+    results = []
+    for spec in app_specs:
+        try:
+            result = optimize_app_metadata(
+                spec.get('platform', 'apple'),
+                spec['app_info'],
+                spec.get('target_keywords', [])
+            )
+        except Exception as e:
+            # Any failure belongs to this app only; the rest of the chunk (and the run) goes on
+            platform = spec.get('platform') if isinstance(spec, dict) else None
+            result = {'platform': platform, 'error': f"{type(e).__name__}: {e}"}
+        result['app_id'] = _spec_app_id(spec)
+        results.append(result)
+    return results
+
+
+def _iter_app_specs(app_specs: Union[str, Iterable[Dict[str, Any]]]) -> Iterator[Dict[str, Any]]:
+    """Yield app specs from an iterable or lazily from a JSONL file path."""
+    if isinstance(app_specs, str):
+        with open(app_specs, encoding='utf-8') as handle:
+            for line in handle:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        yield from app_specs
+
+
+def _iter_chunks(items: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    """Group an iterable into lists of at most chunk_size items."""
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def iter_optimized_metadata(
+    app_specs: Union[str, Iterable[Dict[str, Any]]],
+    max_workers: Optional[int] = None,
+    chunk_size: int = 16
+) -> Iterator[Dict[str, Any]]:
+    """
+    Optimize metadata for a stream of apps, yielding results in input order.
+
+    Apps are sent to a process pool in chunks with a bounded number of chunks in
+    flight, so memory stays flat regardless of how many apps are streamed.
+
+    Args:
+        app_specs: Iterable of dicts with 'platform', 'app_info', 'target_keywords'
+            and optional 'app_id', or a path to a JSONL file of such dicts
+        max_workers: Worker processes (None = CPU count, 1 = run in this process)
+        chunk_size: Apps per task sent to a worker
+
+    Returns:
+        Iterator of optimize_app_metadata results, each tagged with 'app_id'
+    """
+    chunks = _iter_chunks(_iter_app_specs(app_specs), max(1, chunk_size))
+
+    if max_workers == 1:
+        for chunk in chunks:
+            yield from _optimize_app_chunk(chunk)
+        return
+
+    worker_count = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=worker_count, initializer=_warm_worker) as pool:
+        max_in_flight = 2 * worker_count
+        pending = deque()
+
+        for chunk in chunks:
+            pending.append(pool.submit(_optimize_app_chunk, chunk))
+            if len(pending) >= max_in_flight:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+
+
+def optimize_app_metadata_bulk(
+    app_specs: Union[str, Iterable[Dict[str, Any]]],
+    output_path: str,
+    max_workers: Optional[int] = None,
+    chunk_size: int = 16
+) -> Dict[str, Any]:
+    """
+    Optimize metadata for many apps and write results incrementally to JSONL.
+
+    Args:
+        app_specs: Iterable of app spec dicts or a path to a JSONL file of them
+        output_path: JSONL file to write (one result per line, input order)
+        max_workers: Worker processes (None = CPU count, 1 = run in this process)
+        chunk_size: Apps per task sent to a worker
+
+    Returns:
+        Run summary with processed and failed app counts
+    """
+    processed = 0
+    failed = []
+
+    with open(output_path, 'w', encoding='utf-8') as output:
+        for result in iter_optimized_metadata(app_specs, max_workers, chunk_size):
+            output.write(json.dumps(result, ensure_ascii=False))
+            output.write('\n')
+            processed += 1
+            if 'error' in result:
+                failed.append(result['app_id'])
+
+    return {
+        'apps_processed': processed,
+        'apps_failed': len(failed),
+        'failed_app_ids': failed[:50],
+        'output_path': output_path
+    }
@@ -0,0 +1,261 @@
+"""
+Batch metadata validation module for App Store Optimization.
+Validates whole locale x platform x field matrices (including Custom Product Page
+variants) against one shared, compiled character limit table.
+"""
+
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Iterable, Mapping, Tuple
+
+from metadata_optimizer import MetadataOptimizer
+
+
+class CompiledLimitTable:
+    """Flattened (platform, field) -> (canonical_field, limit) lookup built once."""
+
+    def __init__(
+        self,
+        char_limits: Optional[Dict[str, Dict[str, int]]] = None,
+        field_aliases: Optional[Dict[str, Dict[str, str]]] = None
+    ):
+        """
+        Compile platform limits and field aliases into a single lookup.
+
+        Args:
+            char_limits: platform -> field -> limit (default: MetadataOptimizer.CHAR_LIMITS)
+            field_aliases: platform -> alias -> canonical field (default: MetadataOptimizer.FIELD_ALIASES)
+        """
+        char_limits = char_limits or MetadataOptimizer.CHAR_LIMITS
+        field_aliases = field_aliases or MetadataOptimizer.FIELD_ALIASES
+
+        self._table: Dict[Tuple[str, str], Tuple[str, int]] = {}
+        self._platform_limits: Dict[str, Mapping[str, int]] = {}
+
+        for platform, limits in char_limits.items():
+            platform_limits = dict(limits)
+            for field, limit in limits.items():
+                self._table[(platform, field)] = (field, limit)
+            for alias, canonical in field_aliases.get(platform, {}).items():
+                self._table[(platform, alias)] = (canonical, limits[canonical])
+                platform_limits[alias] = limits[canonical]
+            self._platform_limits[platform] = MappingProxyType(platform_limits)
+
+    @property
+    def platforms(self) -> List[str]:
+        """Platforms covered by the table."""
+        return list(self._platform_limits)
+
+    def lookup(self, platform: str, field: str) -> Optional[Tuple[str, int]]:
+        """Return (canonical_field, limit) or None if the field is unknown for the platform."""
+        return self._table.get((platform, field))
+
+    def limits_for(self, platform: str) -> Mapping[str, int]:
+        """Return a read-only field -> limit view for a platform, including accepted aliases."""
+        if platform not in self._platform_limits:
+            raise ValueError(f"Invalid platform: {platform}. Must be 'apple' or 'google'")
+        return self._platform_limits[platform]
+
+
+# Shared table used by every validator in the skill
+LIMIT_TABLE = CompiledLimitTable()
+
+
+class BatchValidationResult:
+    """Compact, violations-only result of a batch validation run."""
+
+    def __init__(
+        self,
+        entries: List[Dict[str, Any]],
+        violations: List[Dict[str, Any]],
+        unknown_fields: List[Dict[str, Any]],
+        fields_checked: int,
+        limit_table: CompiledLimitTable = LIMIT_TABLE
+    ):
+        """Hold references to validated entries so full reports can be built later."""
+        self._entries = entries
+        self._limit_table = limit_table
+        self.violations = violations
+        self.unknown_fields = unknown_fields
+        self.fields_checked = fields_checked
+
+    @property
+    def is_valid(self) -> bool:
+        """True when no field exceeds its limit."""
+        return not self.violations
+
+    def summary(self) -> Dict[str, Any]:
+        """Counts of checked entries, fields and violations by platform and field."""
+        by_field: Dict[str, int] = {}
+        for violation in self.violations:
+            key = f"{violation['platform']}.{violation['field']}"
+            by_field[key] = by_field.get(key, 0) + 1
+
+        return {
+            'is_valid': self.is_valid,
+            'entries_checked': len(self._entries),
+            'fields_checked': self.fields_checked,
+            'violation_count': len(self.violations),
+            'violations_by_field': by_field,
+            'unknown_field_count': len(self.unknown_fields)
+        }
+
+    def full_report(self, entry_index: int) -> Dict[str, Any]:
+        """
+        Build the verbose per-field report for one entry on request.
+
+        Args:
+            entry_index: Index of the entry in the validated batch (see violation['entry'])
+
+        Returns:
+            Same shape as MetadataOptimizer.validate_character_limits, plus entry identity
+        """
+        entry = self._entries[entry_index]
+        platform = entry.get('platform', 'apple')
+
+        # Report under canonical field names so aliases are not flagged as unknown
+        fields = {}
+        for field, value in entry.get('fields', {}).items():
+            resolved = self._limit_table.lookup(platform, field)
+            fields[resolved[0] if resolved else field] = value
+
+        report = MetadataOptimizer(platform).validate_character_limits(fields)
+        report['locale'] = entry.get('locale')
+        report['variant'] = entry.get('variant')
+        return report
+
+    def iter_full_reports(self, only_invalid: bool = True) -> Iterable[Dict[str, Any]]:
+        """
+        Lazily yield verbose reports.
+
+        Args:
+            only_invalid: Only yield reports for entries that have violations
+        """
+        indexes: Iterable[int]
+        if only_invalid:
+            indexes = sorted({v['entry'] for v in self.violations})
+        else:
+            indexes = range(len(self._entries))
+        for index in indexes:
+            yield self.full_report(index)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly compact result."""
+        return {
+            **self.summary(),
+            'violations': self.violations,
+            'unknown_fields': self.unknown_fields
+        }
+
+
+class BatchMetadataValidator:
+    """Validates many metadata sets per call in a single pass."""
+
+    def __init__(self, limit_table: Optional[CompiledLimitTable] = None):
+        """
+        Initialize batch validator.
+
+        Args:
+            limit_table: Compiled limit table (default: shared LIMIT_TABLE)
+        """
+        self.limit_table = limit_table or LIMIT_TABLE
+
+    def validate(self, entries: Iterable[Dict[str, Any]]) -> BatchValidationResult:
+        """
+        Validate a batch of metadata entries.
+
+        Args:
+            entries: Iterable of dicts with 'platform', 'fields' (field -> text),
+                and optional 'locale' and 'variant' (e.g. a CPP name)
+
+        Returns:
+            BatchValidationResult holding only violations; verbose reports are lazy
+        """
+        lookup = self.limit_table.lookup
+        kept_entries = []
+        violations = []
+        unknown_fields = []
+        fields_checked = 0
+
+        for index, entry in enumerate(entries):
+            kept_entries.append(entry)
+            platform = entry.get('platform', 'apple')
+            for field, value in entry.get('fields', {}).items():
+                resolved = lookup(platform, field)
+                if resolved is None:
+                    unknown_fields.append({'entry': index, 'platform': platform, 'field': field})
+                    continue
+
+                fields_checked += 1
+                length = len(value)
+                limit = resolved[1]
+                if length > limit:
+                    violations.append({
+                        'entry': index,
+                        'locale': entry.get('locale'),
+                        'platform': platform,
+                        'variant': entry.get('variant'),
+                        'field': resolved[0],
+                        'length': length,
+                        'limit': limit,
+                        'over_by': length - limit
+                    })
+
+        return BatchValidationResult(
+            kept_entries,
+            violations,
+            unknown_fields,
+            fields_checked,
+            self.limit_table
+        )
+
+    def validate_matrix(
+        self,
+        matrix: Dict[str, Dict[str, Dict[str, Any]]]
+    ) -> BatchValidationResult:
+        """
+        Validate a nested locale -> platform -> fields matrix.
+
+        A platform value may map field -> text directly, or variant -> (field -> text)
+        when several variants (e.g. Custom Product Pages) share a locale and platform.
+
+        Args:
+            matrix: locale -> platform -> fields or variant -> fields
+
+        Returns:
+            BatchValidationResult holding only violations
+        """
+        return self.validate(self._flatten_matrix(matrix))
+
+    def _flatten_matrix(
+        self,
+        matrix: Dict[str, Dict[str, Dict[str, Any]]]
+    ) -> Iterable[Dict[str, Any]]:
+        """Yield flat entries from a nested matrix without copying field text."""
+        for locale, platforms in matrix.items():
+            for platform, fields in platforms.items():
+                if any(isinstance(value, dict) for value in fields.values()):
+                    for variant, variant_fields in fields.items():
+                        yield {
+                            'locale': locale,
+                            'platform': platform,
+                            'variant': variant,
+                            'fields': variant_fields
+                        }
+                else:
+                    yield {'locale': locale, 'platform': platform, 'fields': fields}
+
+
+def validate_metadata_batch(
+    entries: Iterable[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Convenience function to validate a batch of metadata entries.
+
+    Args:
+        entries: Iterable of dicts with 'platform', 'fields', optional 'locale'/'variant'
+
+    Returns:
+        Compact violations-only validation result
+    """
+    validator = BatchMetadataValidator()
+    return validator.validate(entries).to_dict()
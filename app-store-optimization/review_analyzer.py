@@ -3,9 +3,40 @@ Review analysis module for App Store Optimization.
 Analyzes user reviews for sentiment, issues, and feature requests.
 """
 
-from typing import Dict, List, Any, Optional, Tuple
-from collections import Counter
-import re
+from typing import Dict, List, Any, Optional, Tuple, Iterable, Iterator, Union, IO, FrozenSet, Callable, Deque
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+import csv
+import gzip
+import hashlib
+import heapq
+import io
+import json
+import math
+import os
+
+from sentiment_scorer import LexiconSentimentScorer
+from similarity import SimHashIndex, shingle_hashes, simhash
+from text_normalizer import get_stem_table, get_tokenizer, iter_ngrams, KeywordAutomaton
+
+
+# Analyses an accumulator can run (all of them make up analyze_reviews)
+REVIEW_SECTIONS = ('sentiment', 'themes', 'issues', 'feature_requests')
+
+# Issue categories in report order
+ISSUE_CATEGORIES = ('crashes', 'bugs', 'performance', 'compatibility')
+
+# Per-review cache capacity when a cache_path enables the cache without a cache_size
+DEFAULT_REVIEW_CACHE_SIZE = 100000
+
+
+@lru_cache(maxsize=16)
+def _detector_automaton(*keyword_lists: Tuple[str, ...]) -> KeywordAutomaton:
+    """One automaton over every detector keyword list, shared by analyzers with the same lists."""
+    return KeywordAutomaton(keyword for keywords in keyword_lists for keyword in keywords)
 
 
 class ReviewAnalyzer:
@@ -34,16 +65,72 @@ class ReviewAnalyzer:
         'please add', 'missing', 'lacks', 'feature request'
     ]
 
-    def __init__(self, app_name: str):
+    # Filler words ignored when clustering feature requests (only words over 4 chars are used)
+    REQUEST_STOP_WORDS = frozenset({
+        'would', 'could', 'should', 'there', 'their', 'please', 'really', 'which',
+        'about', 'where', 'being', 'other', 'these', 'those', 'missing', 'feature',
+        'request', 'lacks', 'great', 'thanks', 'still', 'maybe', 'think', 'support',
+        'option', 'options', 'ability', 'added', 'adding'
+    })
+
+    # Words ignored when extracting themes
+    THEME_STOP_WORDS = frozenset({
+        'the', 'and', 'for', 'with', 'this', 'that', 'from', 'have',
+        'app', 'apps', 'very', 'really', 'just', 'but', 'not', 'you'
+    })
+
+    def __init__(
+        self,
+        app_name: str,
+        language: str = 'en',
+        cache_size: Optional[int] = None,
+        cache_path: Optional[str] = None,
+        sentiment_scorer: Optional[LexiconSentimentScorer] = None
+    ):
         """
         Initialize review analyzer.
 
         Args:
             app_name: Name of the app
+            language: Review language, selects the plural folding table for themes
+            cache_size: Maximum reviews kept in the per-review analysis cache; 0 disables
+                it. Default: off, or DEFAULT_REVIEW_CACHE_SIZE when cache_path is given.
+                Only worth enabling when the same reviews are analyzed repeatedly.
+            cache_path: Optional JSON file the cache is loaded from (if present) and saved to
+            sentiment_scorer: Optional weighted-lexicon scorer (token matching with
+                negation) used instead of the keyword-count sentiment score
         """
         self.app_name = app_name
+        self.language = language
+        self.sentiment_scorer = sentiment_scorer
+        self.stem_table = get_stem_table(language)
+        # Shared tokenizers: theme words (4+ chars) and request key words (5+ chars), folded
+        self._theme_tokenizer = get_tokenizer(language, 4, self.THEME_STOP_WORDS, stem=True)
+        self._request_tokenizer = get_tokenizer(language, 5, self.REQUEST_STOP_WORDS, stem=True)
         self.reviews = []
-        self.analysis_cache = {}
+
+        # Per-review detector hits, theme words and sentiment score, keyed by review id
+        # (or content hash) and tagged with a hash of the rating and text
+        if cache_size is None:
+            cache_size = DEFAULT_REVIEW_CACHE_SIZE if cache_path else 0
+        self.cache_size = cache_size
+        self.cache_path = cache_path
+        self.analysis_cache: 'OrderedDict[str, Tuple[str, List[Any]]]' = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        if cache_path and os.path.exists(cache_path):
+            self.load_cache(cache_path)
+
+        # Sentiment, issue and feature-request keywords are matched in one pass
+        self._positive_set = frozenset(k.lower() for k in self.POSITIVE_KEYWORDS)
+        self._negative_set = frozenset(k.lower() for k in self.NEGATIVE_KEYWORDS)
+        self._feature_request_set = frozenset(k.lower() for k in self.FEATURE_REQUEST_KEYWORDS)
+        self._automaton = _detector_automaton(
+            tuple(self.POSITIVE_KEYWORDS),
+            tuple(self.NEGATIVE_KEYWORDS),
+            tuple(self.ISSUE_KEYWORDS),
+            tuple(self.FEATURE_REQUEST_KEYWORDS)
+        )
 
     def analyze_sentiment(
         self,
@@ -59,52 +146,9 @@ class ReviewAnalyzer:
             Sentiment analysis summary
         """
         self.reviews = reviews
-
-        sentiment_counts = {
-            'positive': 0,
-            'neutral': 0,
-            'negative': 0
-        }
-
-        detailed_sentiments = []
-
-        for review in reviews:
-            text = review.get('text', '').lower()
-            rating = review.get('rating', 3)
-
-            # Calculate sentiment score
-            sentiment_score = self._calculate_sentiment_score(text, rating)
-            sentiment_category = self._categorize_sentiment(sentiment_score)
-
-            sentiment_counts[sentiment_category] += 1
-
-            detailed_sentiments.append({
-                'review_id': review.get('id', ''),
-                'rating': rating,
-                'sentiment_score': sentiment_score,
-                'sentiment': sentiment_category,
-                'text_preview': text[:100] + '...' if len(text) > 100 else text
-            })
-
-        # Calculate percentages
-        total = len(reviews)
-        sentiment_distribution = {
-            'positive': round((sentiment_counts['positive'] / total) * 100, 1) if total > 0 else 0,
-            'neutral': round((sentiment_counts['neutral'] / total) * 100, 1) if total > 0 else 0,
-            'negative': round((sentiment_counts['negative'] / total) * 100, 1) if total > 0 else 0
-        }
-
-        # Calculate average rating
-        avg_rating = sum(r.get('rating', 0) for r in reviews) / total if total > 0 else 0
-
-        return {
-            'total_reviews_analyzed': total,
-            'average_rating': round(avg_rating, 2),
-            'sentiment_distribution': sentiment_distribution,
-            'sentiment_counts': sentiment_counts,
-            'sentiment_trend': self._assess_sentiment_trend(sentiment_distribution),
-            'detailed_sentiments': detailed_sentiments[:50]  # Limit output
-        }
+        accumulator = self.create_accumulator(sections=('sentiment',))
+        accumulator.add_many(reviews)
+        return accumulator.sentiment_report()
 
     def extract_common_themes(
         self,
@@ -121,56 +165,9 @@ class ReviewAnalyzer:
         Returns:
             Common themes analysis
         """
-        # Extract all words from reviews
-        all_words = []
-        all_phrases = []
-
-        for review in reviews:
-            text = review.get('text', '').lower()
-            # Clean text
-            text = re.sub(r'[^\w\s]', ' ', text)
-            words = text.split()
-
-            # Filter out common words
-            stop_words = {
-                'the', 'and', 'for', 'with', 'this', 'that', 'from', 'have',
-                'app', 'apps', 'very', 'really', 'just', 'but', 'not', 'you'
-            }
-            words = [w for w in words if w not in stop_words and len(w) > 3]
-
-            all_words.extend(words)
-
-            # Extract 2-3 word phrases
-            for i in range(len(words) - 1):
-                phrase = f"{words[i]} {words[i+1]}"
-                all_phrases.append(phrase)
-
-        # Count frequency
-        word_freq = Counter(all_words)
-        phrase_freq = Counter(all_phrases)
-
-        # Filter by min_mentions
-        common_words = [
-            {'word': word, 'mentions': count}
-            for word, count in word_freq.most_common(30)
-            if count >= min_mentions
-        ]
-
-        common_phrases = [
-            {'phrase': phrase, 'mentions': count}
-            for phrase, count in phrase_freq.most_common(20)
-            if count >= min_mentions
-        ]
-
-        # Categorize themes
-        themes = self._categorize_themes(common_words, common_phrases)
-
-        return {
-            'common_words': common_words,
-            'common_phrases': common_phrases,
-            'identified_themes': themes,
-            'insights': self._generate_theme_insights(themes)
-        }
+        accumulator = self.create_accumulator(sections=('themes',))
+        accumulator.add_many(reviews)
+        return accumulator.themes_report(min_mentions)
 
     def identify_issues(
         self,
@@ -187,108 +184,140 @@ class ReviewAnalyzer:
         Returns:
             Issue identification report
         """
-        issues = []
+        accumulator = self.create_accumulator(
+            sections=('issues',),
+            rating_threshold=rating_threshold
+        )
+        accumulator.add_many(reviews)
+        return accumulator.issues_report()
 
-        for review in reviews:
-            rating = review.get('rating', 5)
-            if rating > rating_threshold:
-                continue
+    def find_feature_requests(
+        self,
+        reviews: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Extract feature requests and desired improvements.
 
-            text = review.get('text', '').lower()
+        Args:
+            reviews: List of review dicts
 
-            # Check for issue keywords
-            mentioned_issues = []
-            for keyword in self.ISSUE_KEYWORDS:
-                if keyword in text:
-                    mentioned_issues.append(keyword)
+        Returns:
+            Feature request analysis
+        """
+        accumulator = self.create_accumulator(sections=('feature_requests',))
+        accumulator.add_many(reviews)
+        return accumulator.feature_requests_report()
 
-            if mentioned_issues:
-                issues.append({
-                    'review_id': review.get('id', ''),
-                    'rating': rating,
-                    'date': review.get('date', ''),
-                    'issue_keywords': mentioned_issues,
-                    'text': text[:200] + '...' if len(text) > 200 else text
-                })
+    def create_accumulator(
+        self,
+        sections: Iterable[str] = REVIEW_SECTIONS,
+        rating_threshold: int = 3
+    ) -> 'ReviewAccumulator':
+        """
+        Create a mergeable accumulator for streaming reviews through this analyzer.
 
-        # Group by issue type
-        issue_frequency = Counter()
-        for issue in issues:
-            for keyword in issue['issue_keywords']:
-                issue_frequency[keyword] += 1
+        Args:
+            sections: Analyses to run (subset of REVIEW_SECTIONS)
+            rating_threshold: Issue analysis only considers reviews at or below this rating
 
-        # Categorize issues
-        categorized_issues = self._categorize_issues(issues)
+        Returns:
+            Empty ReviewAccumulator
+        """
+        return ReviewAccumulator(self, sections, rating_threshold)
 
-        # Calculate issue severity
-        severity_scores = self._calculate_issue_severity(
-            categorized_issues,
-            len(reviews)
-        )
+    def create_issue_index(self, rating_threshold: int = 3, **options: Any) -> 'IssueIndex':
+        """
+        Create an incrementally updated issue index for streaming reviews through this analyzer.
 
-        return {
-            'total_issues_found': len(issues),
-            'issue_frequency': dict(issue_frequency.most_common(15)),
-            'categorized_issues': categorized_issues,
-            'severity_scores': severity_scores,
-            'top_issues': self._rank_issues_by_severity(severity_scores),
-            'recommendations': self._generate_issue_recommendations(
-                categorized_issues,
-                severity_scores
-            )
-        }
+        Args:
+            rating_threshold: Only reviews at or below this rating are indexed as issues
+            **options: Further IssueIndex options (spike thresholds, on_alert callback, ...)
 
-    def find_feature_requests(
+        Returns:
+            Empty IssueIndex
+        """
+        return IssueIndex(self, rating_threshold, **options)
+
+    def analyze_stream(
         self,
-        reviews: List[Dict[str, Any]]
+        source: Union[str, IO, Iterable[Dict[str, Any]]],
+        chunk_size: int = 10000,
+        min_mentions: int = 3,
+        deduplicator: Optional['ReviewDeduplicator'] = None
     ) -> Dict[str, Any]:
         """
-        Extract feature requests and desired improvements.
+        Run the full review analysis over a review stream without materializing it.
 
         Args:
-            reviews: List of review dicts
+            source: Path to a .jsonl/.csv file (optionally .gz), an open text file,
+                or an iterable of review dicts
+            chunk_size: Reviews read per chunk
+            min_mentions: Minimum mentions for common themes
+            deduplicator: Optional ReviewDeduplicator; duplicates are dropped before
+                analysis and its stats are reported under 'deduplication'
 
         Returns:
-            Feature request analysis
+            Same shape as analyze_reviews
         """
-        feature_requests = []
+        if deduplicator is not None:
+            source = deduplicator.filter(iter_reviews(source))
 
-        for review in reviews:
-            text = review.get('text', '').lower()
-            rating = review.get('rating', 3)
-
-            # Check for feature request indicators
-            is_feature_request = any(
-                keyword in text
-                for keyword in self.FEATURE_REQUEST_KEYWORDS
-            )
+        accumulator = self.create_accumulator()
+        for chunk in iter_review_chunks(source, chunk_size):
+            accumulator.add_many(chunk)
 
-            if is_feature_request:
-                # Extract the specific request
-                request_text = self._extract_feature_request_text(text)
+        report = accumulator.report(min_mentions)
+        if deduplicator is not None:
+            report['deduplication'] = deduplicator.stats()
+        return report
 
-                feature_requests.append({
-                    'review_id': review.get('id', ''),
-                    'rating': rating,
-                    'date': review.get('date', ''),
-                    'request_text': request_text,
-                    'full_review': text[:200] + '...' if len(text) > 200 else text
-                })
+    def analyze_parallel(
+        self,
+        source: Union[str, IO, Iterable[Dict[str, Any]]],
+        max_workers: Optional[int] = None,
+        shard_size: int = 20000,
+        min_mentions: int = 3,
+        deduplicator: Optional['ReviewDeduplicator'] = None
+    ) -> Dict[str, Any]:
+        """
+        Run the full review analysis with shards of the corpus spread across processes.
 
-        # Cluster similar requests
-        clustered_requests = self._cluster_feature_requests(feature_requests)
+        Each worker folds one shard into a ReviewAccumulator; partial results are
+        merged in shard order, so the report equals analyze_reviews on the same
+        reviews. At most two shards per worker are in flight at a time.
 
-        # Prioritize based on frequency and rating context
-        prioritized_requests = self._prioritize_feature_requests(clustered_requests)
+        Args:
+            source: Path to a .jsonl/.csv file (optionally .gz), an open file, or an iterable
+            max_workers: Worker processes (None = CPU count)
+            shard_size: Reviews per shard
+            min_mentions: Minimum mentions for common themes
+            deduplicator: Optional ReviewDeduplicator applied (in this process) before
+                sharding; its stats are reported under 'deduplication'
 
-        return {
-            'total_feature_requests': len(feature_requests),
-            'clustered_requests': clustered_requests,
-            'prioritized_requests': prioritized_requests,
-            'implementation_recommendations': self._generate_feature_recommendations(
-                prioritized_requests
-            )
-        }
+        Returns:
+            Same shape as analyze_reviews
+        """
+        if deduplicator is not None:
+            source = deduplicator.filter(iter_reviews(source))
+
+        accumulator = self.create_accumulator()
+        settings = (self.app_name, self.language, self.sentiment_scorer)
+
+        worker_count = max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=worker_count) as pool:
+            max_in_flight = 2 * worker_count
+            pending: Deque[Future[ReviewAccumulator]] = deque()
+            for shard in iter_review_chunks(source, shard_size):
+                pending.append(pool.submit(_accumulate_review_shard, settings, shard))
+                if len(pending) >= max_in_flight:
+                    accumulator.merge(pending.popleft().result())
+            while pending:
+                accumulator.merge(pending.popleft().result())
+
+        report = accumulator.report(min_mentions)
+        if deduplicator is not None:
+            report['deduplication'] = deduplicator.stats()
+        return report
 
     def track_sentiment_trends(
         self,
@@ -408,14 +437,161 @@ class ReviewAnalyzer:
 
         return templates.get(issue_category, templates['negative_general'])
 
-    def _calculate_sentiment_score(self, text: str, rating: int) -> float:
+    def _theme_words(self, text: str) -> List[str]:
+        """Stemmed theme words of an already-lowercased review text."""
+        return self._theme_tokenizer.tokens(text)
+
+    def save_cache(self, path: Optional[str] = None) -> str:
+        """
+        Write the per-review analysis cache to a JSON file.
+
+        Args:
+            path: Destination (default: cache_path given at construction)
+
+        Returns:
+            Path written
+        """
+        path = path or self.cache_path
+        if not path:
+            raise ValueError("No cache path given")
+
+        entries = [
+            [key, digest, sorted(matched) if matched is not None else None, first_request, words, score]
+            for key, (digest, (matched, first_request, words, score)) in self.analysis_cache.items()
+        ]
+        with open(path, 'w', encoding='utf-8') as handle:
+            json.dump({
+                'language': self.language,
+                'scorer': self._scorer_signature(),
+                'entries': entries
+            }, handle)
+        return path
+
+    def load_cache(self, path: str) -> int:
+        """
+        Load cache entries saved by save_cache (most recent entries win when over capacity).
+
+        Sentiment scores are kept only when the file was written with the same
+        sentiment scoring (keyword counts or an equal lexicon scorer).
+
+        Args:
+            path: JSON file written by save_cache
+
+        Returns:
+            Number of entries loaded
+        """
+        with open(path, encoding='utf-8') as handle:
+            data = json.load(handle)
+        if data.get('language') != self.language or not self.cache_size:
+            return 0
+
+        same_scorer = data.get('scorer') == self._scorer_signature()
+        for key, digest, matched, first_request, words, score in data.get('entries', [])[-self.cache_size:]:
+            self.analysis_cache[key] = (digest, [
+                frozenset(matched) if matched is not None else None,
+                first_request,
+                words,
+                score if same_scorer else None
+            ])
+        while len(self.analysis_cache) > self.cache_size:
+            self.analysis_cache.popitem(last=False)
+        return len(self.analysis_cache)
+
+    def _scorer_signature(self) -> str:
+        """Stable identifier of the sentiment scoring, stored with persisted scores."""
+        scorer = self.sentiment_scorer
+        if scorer is None:
+            return 'keywords'
+        lexicon, phrases, negations, window, scale, language = scorer._key()
+        settings = repr((lexicon, phrases, sorted(negations), window, scale, language))
+        return hashlib.blake2b(settings.encode('utf-8'), digest_size=8).hexdigest()
+
+    def _review_features(
+        self,
+        review: Dict[str, Any],
+        text: str,
+        need_scan: bool,
+        need_words: bool
+    ) -> List[Any]:
+        """
+        Detector hits, theme words and cached score for a lowercased review.
+
+        With the cache enabled, features are reused while the review's rating
+        and text are unchanged; an edited review replaces its entry.
+
+        Returns:
+            [matched keywords, first feature-request position, theme words,
+            sentiment score] (parts not requested or not yet computed may be None)
+        """
+        if not self.cache_size:
+            return [
+                *(self._scan_review(text) if need_scan else (None, -1)),
+                self._theme_words(text) if need_words else None,
+                None
+            ]
+
+        content = f"{review.get('rating', 3)!r}\x00{text}"
+        digest = hashlib.blake2b(content.encode('utf-8', 'surrogatepass'), digest_size=8).hexdigest()
+        review_id = review.get('id')
+        key = f"id:{review_id}" if review_id not in (None, '') else f"text:{digest}"
+        cache = self.analysis_cache
+        entry = cache.get(key)
+        if entry is None or entry[0] != digest:
+            self.cache_misses += 1
+            features: List[Any] = [None, -1, None, None]
+            cache[key] = (digest, features)
+            cache.move_to_end(key)
+            if len(cache) > self.cache_size:
+                cache.popitem(last=False)
+        else:
+            self.cache_hits += 1
+            cache.move_to_end(key)
+            features = entry[1]
+
+        if need_scan and features[0] is None:
+            features[0], features[1] = self._scan_review(text)
+        if need_words and features[2] is None:
+            features[2] = self._theme_words(text)
+        return features
+
+    def _review_sentiment(self, review: Dict[str, Any], text: str, features: List[Any]) -> float:
+        """Sentiment score of a review, stored in (and reused from) its features."""
+        score: Optional[float] = features[3]
+        if score is None:
+            score = self._calculate_sentiment_score(text, review.get('rating', 3), features[0])
+            features[3] = score
+        return score
+
+    def _scan_review(self, text: str) -> Tuple[FrozenSet[str], int]:
+        """
+        Match every detector keyword list against a lowercased review in one pass.
+
+        Returns:
+            (keywords found, position of the first feature-request keyword or -1)
+        """
+        matched = frozenset(self._automaton.matched_keywords(text))
+        requests = matched & self._feature_request_set
+        first_request = min(text.find(keyword) for keyword in requests) if requests else -1
+        return matched, first_request
+
+    def _calculate_sentiment_score(
+        self,
+        text: str,
+        rating: int,
+        matched: Optional[FrozenSet[str]] = None
+    ) -> float:
         """Calculate sentiment score (-1 to 1)."""
+        if self.sentiment_scorer is not None:
+            return self.sentiment_scorer.score(text, rating)
+
         # Start with rating-based score
         rating_score = (rating - 3) / 2  # Convert 1-5 to -1 to 1
 
-        # Adjust based on text sentiment
-        positive_count = sum(1 for keyword in self.POSITIVE_KEYWORDS if keyword in text)
-        negative_count = sum(1 for keyword in self.NEGATIVE_KEYWORDS if keyword in text)
+        # Adjust based on text sentiment (distinct keywords present)
+        if matched is None:
+            matched = self._scan_review(text)[0]
+        positive_count = len(matched & self._positive_set)
+        negative_count = len(matched & self._negative_set)
 
         text_score = (positive_count - negative_count) / 10  # Normalize
 
@@ -497,26 +673,23 @@ class ReviewAnalyzer:
 
         return insights[:5]
 
+    def _issue_category(self, keywords: Iterable[str]) -> str:
+        """Category of one issue from its keywords (first matching rule wins)."""
+        if 'crash' in keywords or 'freezes' in keywords:
+            return 'crashes'
+        elif 'bug' in keywords or 'error' in keywords or 'broken' in keywords:
+            return 'bugs'
+        elif 'slow' in keywords or 'laggy' in keywords:
+            return 'performance'
+        else:
+            return 'compatibility'
+
     def _categorize_issues(self, issues: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
         """Categorize issues by type."""
-        categories = {
-            'crashes': [],
-            'bugs': [],
-            'performance': [],
-            'compatibility': []
-        }
+        categories = {category: [] for category in ISSUE_CATEGORIES}
 
         for issue in issues:
-            keywords = issue['issue_keywords']
-
-            if 'crash' in keywords or 'freezes' in keywords:
-                categories['crashes'].append(issue)
-            elif 'bug' in keywords or 'error' in keywords or 'broken' in keywords:
-                categories['bugs'].append(issue)
-            elif 'slow' in keywords or 'laggy' in keywords:
-                categories['performance'].append(issue)
-            else:
-                categories['compatibility'].append(issue)
+            categories[self._issue_category(issue['issue_keywords'])].append(issue)
 
         return {k: v for k, v in categories.items() if v}
 
@@ -529,24 +702,31 @@ class ReviewAnalyzer:
         severity_scores = {}
 
         for category, issues in categorized_issues.items():
-            count = len(issues)
-            percentage = (count / total_reviews) * 100 if total_reviews > 0 else 0
+            severity_scores[category] = self._severity_entry(
+                len(issues),
+                sum(i['rating'] for i in issues),
+                total_reviews
+            )
 
-            # Calculate average rating of affected reviews
-            avg_rating = sum(i['rating'] for i in issues) / count if count > 0 else 0
+        return severity_scores
 
-            # Severity score (0-100)
-            severity = min((percentage * 10) + ((5 - avg_rating) * 10), 100)
+    def _severity_entry(self, count: int, rating_sum: float, total_reviews: int) -> Dict[str, Any]:
+        """Severity score of one issue category from its running counts."""
+        percentage = (count / total_reviews) * 100 if total_reviews > 0 else 0
 
-            severity_scores[category] = {
-                'count': count,
-                'percentage': round(percentage, 2),
-                'average_rating': round(avg_rating, 2),
-                'severity_score': round(severity, 1),
-                'priority': 'critical' if severity > 70 else ('high' if severity > 40 else 'medium')
-            }
+        # Average rating of affected reviews
+        avg_rating = rating_sum / count if count > 0 else 0
 
-        return severity_scores
+        # Severity score (0-100)
+        severity = min((percentage * 10) + ((5 - avg_rating) * 10), 100)
+
+        return {
+            'count': count,
+            'percentage': round(percentage, 2),
+            'average_rating': round(avg_rating, 2),
+            'severity_score': round(severity, 1),
+            'priority': 'critical' if severity > 70 else ('high' if severity > 40 else 'medium')
+        }
 
     def _rank_issues_by_severity(
         self,
@@ -580,44 +760,146 @@ class ReviewAnalyzer:
 
         return recommendations
 
-    def _extract_feature_request_text(self, text: str) -> str:
-        """Extract the specific feature request from review text."""
-        # Simple extraction - find sentence with feature request keywords
-        sentences = text.split('.')
-        for sentence in sentences:
-            if any(keyword in sentence for keyword in self.FEATURE_REQUEST_KEYWORDS):
-                return sentence.strip()
-        return text[:100]  # Fallback
+    def _extract_feature_request_text(self, text: str, position: Optional[int] = None) -> str:
+        """
+        Extract the specific feature request from review text.
+
+        Args:
+            text: Lowercased review text
+            position: Position of the first feature-request keyword, if already known
+        """
+        if position is None:
+            position = self._scan_review(text)[1]
+        if position < 0:
+            return text[:100]  # Fallback
+
+        # The first sentence with a request keyword is the one holding the earliest match
+        start = text.rfind('.', 0, position) + 1
+        end = text.find('.', position)
+        return text[start:end if end >= 0 else len(text)].strip()
+
+    def _request_key_words(self, text: str) -> Tuple[str, ...]:
+        """Distinct folded key words (over 4 chars, fillers removed) of a request, in order."""
+        return tuple(dict.fromkeys(self._request_tokenizer.tokens(text)))
 
     def _cluster_feature_requests(
         self,
-        feature_requests: List[Dict[str, Any]]
+        feature_requests: List[Dict[str, Any]],
+        min_similarity: float = 0.5
     ) -> List[Dict[str, Any]]:
-        """Cluster similar feature requests."""
-        # Simplified clustering - group by common keywords
-        clusters = {}
-
-        for request in feature_requests:
-            text = request['request_text'].lower()
-            # Extract key words
-            words = [w for w in text.split() if len(w) > 4]
-
-            # Try to find matching cluster
-            matched = False
-            for cluster_key in clusters:
-                if any(word in cluster_key for word in words[:3]):
-                    clusters[cluster_key].append(request)
-                    matched = True
-                    break
-
-            if not matched and words:
-                cluster_key = ' '.join(words[:2])
-                clusters[cluster_key] = [request]
-
-        return [
-            {'feature_theme': theme, 'request_count': len(requests), 'examples': requests[:3]}
-            for theme, requests in clusters.items()
-        ]
+        """
+        Cluster similar feature requests.
+
+        Requests are reduced to key-word sets and identical sets are grouped.
+        Distinct sets are then assigned, most requested first, to the most
+        similar cluster leader (exact Jaccard similarity) or start a new
+        cluster. Leaders are found through an inverted index probed with
+        prefix filtering, so only leaders that can reach min_similarity are
+        compared; request order only breaks ties between equally frequent sets.
+
+        Args:
+            feature_requests: Requests with 'request_text'
+            min_similarity: Key-word Jaccard similarity needed to join a cluster
+
+        Returns:
+            Clusters in first-seen order with theme, count and first three examples
+        """
+        # Group request indexes by key-word set (requests without key words are not clustered)
+        groups: Dict[FrozenSet[str], List[int]] = {}
+        for request_index, request in enumerate(feature_requests):
+            words = self._request_key_words(request['request_text'])
+            if words:
+                groups.setdefault(frozenset(words), []).append(request_index)
+
+        # Rarest words first, so prefixes probe short posting lists
+        word_frequency = Counter(word for key in groups for word in key)
+        rank = {
+            word: position
+            for position, word in enumerate(sorted(word_frequency, key=lambda w: (word_frequency[w], w)))
+        }
+
+        members = self._leader_clusters(groups, rank, min_similarity)
+
+        clustered = []
+        for cluster_keys in members:
+            word_counts = Counter()
+            for key in cluster_keys:
+                for word in key:
+                    word_counts[word] += len(groups[key])
+            request_indexes = list(heapq.merge(*(groups[key] for key in cluster_keys)))
+            theme = sorted(word_counts, key=lambda w: (-word_counts[w], rank[w]))[:2]
+            clustered.append((request_indexes[0], {
+                'feature_theme': ' '.join(theme),
+                'request_count': len(request_indexes),
+                'examples': [feature_requests[i] for i in request_indexes[:3]]
+            }))
+
+        clustered.sort(key=lambda item: item[0])
+        return [cluster for _, cluster in clustered]
+
+    @staticmethod
+    def _leader_clusters(
+        groups: Dict[FrozenSet[str], List[int]],
+        rank: Dict[str, int],
+        min_similarity: float
+    ) -> List[List[FrozenSet[str]]]:
+        """
+        Leader clustering of key-word sets, most requested first.
+
+        Two sets with overlap o share a word within their first (size - o + 1)
+        rarest words, so leaders are indexed by (word, leader size, word position)
+        and each probe only reads the positions that overlap can still reach.
+
+        Returns:
+            Member key sets per cluster, leader first, in cluster creation order
+        """
+        leaders: List[FrozenSet[str]] = []
+        members: List[List[FrozenSet[str]]] = []
+        postings: Dict[Tuple[str, int, int], List[int]] = {}
+        for key in sorted(groups, key=lambda k: (-len(groups[k]), groups[k][0])):
+            tokens = sorted(key, key=rank.__getitem__)
+            best = ReviewAnalyzer._best_request_leader(key, tokens, leaders, postings, min_similarity)
+            if best >= 0:
+                members[best].append(key)
+                continue
+
+            leaders.append(key)
+            members.append([key])
+            size = len(key)
+            smallest_size = max(1, math.ceil(min_similarity * size - 1e-9))
+            for position, word in enumerate(tokens[:size - smallest_size + 1]):
+                postings.setdefault((word, size, position), []).append(len(leaders) - 1)
+        return members
+
+    @staticmethod
+    def _best_request_leader(
+        key: FrozenSet[str],
+        tokens: List[str],
+        leaders: List[FrozenSet[str]],
+        postings: Dict[Tuple[str, int, int], List[int]],
+        min_similarity: float
+    ) -> int:
+        """Index of the most similar leader reaching min_similarity (lowest index on ties), or -1."""
+        size = len(key)
+        smallest_size = max(1, math.ceil(min_similarity * size - 1e-9))
+        best, best_similarity = -1, min_similarity
+        seen = set()
+        for leader_size in range(smallest_size, int(size / min_similarity + 1e-9) + 1):
+            # Jaccard >= t  <=>  |A & B| >= t / (1 + t) * (|A| + |B|)
+            overlap = math.ceil(min_similarity / (1 + min_similarity) * (size + leader_size) - 1e-9)
+            for word in tokens[:size - overlap + 1]:
+                for position in range(leader_size - overlap + 1):
+                    for leader in postings.get((word, leader_size, position), ()):
+                        if leader in seen:
+                            continue
+                        seen.add(leader)
+                        leader_key = leaders[leader]
+                        similarity = len(key & leader_key) / len(key | leader_key)
+                        if similarity > best_similarity or (
+                            similarity == best_similarity and (best < 0 or leader < best)
+                        ):
+                            best, best_similarity = leader, similarity
+        return best
 
     def _prioritize_feature_requests(
         self,
@@ -690,9 +972,1020 @@ class ReviewAnalyzer:
         return insights
 
 
-def analyze_reviews(
+# Theme extraction is the only section that needs no keyword scan
+_THEMES_ONLY = frozenset({'themes'})
+
+
+class ReviewAccumulator:
+    """
+    Running, mergeable aggregates behind every review analysis.
+
+    Memory grows with the aggregates (counters, detected issues and feature
+    requests, the first detailed sentiments), not with the number of reviews.
+    Accumulators built over consecutive shards of a corpus and merged in shard
+    order report exactly what one accumulator over the whole corpus would.
+    """
+
+    def __init__(
+        self,
+        analyzer: ReviewAnalyzer,
+        sections: Iterable[str] = REVIEW_SECTIONS,
+        rating_threshold: int = 3,
+        detail_limit: int = 50
+    ):
+        """
+        Initialize empty aggregates.
+
+        Args:
+            analyzer: Analyzer providing keyword lists and report helpers
+            sections: Analyses to run (subset of REVIEW_SECTIONS)
+            rating_threshold: Issue analysis only considers reviews at or below this rating
+            detail_limit: Detailed sentiment entries kept (from the first reviews)
+        """
+        unknown = set(sections) - set(REVIEW_SECTIONS)
+        if unknown:
+            raise ValueError(f"Unknown review sections: {sorted(unknown)}")
+
+        self.analyzer = analyzer
+        self.sections = frozenset(sections)
+        if self.sections == _THEMES_ONLY:
+            self.sections = _THEMES_ONLY
+        self.rating_threshold = rating_threshold
+        self.detail_limit = detail_limit
+
+        self.total_reviews = 0
+        self.rating_sum = 0
+        self.sentiment_counts = {'positive': 0, 'neutral': 0, 'negative': 0}
+        self.detailed_sentiments: List[Dict[str, Any]] = []
+        self.word_freq: Counter = Counter()
+        self.phrase_freq: Counter = Counter()
+        self.issues: List[Dict[str, Any]] = []
+        self.feature_requests: List[Dict[str, Any]] = []
+
+    def add(self, review: Dict[str, Any], sentiment_score: Optional[float] = None) -> None:
+        """
+        Fold one review into the aggregates.
+
+        Args:
+            review: Review dict
+            sentiment_score: Precomputed sentiment score (e.g. from a batch scorer)
+        """
+        # Normalize once; detector hits and theme words come from one (cached) scan
+        text = review.get('text', '').lower()
+        self._add(review, text, self._features(review, text), sentiment_score)
+
+    def _features(self, review: Dict[str, Any], text: str) -> List[Any]:
+        """Review features needed by this accumulator's sections."""
+        sections = self.sections
+        return self.analyzer._review_features(
+            review,
+            text,
+            sections is not _THEMES_ONLY,
+            'themes' in sections
+        )
+
+    def _add(
+        self,
+        review: Dict[str, Any],
+        text: str,
+        features: List[Any],
+        sentiment_score: Optional[float] = None
+    ) -> None:
+        """Fold one review given its lowercased text and features."""
+        analyzer = self.analyzer
+        sections = self.sections
+        self.total_reviews += 1
+        matched, first_request, words = features[0], features[1], features[2]
+
+        if 'sentiment' in sections:
+            rating = review.get('rating', 3)
+            self.rating_sum += review.get('rating', 0)
+            if sentiment_score is None:
+                sentiment_score = analyzer._review_sentiment(review, text, features)
+            sentiment_category = analyzer._categorize_sentiment(sentiment_score)
+            self.sentiment_counts[sentiment_category] += 1
+            if len(self.detailed_sentiments) < self.detail_limit:
+                self.detailed_sentiments.append({
+                    'review_id': review.get('id', ''),
+                    'rating': rating,
+                    'sentiment_score': sentiment_score,
+                    'sentiment': sentiment_category,
+                    'text_preview': text[:100] + '...' if len(text) > 100 else text
+                })
+
+        if 'themes' in sections:
+            self.word_freq.update(words)
+            self.phrase_freq.update(iter_ngrams(words, 2))
+
+        if 'issues' in sections:
+            rating = review.get('rating', 5)
+            if rating <= self.rating_threshold:
+                mentioned_issues = [
+                    keyword for keyword in analyzer.ISSUE_KEYWORDS if keyword in matched
+                ]
+                if mentioned_issues:
+                    self.issues.append({
+                        'review_id': review.get('id', ''),
+                        'rating': rating,
+                        'date': review.get('date', ''),
+                        'issue_keywords': mentioned_issues,
+                        'text': text[:200] + '...' if len(text) > 200 else text
+                    })
+
+        if 'feature_requests' in sections:
+            if first_request >= 0:
+                self.feature_requests.append({
+                    'review_id': review.get('id', ''),
+                    'rating': review.get('rating', 3),
+                    'date': review.get('date', ''),
+                    'request_text': analyzer._extract_feature_request_text(text, first_request),
+                    'full_review': text[:200] + '...' if len(text) > 200 else text
+                })
+
+    def add_many(self, reviews: Iterable[Dict[str, Any]]) -> None:
+        """
+        Fold a batch of reviews into the aggregates.
+
+        With a lexicon scorer, reviews without a cached score are scored as one batch.
+        """
+        scorer = self.analyzer.sentiment_scorer
+        if scorer is None or 'sentiment' not in self.sections:
+            for review in reviews:
+                self.add(review)
+            return
+
+        reviews = list(reviews)
+        texts = [review.get('text', '').lower() for review in reviews]
+        features = [self._features(review, text) for review, text in zip(reviews, texts)]
+        pending = [index for index, review_features in enumerate(features) if review_features[3] is None]
+        scores = scorer.score_texts(
+            [texts[index] for index in pending],
+            [reviews[index].get('rating', 3) for index in pending]
+        )
+        for index, score in zip(pending, scores):
+            features[index][3] = score
+        for review, text, review_features in zip(reviews, texts, features):
+            self._add(review, text, review_features)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle aggregates only; the receiving side merges into its own analyzer's accumulator."""
+        state = dict(self.__dict__)
+        state['analyzer'] = None
+        return state
+
+    def merge(self, other: 'ReviewAccumulator') -> 'ReviewAccumulator':
+        """
+        Append another accumulator's aggregates (it must cover the reviews after ours).
+
+        Args:
+            other: Accumulator with the same sections and rating threshold
+
+        Returns:
+            self, for chaining
+        """
+        if other.sections != self.sections or other.rating_threshold != self.rating_threshold:
+            raise ValueError("Cannot merge accumulators with different sections or thresholds")
+
+        self.total_reviews += other.total_reviews
+        self.rating_sum += other.rating_sum
+        for category, count in other.sentiment_counts.items():
+            self.sentiment_counts[category] += count
+        room = self.detail_limit - len(self.detailed_sentiments)
+        if room > 0:
+            self.detailed_sentiments.extend(other.detailed_sentiments[:room])
+        # Counter.update keeps first-seen order, so most_common ties match a single pass
+        self.word_freq.update(other.word_freq)
+        self.phrase_freq.update(other.phrase_freq)
+        self.issues.extend(other.issues)
+        self.feature_requests.extend(other.feature_requests)
+        return self
+
+    def sentiment_report(self) -> Dict[str, Any]:
+        """Same shape as ReviewAnalyzer.analyze_sentiment."""
+        total = self.total_reviews
+        sentiment_counts = dict(self.sentiment_counts)
+        sentiment_distribution = {
+            category: round((sentiment_counts[category] / total) * 100, 1) if total > 0 else 0
+            for category in ('positive', 'neutral', 'negative')
+        }
+        avg_rating = self.rating_sum / total if total > 0 else 0
+
+        return {
+            'total_reviews_analyzed': total,
+            'average_rating': round(avg_rating, 2),
+            'sentiment_distribution': sentiment_distribution,
+            'sentiment_counts': sentiment_counts,
+            'sentiment_trend': self.analyzer._assess_sentiment_trend(sentiment_distribution),
+            'detailed_sentiments': list(self.detailed_sentiments)
+        }
+
+    def themes_report(self, min_mentions: int = 3) -> Dict[str, Any]:
+        """Same shape as ReviewAnalyzer.extract_common_themes."""
+        common_words = [
+            {'word': word, 'mentions': count}
+            for word, count in self.word_freq.most_common(30)
+            if count >= min_mentions
+        ]
+        common_phrases = [
+            {'phrase': phrase, 'mentions': count}
+            for phrase, count in self.phrase_freq.most_common(20)
+            if count >= min_mentions
+        ]
+        themes = self.analyzer._categorize_themes(common_words, common_phrases)
+
+        return {
+            'common_words': common_words,
+            'common_phrases': common_phrases,
+            'identified_themes': themes,
+            'insights': self.analyzer._generate_theme_insights(themes)
+        }
+
+    def issues_report(self) -> Dict[str, Any]:
+        """Same shape as ReviewAnalyzer.identify_issues."""
+        analyzer = self.analyzer
+        issue_frequency = Counter()
+        for issue in self.issues:
+            issue_frequency.update(issue['issue_keywords'])
+
+        categorized_issues = analyzer._categorize_issues(self.issues)
+        severity_scores = analyzer._calculate_issue_severity(
+            categorized_issues,
+            self.total_reviews
+        )
+
+        return {
+            'total_issues_found': len(self.issues),
+            'issue_frequency': dict(issue_frequency.most_common(15)),
+            'categorized_issues': categorized_issues,
+            'severity_scores': severity_scores,
+            'top_issues': analyzer._rank_issues_by_severity(severity_scores),
+            'recommendations': analyzer._generate_issue_recommendations(
+                categorized_issues,
+                severity_scores
+            )
+        }
+
+    def feature_requests_report(self) -> Dict[str, Any]:
+        """Same shape as ReviewAnalyzer.find_feature_requests."""
+        analyzer = self.analyzer
+        clustered_requests = analyzer._cluster_feature_requests(self.feature_requests)
+        prioritized_requests = analyzer._prioritize_feature_requests(clustered_requests)
+
+        return {
+            'total_feature_requests': len(self.feature_requests),
+            'clustered_requests': clustered_requests,
+            'prioritized_requests': prioritized_requests,
+            'implementation_recommendations': analyzer._generate_feature_recommendations(
+                prioritized_requests
+            )
+        }
+
+    def report(self, min_mentions: int = 3) -> Dict[str, Any]:
+        """Reports for every accumulated section, keyed like analyze_reviews."""
+        keys = (
+            ('sentiment', 'sentiment_analysis', self.sentiment_report),
+            ('themes', 'common_themes', lambda: self.themes_report(min_mentions)),
+            ('issues', 'issues_identified', self.issues_report),
+            ('feature_requests', 'feature_requests', self.feature_requests_report)
+        )
+        return {key: build() for section, key, build in keys if section in self.sections}
+
+
+def _parse_review_day(value: Any) -> Optional[date]:
+    """Day of a review date ('YYYY-MM-DD', ISO timestamp, date or datetime)."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+def _require_day(value: Any, name: str) -> date:
+    """Day of a query date; raises ValueError naming the value if it does not parse."""
+    day = _parse_review_day(value)
+    if day is None:
+        raise ValueError(f"{name} must be a date or 'YYYY-MM-DD' string, got {value!r}")
+    return day
+
+
+def _week_label(day: date) -> str:
+    """ISO week label (the week's Monday)."""
+    return (day - timedelta(days=day.weekday())).isoformat()
+
+
+def _month_label(day: date) -> str:
+    """Calendar month label (YYYY-MM)."""
+    return day.strftime('%Y-%m')
+
+
+# Period label functions for SentimentTrendAggregator.series
+_PERIOD_LABELS: Dict[str, Callable[[date], str]] = {
+    'day': date.isoformat,
+    'week': _week_label,
+    'month': _month_label
+}
+
+
+class SentimentTrendAggregator:
+    """
+    Daily sentiment buckets answering arbitrary date-window queries.
+
+    Each review is scored once on ingest; a day keeps its review count,
+    rating sum and positive/neutral/negative tallies. Window, calendar and
+    rolling queries combine buckets only, never review text.
+    """
+
+    def __init__(self, analyzer: ReviewAnalyzer):
+        """
+        Initialize empty buckets.
+
+        Args:
+            analyzer: Analyzer used to score reviews (its review cache is reused)
+        """
+        self.analyzer = analyzer
+        self._buckets: Dict[date, List[float]] = {}
+        self._days: List[date] = []
+        self.undated_reviews = 0
+
+    def __len__(self) -> int:
+        """Number of days with at least one review."""
+        return len(self._days)
+
+    def _bucket(self, day: date) -> List[float]:
+        """Bucket for a day: [reviews, rating_sum, positive, neutral, negative]."""
+        bucket = self._buckets.get(day)
+        if bucket is None:
+            bucket = [0, 0, 0, 0, 0]
+            self._buckets[day] = bucket
+            insort(self._days, day)
+        return bucket
+
+    def add(self, review: Dict[str, Any]) -> None:
+        """Score one review and add it to its day's bucket."""
+        day = _parse_review_day(review.get('date'))
+        if day is None:
+            self.undated_reviews += 1
+            return
+
+        analyzer = self.analyzer
+        text = review.get('text', '').lower()
+        features = analyzer._review_features(review, text, True, False)
+        sentiment = analyzer._categorize_sentiment(analyzer._review_sentiment(review, text, features))
+
+        bucket = self._bucket(day)
+        bucket[0] += 1
+        bucket[1] += review.get('rating', 0)
+        bucket[2 + ('positive', 'neutral', 'negative').index(sentiment)] += 1
+
+    def add_many(self, reviews: Iterable[Dict[str, Any]]) -> None:
+        """Score and bucket a batch of reviews."""
+        for review in reviews:
+            self.add(review)
+
+    def merge(self, other: 'SentimentTrendAggregator') -> 'SentimentTrendAggregator':
+        """Add another aggregator's buckets (e.g. from a parallel shard)."""
+        for day, other_bucket in other._buckets.items():
+            bucket = self._bucket(day)
+            for i, value in enumerate(other_bucket):
+                bucket[i] += value
+        self.undated_reviews += other.undated_reviews
+        return self
+
+    def window(self, start: Any, end: Any, label: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Sentiment stats for reviews dated start..end (inclusive).
+
+        Args:
+            start: First day (date or ISO string)
+            end: Last day (date or ISO string); a window ending before start is empty
+            label: Period name (default "start..end")
+
+        Returns:
+            Dict shaped like a track_sentiment_trends trend_data entry
+
+        Raises:
+            ValueError: If start or end is not a date
+        """
+        start_day, end_day = _require_day(start, 'start'), _require_day(end, 'end')
+        totals: List[float] = [0, 0, 0, 0, 0]
+        days = self._days
+        for day in days[bisect_left(days, start_day):bisect_right(days, end_day)]:
+            for i, value in enumerate(self._buckets[day]):
+                totals[i] += value
+        return self._period_stats(label or f"{start_day.isoformat()}..{end_day.isoformat()}", totals)
+
+    @staticmethod
+    def _period_stats(label: str, totals: List[float]) -> Dict[str, Any]:
+        """Trend entry from summed bucket values (same rounding as analyze_sentiment)."""
+        total = totals[0]
+        return {
+            'period': label,
+            'total_reviews': total,
+            'average_rating': round(totals[1] / total, 2) if total > 0 else 0,
+            'positive_percentage': round((totals[2] / total) * 100, 1) if total > 0 else 0,
+            'negative_percentage': round((totals[4] / total) * 100, 1) if total > 0 else 0
+        }
+
+    def series(self, granularity: str = 'week') -> List[Dict[str, Any]]:
+        """
+        Calendar-period trend line over every bucketed day.
+
+        Args:
+            granularity: 'day', 'week' (ISO weeks, labelled by their Monday) or 'month'
+
+        Returns:
+            Trend entries in chronological order (periods without reviews omitted)
+        """
+        key = _PERIOD_LABELS.get(granularity)
+        if key is None:
+            raise ValueError("granularity must be 'day', 'week' or 'month'")
+
+        periods: Dict[str, List[float]] = {}
+        for day in self._days:
+            totals = periods.setdefault(key(day), [0, 0, 0, 0, 0])
+            for i, value in enumerate(self._buckets[day]):
+                totals[i] += value
+        return [self._period_stats(label, totals) for label, totals in periods.items()]
+
+    def rolling(self, days: int = 7, end: Any = None, points: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Rolling-window trend line, one point per day (sliding sums, O(days covered)).
+
+        Args:
+            days: Window length in days (e.g. 7 or 30)
+            end: Last day of the line (default: last bucketed day)
+            points: Number of daily points (default: from the first bucketed day)
+
+        Returns:
+            Trend entries labelled by each window's last day
+
+        Raises:
+            ValueError: If days or points is below 1 or end is not a date
+        """
+        if days < 1:
+            raise ValueError("days must be at least 1")
+        if points is not None and points < 1:
+            raise ValueError("points must be at least 1")
+        if not self._days:
+            return []
+        last = _require_day(end, 'end') if end is not None else self._days[-1]
+        first = last - timedelta(days=points - 1) if points else self._days[0]
+
+        empty: List[float] = [0, 0, 0, 0, 0]
+        window: List[float] = [0, 0, 0, 0, 0]
+        # Prime the window with the days before the first point
+        day = first - timedelta(days=days - 1)
+        while day < first:
+            for i, value in enumerate(self._buckets.get(day, empty)):
+                window[i] += value
+            day += timedelta(days=1)
+
+        line = []
+        while day <= last:
+            for i, value in enumerate(self._buckets.get(day, empty)):
+                window[i] += value
+            line.append(self._period_stats(day.isoformat(), window))
+            for i, value in enumerate(self._buckets.get(day - timedelta(days=days - 1), empty)):
+                window[i] -= value
+            day += timedelta(days=1)
+        return line
+
+    def between_releases(self, releases: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Trend entries from each release date up to the day before the next one.
+
+        Args:
+            releases: version -> release date; the last release runs to the last bucketed day
+
+        Returns:
+            Trend entries labelled by version, in release order
+
+        Raises:
+            ValueError: If a release date is not a date
+        """
+        ordered = sorted(
+            (
+                (_require_day(released, f'release date for {version!r}'), version)
+                for version, released in releases.items()
+            ),
+            key=lambda item: item[0]
+        )
+        last_day = self._days[-1] if self._days else None
+        entries = []
+        for index, (released, version) in enumerate(ordered):
+            if index + 1 < len(ordered):
+                end = ordered[index + 1][0] - timedelta(days=1)
+            else:
+                end = max(last_day, released) if last_day else released
+            entries.append(self.window(released, end, label=version))
+        return entries
+
+    def trend_report(self, trend_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Summarize trend entries like track_sentiment_trends.
+
+        Args:
+            trend_data: Entries from window, series, rolling or between_releases
+
+        Returns:
+            Trend analysis with direction and insights
+        """
+        analyzer = self.analyzer
+        if len(trend_data) >= 2:
+            trend_direction = analyzer._determine_trend_direction(
+                trend_data[-1]['average_rating'] - trend_data[0]['average_rating'],
+                trend_data[-1]['positive_percentage'] - trend_data[0]['positive_percentage']
+            )
+        else:
+            trend_direction = 'insufficient_data'
+
+        return {
+            'periods_analyzed': len(trend_data),
+            'trend_data': trend_data,
+            'trend_direction': trend_direction,
+            'insights': analyzer._generate_trend_insights(trend_data, trend_direction)
+        }
+
+
+class ReviewDeduplicator:
+    """
+    Streaming filter that drops exact and near-duplicate reviews.
+
+    Exact duplicates are found by a hash of the case- and whitespace-normalized
+    text; near duplicates (copy-pasted spam with small edits) by a SimHash of
+    the text's words and word pairs within max_distance bits of an earlier
+    review. A one-word edit moves the SimHash of a 40-word review by about
+    6 bits, while unrelated reviews are usually 20 or more bits apart.
+    Reviews shorter than min_words always pass, since short texts such as
+    "great app" repeat legitimately. Review text is never stored, but each
+    kept review costs one text hash, one fingerprint and one entry in every
+    SimHash index table: C(max_distance + 2, 2) tables, 28 at the default
+    max_distance of 6. Memory therefore grows as tables x kept reviews.
+    """
+
+    def __init__(self, max_distance: int = 6, min_words: int = 5, near_duplicates: bool = True):
+        """
+        Initialize an empty filter.
+
+        Args:
+            max_distance: Largest SimHash Hamming distance treated as a near duplicate
+            min_words: Reviews with fewer words are never suppressed
+            near_duplicates: Also suppress near duplicates (False = exact duplicates only)
+        """
+        self.max_distance = max_distance
+        self.min_words = min_words
+        self.near_duplicates = near_duplicates
+        self._digests = set()
+        self._index = SimHashIndex(max_distance, exact_bands=2)
+
+        self.reviews_seen = 0
+        self.exact_duplicates = 0
+        self.near_duplicates_found = 0
+
+    def check(self, review: Dict[str, Any]) -> Optional[str]:
+        """
+        Classify a review and remember it when it is kept.
+
+        Args:
+            review: Review dict
+
+        Returns:
+            'exact' or 'near' for a duplicate of an earlier review, None when kept
+        """
+        self.reviews_seen += 1
+        words = review.get('text', '').lower().split()
+        if len(words) < self.min_words:
+            return None
+
+        normalized = ' '.join(words)
+        digest = hashlib.blake2b(normalized.encode('utf-8', 'surrogatepass'), digest_size=8).digest()
+        if digest in self._digests:
+            self.exact_duplicates += 1
+            return 'exact'
+
+        if self.near_duplicates:
+            fingerprint = simhash(shingle_hashes(normalized, 1) | shingle_hashes(normalized, 2))
+            if self._index.nearest(fingerprint) is not None:
+                self.near_duplicates_found += 1
+                return 'near'
+            self._index.add(len(self._digests), fingerprint)
+
+        self._digests.add(digest)
+        return None
+
+    def filter(self, reviews: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Yield only the reviews that are not duplicates of earlier ones (lazily)."""
+        check = self.check
+        for review in reviews:
+            if check(review) is None:
+                yield review
+
+    def stats(self) -> Dict[str, Any]:
+        """Counts of reviews seen, kept and suppressed."""
+        suppressed = self.exact_duplicates + self.near_duplicates_found
+        return {
+            'reviews_seen': self.reviews_seen,
+            'reviews_kept': self.reviews_seen - suppressed,
+            'exact_duplicates': self.exact_duplicates,
+            'near_duplicates': self.near_duplicates_found,
+            'suppressed': suppressed,
+            'suppression_rate': round((suppressed / self.reviews_seen) * 100, 1) if self.reviews_seen > 0 else 0
+        }
+
+
+class IssueIndex:
+    """
+    Persistent, incrementally updated index of issues found in reviews.
+
+    Issues are keyed by category and keyword. Each key keeps a count,
+    per-version and per-day counters, and references to the most recent
+    review ids (never review text). Category counts and rating sums update
+    on every review, so severity scores and the ranking are always current.
+    A spike alert fires when a category's count for a day reaches
+    spike_ratio times its average over the preceding baseline_days. Spikes
+    are only reported once reviews cover at least min_baseline_days before
+    the day, so a new index does not flag every early issue as a spike.
+    """
+
+    def __init__(
+        self,
+        analyzer: ReviewAnalyzer,
+        rating_threshold: int = 3,
+        max_review_ids: int = 100,
+        spike_ratio: float = 3.0,
+        min_spike_count: int = 10,
+        baseline_days: int = 7,
+        min_baseline_days: int = 3,
+        on_alert: Optional[Callable[[Dict[str, Any]], None]] = None
+    ):
+        """
+        Initialize an empty index.
+
+        Args:
+            analyzer: Analyzer providing issue keywords and severity rules
+            rating_threshold: Only reviews at or below this rating are indexed as issues
+            max_review_ids: Most recent review ids kept per (category, keyword)
+            spike_ratio: Day count / baseline daily average that raises an alert
+            min_spike_count: Smallest day count that can raise an alert
+            baseline_days: Days before the current one averaged for the baseline
+            min_baseline_days: Days of review history needed before spikes are reported
+            on_alert: Optional callback receiving each alert as it fires
+        """
+        if not 0 <= min_baseline_days <= baseline_days:
+            raise ValueError("min_baseline_days must be between 0 and baseline_days")
+
+        self.analyzer = analyzer
+        self.rating_threshold = rating_threshold
+        self.max_review_ids = max_review_ids
+        self.spike_ratio = spike_ratio
+        self.min_spike_count = min_spike_count
+        self.baseline_days = baseline_days
+        self.min_baseline_days = min_baseline_days
+        self.on_alert = on_alert
+
+        self.total_reviews = 0
+        self.total_issues = 0
+        self.first_day: Optional[date] = None
+        self.keyword_counts: Counter = Counter()
+        self._category_counts = {category: 0 for category in ISSUE_CATEGORIES}
+        self._category_rating_sums = {category: 0 for category in ISSUE_CATEGORIES}
+        self._category_days: Dict[str, Counter] = {category: Counter() for category in ISSUE_CATEGORIES}
+        self._entries: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._alerted = set()
+        self.alerts: List[Dict[str, Any]] = []
+
+    def add(self, review: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Index one review.
+
+        Args:
+            review: Review dict ('text', 'rating', optional 'id', 'date', 'version')
+
+        Returns:
+            Alerts raised by this review (usually empty)
+        """
+        self.total_reviews += 1
+        # Every dated review (not only issues) counts towards the baseline history
+        day = _parse_review_day(review.get('date'))
+        if day is not None and (self.first_day is None or day < self.first_day):
+            self.first_day = day
+        rating = review.get('rating', 5)
+        if rating > self.rating_threshold:
+            return []
+
+        analyzer = self.analyzer
+        text = review.get('text', '').lower()
+        matched = analyzer._review_features(review, text, True, False)[0]
+        keywords = [keyword for keyword in analyzer.ISSUE_KEYWORDS if keyword in matched]
+        if not keywords:
+            return []
+
+        category = analyzer._issue_category(keywords)
+        review_id = review.get('id', '')
+        version = str(review.get('version') or 'unknown')
+        day_key = day.isoformat() if day else None
+
+        self.total_issues += 1
+        self.keyword_counts.update(keywords)
+        self._category_counts[category] += 1
+        self._category_rating_sums[category] += rating
+        for keyword in keywords:
+            entry = self._entries.get((category, keyword))
+            if entry is None:
+                entry = {
+                    'count': 0,
+                    'by_version': Counter(),
+                    'by_date': Counter(),
+                    'review_ids': deque(maxlen=self.max_review_ids)
+                }
+                self._entries[(category, keyword)] = entry
+            entry['count'] += 1
+            entry['by_version'][version] += 1
+            if day_key:
+                entry['by_date'][day_key] += 1
+            entry['review_ids'].append(review_id)
+
+        if day is None:
+            return []
+        days = self._category_days[category]
+        days[day_key] += 1
+        return self._check_spike(category, day, days)
+
+    def add_many(self, reviews: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Index a batch of reviews and return the alerts it raised."""
+        alerts = []
+        for review in reviews:
+            alerts.extend(self.add(review))
+        return alerts
+
+    def _check_spike(self, category: str, day: date, days: Counter) -> List[Dict[str, Any]]:
+        """Raise (once per category and day) an alert when the day's count spikes."""
+        day_key = day.isoformat()
+        count = days[day_key]
+        if count < self.min_spike_count or (category, day_key) in self._alerted:
+            return []
+
+        # Average only over days the review history covers
+        history_days = min(self.baseline_days, (day - self.first_day).days)
+        if history_days < self.min_baseline_days:
+            return []
+        baseline = 0.0
+        if history_days > 0:
+            baseline = sum(
+                days.get((day - timedelta(days=offset)).isoformat(), 0)
+                for offset in range(1, history_days + 1)
+            ) / history_days
+        if count < self.spike_ratio * max(baseline, 1):
+            return []
+
+        self._alerted.add((category, day_key))
+        alert = {
+            'category': category,
+            'date': day_key,
+            'day_count': count,
+            'baseline_daily_average': round(baseline, 2),
+            'top_keywords': [
+                keyword for keyword, _ in sorted(
+                    (
+                        (keyword, entry['by_date'].get(day_key, 0))
+                        for (entry_category, keyword), entry in self._entries.items()
+                        if entry_category == category
+                    ),
+                    key=lambda item: -item[1]
+                )[:3]
+            ],
+            **self.severity(category)
+        }
+        self.alerts.append(alert)
+        if self.on_alert is not None:
+            self.on_alert(alert)
+        return [alert]
+
+    def severity(self, category: str) -> Dict[str, Any]:
+        """Current severity of one category (same fields as identify_issues severity_scores)."""
+        return self.analyzer._severity_entry(
+            self._category_counts[category],
+            self._category_rating_sums[category],
+            self.total_reviews
+        )
+
+    def severity_scores(self) -> Dict[str, Dict[str, Any]]:
+        """Severity of every category with issues, in category order."""
+        return {
+            category: self.severity(category)
+            for category in ISSUE_CATEGORIES
+            if self._category_counts[category]
+        }
+
+    def ranked(self) -> List[Dict[str, Any]]:
+        """Categories ranked by current severity (like identify_issues top_issues)."""
+        return self.analyzer._rank_issues_by_severity(self.severity_scores())
+
+    def entry(self, category: str, keyword: str) -> Optional[Dict[str, Any]]:
+        """
+        Counters and review ids for one (category, keyword) key.
+
+        Returns:
+            Dict with count, by_version, by_date and review_ids (most recent last), or None
+        """
+        entry = self._entries.get((category, keyword))
+        if entry is None:
+            return None
+        return {
+            'count': entry['count'],
+            'by_version': dict(entry['by_version']),
+            'by_date': dict(sorted(entry['by_date'].items())),
+            'review_ids': list(entry['review_ids'])
+        }
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Issue report from the index.
+
+        Returns:
+            identify_issues fields without text copies: categorized_issues maps
+            category -> keyword -> entry (see entry())
+        """
+        severity_scores = self.severity_scores()
+        categorized = {}
+        for category, keyword in self._entries:
+            categorized.setdefault(category, {})[keyword] = self.entry(category, keyword)
+
+        return {
+            'total_issues_found': self.total_issues,
+            'issue_frequency': dict(self.keyword_counts.most_common(15)),
+            'categorized_issues': {
+                category: categorized[category] for category in ISSUE_CATEGORIES if category in categorized
+            },
+            'severity_scores': severity_scores,
+            'top_issues': self.analyzer._rank_issues_by_severity(severity_scores),
+            'recommendations': self.analyzer._generate_issue_recommendations({}, severity_scores),
+            'alerts': list(self.alerts)
+        }
+
+    def save(self, path: str) -> str:
+        """
+        Write the index to a JSON file.
+
+        Args:
+            path: Destination
+
+        Returns:
+            Path written
+        """
+        data = {
+            'rating_threshold': self.rating_threshold,
+            'total_reviews': self.total_reviews,
+            'total_issues': self.total_issues,
+            'first_day': self.first_day.isoformat() if self.first_day else None,
+            'keyword_counts': dict(self.keyword_counts),
+            'category_counts': self._category_counts,
+            'category_rating_sums': self._category_rating_sums,
+            'category_days': {category: dict(days) for category, days in self._category_days.items()},
+            'entries': [
+                [category, keyword, self.entry(category, keyword)]
+                for category, keyword in self._entries
+            ],
+            'alerted': sorted(self._alerted),
+            'alerts': self.alerts
+        }
+        with open(path, 'w', encoding='utf-8') as handle:
+            json.dump(data, handle)
+        return path
+
+    def load(self, path: str) -> 'IssueIndex':
+        """
+        Replace this index's state with one saved by save().
+
+        Args:
+            path: JSON file written by save()
+
+        Returns:
+            self, for chaining
+        """
+        with open(path, encoding='utf-8') as handle:
+            data = json.load(handle)
+        if data.get('rating_threshold') != self.rating_threshold:
+            raise ValueError("Saved index uses a different rating threshold")
+
+        self.total_reviews = data['total_reviews']
+        self.total_issues = data['total_issues']
+        self.keyword_counts = Counter(data['keyword_counts'])
+        self._category_counts.update(data['category_counts'])
+        self._category_rating_sums.update(data['category_rating_sums'])
+        self._category_days = {
+            category: Counter(data['category_days'].get(category, {})) for category in ISSUE_CATEGORIES
+        }
+        self._entries = {
+            (category, keyword): {
+                'count': entry['count'],
+                'by_version': Counter(entry['by_version']),
+                'by_date': Counter(entry['by_date']),
+                'review_ids': deque(entry['review_ids'], maxlen=self.max_review_ids)
+            }
+            for category, keyword, entry in data['entries']
+        }
+        self._alerted = {tuple(key) for key in data['alerted']}
+        self.alerts = data['alerts']
+
+        # Indexes saved before first_day was tracked fall back to their earliest issue day
+        self.first_day = _parse_review_day(data.get('first_day'))
+        if self.first_day is None:
+            issue_days = [day_key for days in self._category_days.values() for day_key in days]
+            self.first_day = _parse_review_day(min(issue_days)) if issue_days else None
+        return self
+
+
+def _coerce_csv_review(row: Dict[str, str]) -> Dict[str, Any]:
+    """Convert a CSV row to a review dict (numeric ratings, empty cells dropped)."""
+    review: Dict[str, Any] = {key: value for key, value in row.items() if value not in (None, '')}
+    rating = review.get('rating')
+    if rating is not None:
+        try:
+            number = float(rating)
+            review['rating'] = int(number) if number.is_integer() else number
+        except ValueError:
+            del review['rating']
+    return review
+
+
+def _iter_review_lines(handle: IO, path_hint: str) -> Iterator[Dict[str, Any]]:
+    """Yield reviews from an open text file, as CSV or JSON Lines."""
+    if path_hint.endswith('.csv'):
+        for row in csv.DictReader(handle):
+            yield _coerce_csv_review(row)
+    else:
+        for line in handle:
+            if line.strip():
+                yield json.loads(line)
+
+
+def iter_reviews(source: Union[str, IO, Iterable[Dict[str, Any]]]) -> Iterator[Dict[str, Any]]:
+    """
+    Stream reviews from a file or iterable without loading them all.
+
+    Args:
+        source: Path to .jsonl / .csv (optionally .gz), an open text file
+            (JSON Lines, or CSV if its name ends in .csv), or an iterable of review dicts
+
+    Returns:
+        Iterator of review dicts
+    """
+    if isinstance(source, str):
+        path_hint = source[:-3] if source.endswith('.gz') else source
+        opener = gzip.open if source.endswith('.gz') else io.open
+        with opener(source, 'rt', encoding='utf-8', newline='') as handle:
+            yield from _iter_review_lines(handle, path_hint)
+    elif hasattr(source, 'read'):
+        yield from _iter_review_lines(source, getattr(source, 'name', '') or '')
+    else:
+        yield from source
+
+
+def iter_review_chunks(
+    source: Union[str, IO, Iterable[Dict[str, Any]]],
+    chunk_size: int = 10000
+) -> Iterator[List[Dict[str, Any]]]:
+    """Stream reviews in lists of at most chunk_size."""
+    chunk = []
+    for review in iter_reviews(source):
+        chunk.append(review)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+@lru_cache(maxsize=None)
+def _worker_review_analyzer(
     app_name: str,
+    language: str,
+    sentiment_scorer: Optional[LexiconSentimentScorer] = None
+) -> ReviewAnalyzer:
+    """Per-process analyzer reused across shards (shards are disjoint, so no review cache)."""
+    return ReviewAnalyzer(app_name, language, cache_size=0, sentiment_scorer=sentiment_scorer)
+
+
+def _accumulate_review_shard(
+    settings: Tuple[str, str, Optional[LexiconSentimentScorer]],
     reviews: List[Dict[str, Any]]
+) -> ReviewAccumulator:
+    """Fold one shard of reviews in a worker process."""
+    accumulator = _worker_review_analyzer(*settings).create_accumulator()
+    accumulator.add_many(reviews)
+    return accumulator
+
+
+def analyze_reviews(
+    app_name: str,
+    reviews: List[Dict[str, Any]],
+    deduplicate: bool = False
 ) -> Dict[str, Any]:
     """
     Convenience function to perform comprehensive review analysis.
@@ -700,15 +1993,65 @@ def analyze_reviews(
     Args:
         app_name: App name
         reviews: List of review dictionaries
+        deduplicate: Drop exact and near-duplicate reviews first (adds 'deduplication' stats)
 
     Returns:
         Complete review analysis
     """
     analyzer = ReviewAnalyzer(app_name)
+    analyzer.reviews = reviews
+    deduplicator = ReviewDeduplicator() if deduplicate else None
+    accumulator = analyzer.create_accumulator()
+    accumulator.add_many(deduplicator.filter(reviews) if deduplicator else reviews)
+    report = accumulator.report()
+    if deduplicator is not None:
+        report['deduplication'] = deduplicator.stats()
+    return report
+
+
+def analyze_review_stream(
+    app_name: str,
+    source: Union[str, IO, Iterable[Dict[str, Any]]],
+    chunk_size: int = 10000,
+    deduplicate: bool = False
+) -> Dict[str, Any]:
+    """
+    Convenience function to analyze reviews streamed from a file or iterable.
+
+    Args:
+        app_name: App name
+        source: Path to a .jsonl/.csv file (optionally .gz), an open file, or an iterable
+        chunk_size: Reviews read per chunk
+        deduplicate: Drop exact and near-duplicate reviews first (adds 'deduplication' stats)
+
+    Returns:
+        Complete review analysis (same shape as analyze_reviews)
+    """
+    analyzer = ReviewAnalyzer(app_name)
+    deduplicator = ReviewDeduplicator() if deduplicate else None
+    return analyzer.analyze_stream(source, chunk_size, deduplicator=deduplicator)
+
+
+def analyze_reviews_parallel(
+    app_name: str,
+    source: Union[str, IO, Iterable[Dict[str, Any]]],
+    max_workers: Optional[int] = None,
+    shard_size: int = 20000,
+    deduplicate: bool = False
+) -> Dict[str, Any]:
+    """
+    Convenience function to analyze a large review corpus on all cores.
+
+    Args:
+        app_name: App name
+        source: Path to a .jsonl/.csv file (optionally .gz), an open file, or an iterable
+        max_workers: Worker processes (None = CPU count)
+        shard_size: Reviews per shard
+        deduplicate: Drop exact and near-duplicate reviews first (adds 'deduplication' stats)
 
-    return {
-        'sentiment_analysis': analyzer.analyze_sentiment(reviews),
-        'common_themes': analyzer.extract_common_themes(reviews),
-        'issues_identified': analyzer.identify_issues(reviews),
-        'feature_requests': analyzer.find_feature_requests(reviews)
-    }
+    Returns:
+        Complete review analysis (identical to analyze_reviews on the same reviews)
+    """
+    analyzer = ReviewAnalyzer(app_name)
+    deduplicator = ReviewDeduplicator() if deduplicate else None
+    return analyzer.analyze_parallel(source, max_workers, shard_size, deduplicator=deduplicator)
@@ -0,0 +1,301 @@
+"""
+Lexicon sentiment scoring module for App Store Optimization.
+Scores review text against a weighted token lexicon with negation handling,
+one tokenization pass per review and batch entry points for whole chunks.
+"""
+
+from typing import Dict, List, Any, Optional, Iterable, Tuple, Sequence, Set, Callable
+import re
+
+from text_normalizer import get_stem_table
+
+
+# Words and punctuation; punctuation tokens end a negation window
+_TOKEN_RE = re.compile(r"[\w']+|[.!?;,]")
+_CLAUSE_BREAKS = frozenset('.!?;,')
+
+# Batch tokenization joins a chunk's texts with NUL, which tokenizes on its own
+_TEXT_SEPARATOR = '\x00'
+_BATCH_TOKEN_RE = re.compile(r"[\w']+|[.!?;,\x00]")
+
+# Tokens that flip the polarity of the lexicon hits following them
+DEFAULT_NEGATIONS = frozenset({
+    'not', 'no', 'never', 'none', 'nothing', 'without', 'hardly', 'barely',
+    "don't", 'dont', "doesn't", 'doesnt', "didn't", 'didnt', "isn't", 'isnt',
+    "wasn't", 'wasnt', "aren't", 'arent', "can't", 'cant', 'cannot', "won't",
+    'wont', "wouldn't", 'wouldnt', "shouldn't", 'shouldnt', "couldn't", 'couldnt'
+})
+
+# Default weights (ReviewAnalyzer keyword lists, strongest terms weighted up)
+DEFAULT_LEXICON = {
+    'great': 1.0, 'awesome': 1.0, 'excellent': 1.5, 'amazing': 1.5, 'love': 1.5,
+    'best': 1.0, 'perfect': 1.5, 'fantastic': 1.5, 'wonderful': 1.5,
+    'brilliant': 1.5, 'outstanding': 1.5, 'superb': 1.5,
+    'bad': -1.0, 'terrible': -1.5, 'awful': -1.5, 'horrible': -1.5, 'hate': -1.5,
+    'worst': -1.5, 'useless': -1.5, 'broken': -1.0, 'crash': -1.0, 'bug': -1.0,
+    'slow': -1.0, 'disappointing': -1.0, 'frustrating': -1.0
+}
+
+
+def _tokenize_chunk(texts: Sequence[str]) -> List[List[str]]:
+    """Lowercased tokens of each text, from one tokenizer pass over the joined chunk."""
+    if not texts:
+        return []
+    joined = _TEXT_SEPARATOR.join(texts).lower()
+    if joined.count(_TEXT_SEPARATOR) != len(texts) - 1:
+        # A text contains the separator itself; tokenize texts one by one
+        return [_TOKEN_RE.findall(text.lower()) for text in texts]
+
+    tokens = _BATCH_TOKEN_RE.findall(joined)
+    token_lists = []
+    start = 0
+    for _ in range(len(texts) - 1):
+        end = tokens.index(_TEXT_SEPARATOR, start)
+        token_lists.append(tokens[start:end])
+        start = end + 1
+    token_lists.append(tokens[start:])
+    return token_lists
+
+
+class LexiconSentimentScorer:
+    """
+    Weighted-lexicon sentiment scorer.
+
+    Lexicon entries are single words or multi-word phrases; tokens are folded
+    with the shared stem table, so 'crashes' hits a 'crash' entry. A negation
+    token flips the sign of hits within the next ``negation_window`` tokens,
+    up to the end of the clause. Scores combine the review rating and the text
+    the same way ReviewAnalyzer does (60% rating, 40% text).
+    """
+
+    def __init__(
+        self,
+        lexicon: Optional[Dict[str, float]] = None,
+        negations: Iterable[str] = DEFAULT_NEGATIONS,
+        negation_window: int = 3,
+        text_scale: float = 10.0,
+        language: str = 'en'
+    ):
+        """
+        Build the scorer's lookup tables.
+
+        Args:
+            lexicon: Word or phrase -> weight (positive or negative; default: DEFAULT_LEXICON)
+            negations: Tokens that flip the polarity of following hits
+            negation_window: Tokens after a negation whose polarity is flipped
+            text_scale: Lexicon sum that maps to a text score of 1.0
+            language: Language of the stem table used to fold tokens
+        """
+        if text_scale <= 0:
+            raise ValueError("text_scale must be positive")
+
+        self.language = language
+        self.negation_window = negation_window
+        self.text_scale = text_scale
+        self.negations = frozenset(negation.lower() for negation in negations)
+        self.stem_table = get_stem_table(language)
+
+        stem = self.stem_table.stem
+        self.lexicon: Dict[str, float] = {}
+        self._phrases: Dict[Tuple[str, ...], float] = {}
+        for entry, weight in (DEFAULT_LEXICON if lexicon is None else lexicon).items():
+            words = tuple(stem(word) for word in _TOKEN_RE.findall(entry.lower()))
+            if len(words) == 1:
+                self.lexicon[words[0]] = self.lexicon.get(words[0], 0.0) + weight
+            elif words:
+                self._phrases[words] = self._phrases.get(words, 0.0) + weight
+        # First word -> phrases starting with it, longest first
+        self._phrase_starts: Dict[str, List[Tuple[Tuple[str, ...], float]]] = {}
+        for words, weight in sorted(self._phrases.items(), key=lambda item: -len(item[0])):
+            self._phrase_starts.setdefault(words[0], []).append((words, weight))
+
+    @classmethod
+    def from_keywords(
+        cls,
+        positive: Iterable[str],
+        negative: Iterable[str],
+        **options: Any
+    ) -> 'LexiconSentimentScorer':
+        """Scorer with weight +1 for every positive and -1 for every negative keyword."""
+        lexicon = {keyword: 1.0 for keyword in positive}
+        for keyword in negative:
+            lexicon[keyword] = lexicon.get(keyword, 0.0) - 1.0
+        return cls(lexicon, **options)
+
+    def _key(self) -> Tuple[Any, ...]:
+        """Everything that affects scores (scorers with equal keys score identically)."""
+        return (
+            tuple(sorted(self.lexicon.items())),
+            tuple(sorted(self._phrases.items())),
+            self.negations,
+            self.negation_window,
+            self.text_scale,
+            self.language
+        )
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, LexiconSentimentScorer) and self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle the tables only; the shared stem table is looked up again on load."""
+        state = dict(self.__dict__)
+        del state['stem_table']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore tables and reattach the shared stem table."""
+        self.__dict__.update(state)
+        self.stem_table = get_stem_table(self.language)
+
+    def text_score(self, text: str) -> float:
+        """
+        Raw lexicon sum of a text (negated hits count with flipped sign).
+
+        Args:
+            text: Review text (any case)
+
+        Returns:
+            Sum of matched weights
+        """
+        return self._score_tokens(_TOKEN_RE.findall(text.lower()), self.stem_table.stem)
+
+    def text_scores(self, texts: Sequence[str]) -> List[float]:
+        """
+        Raw lexicon sums of a chunk of texts (same values as text_score per text).
+
+        The chunk is lowercased and tokenized in one pass, and every distinct
+        token is folded and classified once; the per-text scan then skips
+        tokens that can neither hit the lexicon nor open or close a negation.
+
+        Args:
+            texts: Review texts (any case)
+
+        Returns:
+            Sums of matched weights in input order
+        """
+        token_lists = _tokenize_chunk(texts)
+        stem = self.stem_table.stem
+        folded = {token: stem(token) for token in set().union(*token_lists)}
+
+        lexicon = self.lexicon
+        phrase_starts = self._phrase_starts
+        negations = self.negations
+        relevant = {
+            token for token, word in folded.items()
+            if word in lexicon or word in phrase_starts or token in negations or token in _CLAUSE_BREAKS
+        }
+        fold = folded.__getitem__
+        score_tokens = self._score_tokens
+        return [score_tokens(tokens, fold, relevant) for tokens in token_lists]
+
+    def _score_tokens(
+        self,
+        tokens: List[str],
+        fold: Callable[[str], str],
+        relevant: Optional[Set[str]] = None
+    ) -> float:
+        """Lexicon sum of one text's tokens; tokens outside relevant (if given) are skipped unread."""
+        lexicon = self.lexicon
+        negations = self.negations
+        phrase_starts = self._phrase_starts
+        window = self.negation_window
+
+        total = 0.0
+        negated_until = -1
+        skip_until = 0
+        for position, token in enumerate(tokens):
+            if position < skip_until or (relevant is not None and token not in relevant):
+                continue
+            if token in _CLAUSE_BREAKS:
+                negated_until = -1
+                continue
+
+            # Phrases are tried first so entries like 'not working' win over the negation
+            word = fold(token)
+            weight = None
+            if word in phrase_starts:
+                for words, phrase_weight in phrase_starts[word]:
+                    end = position + len(words)
+                    if end <= len(tokens) and all(
+                        fold(tokens[position + offset]) == words[offset]
+                        for offset in range(1, len(words))
+                    ):
+                        weight = phrase_weight
+                        skip_until = end
+                        break
+            if weight is None:
+                if token in negations:
+                    negated_until = position + window
+                    continue
+                weight = lexicon.get(word)
+            if weight is not None:
+                total += -weight if position <= negated_until else weight
+        return total
+
+    def score(self, text: str, rating: float = 3) -> float:
+        """
+        Sentiment score (-1 to 1) from rating and text.
+
+        Args:
+            text: Review text
+            rating: Star rating (1-5)
+
+        Returns:
+            Clamped score, on the same scale as ReviewAnalyzer sentiment scores
+        """
+        rating_score = (rating - 3) / 2
+        final_score = (rating_score * 0.6) + (self.text_score(text) / self.text_scale * 0.4)
+        return max(min(final_score, 1.0), -1.0)
+
+    def score_texts(self, texts: Sequence[str], ratings: Optional[Sequence[float]] = None) -> List[float]:
+        """
+        Score a chunk of texts (batched through text_scores).
+
+        Args:
+            texts: Review texts
+            ratings: Star ratings aligned with texts (default: 3 for all)
+
+        Returns:
+            Scores in input order, equal to score(text, rating) for each pair
+
+        Raises:
+            ValueError: If ratings and texts differ in length
+        """
+        if ratings is None:
+            ratings = [3] * len(texts)
+        elif len(ratings) != len(texts):
+            raise ValueError("texts and ratings must have the same length")
+        text_scale = self.text_scale
+        return [
+            max(min(((rating - 3) / 2) * 0.6 + (text_score / text_scale * 0.4), 1.0), -1.0)
+            for text_score, rating in zip(self.text_scores(texts), ratings)
+        ]
+
+    def score_reviews(self, reviews: Iterable[Dict[str, Any]]) -> List[float]:
+        """Score review dicts ('text', 'rating' defaulting to 3) in input order."""
+        reviews = list(reviews)
+        return self.score_texts(
+            [review.get('text', '') for review in reviews],
+            [review.get('rating', 3) for review in reviews]
+        )
+
+
+def score_review_sentiment(
+    reviews: List[Dict[str, Any]],
+    lexicon: Optional[Dict[str, float]] = None
+) -> List[float]:
+    """
+    Convenience function to score a batch of reviews.
+
+    Args:
+        reviews: Review dicts with 'text' and optional 'rating'
+        lexicon: Word or phrase -> weight (default: DEFAULT_LEXICON)
+
+    Returns:
+        Sentiment scores (-1 to 1) in input order
+    """
+    scorer = LexiconSentimentScorer(lexicon)
+    return scorer.score_reviews(reviews)
@@ -0,0 +1,440 @@
+"""
+Text similarity module for App Store Optimization.
+MinHash signatures with LSH banding for near-duplicate detection, "most similar"
+queries and clustering over large sets of listings or reviews without comparing
+every pair, plus SimHash fingerprints with a banded Hamming-distance index.
+"""
+
+from typing import Dict, List, Optional, Iterable, Hashable, Tuple, Set
+from functools import lru_cache
+from itertools import combinations
+import hashlib
+import re
+
+
+_WORD_RE = re.compile(r'\w+')
+
+# Signature value used for empty bins before densification
+_EMPTY = (1 << 64) - 1
+
+
+_MASK64 = (1 << 64) - 1
+_MIX = 0x9E3779B97F4A7C15
+
+
+@lru_cache(maxsize=1 << 18)
+def _hash64(token: str) -> int:
+    """Stable 64-bit hash (unlike hash(), identical across processes and runs)."""
+    return int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def shingle_hashes(text: str, shingle_size: int = 2) -> Set[int]:
+    """
+    Hash the lowercase word shingles of a text.
+
+    Words are hashed once (cached across documents) and each n-gram hash is
+    combined from its word hashes, so no shingle strings are built.
+
+    Args:
+        text: Text to shingle
+        shingle_size: Words per shingle (texts shorter than this use single words)
+
+    Returns:
+        Set of 64-bit shingle hashes
+    """
+    word_hashes = [_hash64(word) for word in _WORD_RE.findall(text.lower())]
+    if len(word_hashes) < shingle_size or shingle_size <= 1:
+        return set(word_hashes)
+
+    # Fold word j of every n-gram in at once (one list pass per word position)
+    count = len(word_hashes) - shingle_size + 1
+    values = [(word_hash * _MIX) & _MASK64 for word_hash in word_hashes[:count]]
+    for offset in range(1, shingle_size):
+        values = [
+            ((value ^ word_hash) * _MIX) & _MASK64
+            for value, word_hash in zip(values, word_hashes[offset:])
+        ]
+    return {value ^ (value >> 31) for value in values}
+
+
+def minhash_signature(hashes: Iterable[int], num_perm: int = 64) -> Optional[Tuple[int, ...]]:
+    """
+    Compute a one-permutation MinHash signature with rotation densification.
+
+    Each shingle hash picks a bin and the minimum value per bin is kept.
+    Empty bins borrow the next non-empty bin's value (plus an offset per
+    step) so that signatures stay comparable position by position.
+
+    Args:
+        hashes: 64-bit shingle hashes of one document (see shingle_hashes)
+        num_perm: Signature length
+
+    Returns:
+        Signature tuple, or None for a document without shingles
+    """
+    bins = [_EMPTY] * num_perm
+    for value in hashes:
+        index = value % num_perm
+        value //= num_perm
+        if value < bins[index]:
+            bins[index] = value
+
+    filled = [i for i, value in enumerate(bins) if value != _EMPTY]
+    if not filled:
+        return None
+    if len(filled) < num_perm:
+        offset = _EMPTY // num_perm
+        dense = list(bins)
+        for i in range(num_perm):
+            if bins[i] == _EMPTY:
+                step = 1
+                while bins[(i + step) % num_perm] == _EMPTY:
+                    step += 1
+                dense[i] = bins[(i + step) % num_perm] + step * offset
+        bins = dense
+    return tuple(bins)
+
+
+def estimate_jaccard(signature_a: Tuple[int, ...], signature_b: Tuple[int, ...]) -> float:
+    """Estimated Jaccard similarity of two documents from their signatures."""
+    matches = sum(1 for a, b in zip(signature_a, signature_b) if a == b)
+    return matches / len(signature_a)
+
+
+class MinHashLSHIndex:
+    """MinHash + LSH banding index for approximate Jaccard similarity search."""
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, shingle_size: int = 2):
+        """
+        Initialize an empty index.
+
+        With b bands of r rows, pairs with Jaccard similarity s become candidates
+        with probability 1 - (1 - s^r)^b (threshold around (1/b)^(1/r)).
+
+        Args:
+            num_perm: Signature length (must be divisible by bands)
+            bands: Number of LSH bands
+            shingle_size: Words per shingle
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self._signatures: Dict[Hashable, Tuple[int, ...]] = {}
+        self._order: Dict[Hashable, int] = {}
+        self._next_order = 0
+        self._buckets: List[Dict[Tuple[int, ...], List[Hashable]]] = [{} for _ in range(bands)]
+
+    def __len__(self) -> int:
+        """Number of indexed documents."""
+        return len(self._signatures)
+
+    def __contains__(self, item_id: Hashable) -> bool:
+        """True when a document id is indexed."""
+        return item_id in self._signatures
+
+    def signature(self, text: str) -> Optional[Tuple[int, ...]]:
+        """Signature of a text using this index's shingling and length."""
+        return minhash_signature(shingle_hashes(text, self.shingle_size), self.num_perm)
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> Iterable[Tuple[int, Tuple[int, ...]]]:
+        """Yield (band, bucket key) pairs for a signature."""
+        rows = self.rows
+        for band in range(self.bands):
+            yield band, signature[band * rows:(band + 1) * rows]
+
+    def add(self, item_id: Hashable, text: str) -> bool:
+        """
+        Index a document (re-adding an id replaces its text).
+
+        Args:
+            item_id: Document identifier
+            text: Document text
+
+        Returns:
+            False when the text has no words and was not indexed
+        """
+        if item_id in self._signatures:
+            self.remove(item_id)
+
+        signature = self.signature(text)
+        if signature is None:
+            return False
+
+        self._signatures[item_id] = signature
+        # Order ids only grow, so ids stay unique after remove() and re-add
+        self._order[item_id] = self._next_order
+        self._next_order += 1
+        for band, key in self._band_keys(signature):
+            self._buckets[band].setdefault(key, []).append(item_id)
+        return True
+
+    def remove(self, item_id: Hashable) -> None:
+        """Drop a document from the index."""
+        signature = self._signatures.pop(item_id, None)
+        if signature is None:
+            return
+        del self._order[item_id]
+        for band, key in self._band_keys(signature):
+            bucket = self._buckets[band][key]
+            bucket.remove(item_id)
+            if not bucket:
+                del self._buckets[band][key]
+
+    def _candidates(self, signature: Tuple[int, ...]) -> Set[Hashable]:
+        """Ids sharing at least one band bucket with a signature."""
+        candidates = set()
+        for band, key in self._band_keys(signature):
+            candidates.update(self._buckets[band].get(key, ()))
+        return candidates
+
+    def query(
+        self,
+        text: Optional[str] = None,
+        top_n: int = 10,
+        min_similarity: float = 0.0,
+        signature: Optional[Tuple[int, ...]] = None,
+        exclude: Optional[Hashable] = None
+    ) -> List[Tuple[Hashable, float]]:
+        """
+        Find indexed documents most similar to a text.
+
+        Args:
+            text: Query text (ignored when signature is given)
+            top_n: Maximum results
+            min_similarity: Minimum estimated Jaccard similarity
+            signature: Precomputed query signature
+            exclude: Document id to leave out of the results (e.g. the query itself)
+
+        Returns:
+            (item_id, estimated_similarity) pairs, most similar first, ties in indexing order
+        """
+        if signature is None:
+            signature = self.signature(text or '')
+        if signature is None:
+            return []
+
+        scored = []
+        for item_id in self._candidates(signature):
+            if item_id == exclude:
+                continue
+            similarity = estimate_jaccard(signature, self._signatures[item_id])
+            if similarity >= min_similarity:
+                scored.append((item_id, similarity))
+
+        scored.sort(key=lambda pair: (-pair[1], self._order[pair[0]]))
+        return scored[:top_n]
+
+    def similar_to(
+        self,
+        item_id: Hashable,
+        top_n: int = 10,
+        min_similarity: float = 0.0
+    ) -> List[Tuple[Hashable, float]]:
+        """Indexed documents most similar to an indexed document."""
+        signature = self._signatures.get(item_id)
+        if signature is None:
+            return []
+        return self.query(
+            top_n=top_n,
+            min_similarity=min_similarity,
+            signature=signature,
+            exclude=item_id
+        )
+
+    def clusters(self, min_similarity: float = 0.5, min_size: int = 2) -> List[List[Hashable]]:
+        """
+        Group documents whose estimated similarity links them (single linkage).
+
+        Only LSH candidate pairs are compared, and pairs already in the same
+        cluster are skipped, so cost grows with candidate pairs, not all pairs.
+
+        Args:
+            min_similarity: Estimated Jaccard similarity needed to link two documents
+            min_size: Smallest cluster returned
+
+        Returns:
+            Clusters (members in indexing order), largest first
+        """
+        parent = {item_id: item_id for item_id in self._signatures}
+
+        def find(item_id):
+            root = item_id
+            while parent[root] != root:
+                root = parent[root]
+            while parent[item_id] != root:
+                parent[item_id], item_id = root, parent[item_id]
+            return root
+
+        order = self._order
+        for item_id in sorted(self._signatures, key=order.__getitem__):
+            signature = self._signatures[item_id]
+            for other in self._candidates(signature):
+                if order[other] <= order[item_id]:
+                    continue
+                root_a, root_b = find(item_id), find(other)
+                if root_a == root_b:
+                    continue
+                if estimate_jaccard(signature, self._signatures[other]) >= min_similarity:
+                    if order[root_a] < order[root_b]:
+                        parent[root_b] = root_a
+                    else:
+                        parent[root_a] = root_b
+
+        groups: Dict[Hashable, List[Hashable]] = {}
+        for item_id in sorted(self._signatures, key=order.__getitem__):
+            groups.setdefault(find(item_id), []).append(item_id)
+
+        clusters = [members for members in groups.values() if len(members) >= min_size]
+        clusters.sort(key=lambda members: (-len(members), order[members[0]]))
+        return clusters
+
+
+@lru_cache(maxsize=None)
+def _spread_tables(lane_bits: int) -> Tuple[Tuple[int, ...], ...]:
+    """Per byte of a 64-bit hash: byte value -> its 8 bits spread into counter lanes."""
+    tables = []
+    for byte_index in range(8):
+        table = []
+        for value in range(256):
+            spread = 0
+            for bit in range(8):
+                if value >> bit & 1:
+                    spread |= 1 << ((byte_index * 8 + bit) * lane_bits)
+            table.append(spread)
+        tables.append(tuple(table))
+    return tuple(tables)
+
+
+def simhash(hashes: Iterable[int]) -> int:
+    """
+    64-bit SimHash fingerprint of a document's feature hashes.
+
+    Bit i is set when most features have bit i set. The 64 per-bit counts
+    are kept as lanes of one integer, just wide enough for the feature
+    count, so each feature costs eight table lookups and additions instead
+    of 64 per-bit updates.
+
+    Args:
+        hashes: 64-bit feature hashes (e.g. from shingle_hashes)
+
+    Returns:
+        Fingerprint (0 for a document without features)
+    """
+    hashes = hashes if isinstance(hashes, (set, frozenset, list, tuple)) else list(hashes)
+    count = len(hashes)
+    lane_bits = max(count.bit_length(), 1)
+    t0, t1, t2, t3, t4, t5, t6, t7 = _spread_tables(lane_bits)
+    lanes = 0
+    for value in hashes:
+        lanes += (
+            t0[value & 255] + t1[value >> 8 & 255] + t2[value >> 16 & 255] + t3[value >> 24 & 255]
+            + t4[value >> 32 & 255] + t5[value >> 40 & 255] + t6[value >> 48 & 255] + t7[value >> 56 & 255]
+        )
+
+    fingerprint = 0
+    lane_mask = (1 << lane_bits) - 1
+    for bit in range(64):
+        if (lanes >> (bit * lane_bits) & lane_mask) * 2 > count:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(fingerprint_a: int, fingerprint_b: int) -> int:
+    """Number of differing bits between two fingerprints."""
+    return bin(fingerprint_a ^ fingerprint_b).count('1')
+
+
+class SimHashIndex:
+    """
+    Banded index answering "is there a fingerprint within k bits" queries.
+
+    Fingerprints are split into k + r bands. Two fingerprints at Hamming
+    distance k or less agree exactly on at least r bands, so one table per
+    combination of r bands, keyed by those bands' bits, finds every match
+    while comparing only documents that share a key. r = 1 is the classic
+    k + 1 band scheme; larger r gives longer keys (fewer candidates per
+    query) for larger k at the cost of more tables. Every table holds one
+    entry per indexed fingerprint, so memory grows as C(k + r, r) x items.
+    """
+
+    def __init__(self, max_distance: int = 3, exact_bands: int = 1):
+        """
+        Initialize an empty index.
+
+        Args:
+            max_distance: Largest Hamming distance reported as a match (0-63)
+            exact_bands: Bands per table key (r)
+        """
+        if not 0 <= max_distance < 64:
+            raise ValueError("max_distance must be between 0 and 63")
+        if exact_bands < 1 or max_distance + exact_bands > 64:
+            raise ValueError("exact_bands must be at least 1 and leave bands of one bit or more")
+
+        self.max_distance = max_distance
+        self.exact_bands = exact_bands
+        bands = max_distance + exact_bands
+        bounds = [64 * band // bands for band in range(bands + 1)]
+        band_masks = [((1 << (bounds[i + 1] - bounds[i])) - 1) << bounds[i] for i in range(bands)]
+        self._key_masks = [
+            sum(band_masks[band] for band in combination)
+            for combination in combinations(range(bands), exact_bands)
+        ]
+        self._tables: List[Dict[int, List[Hashable]]] = [{} for _ in self._key_masks]
+        self._fingerprints: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        """Number of indexed fingerprints."""
+        return len(self._fingerprints)
+
+    def add(self, item_id: Hashable, fingerprint: int) -> None:
+        """Index a fingerprint under an id (ids are expected to be new)."""
+        self._fingerprints[item_id] = fingerprint
+        for mask, table in zip(self._key_masks, self._tables):
+            table.setdefault(fingerprint & mask, []).append(item_id)
+
+    def nearest(self, fingerprint: int) -> Optional[Tuple[Hashable, int]]:
+        """
+        Closest indexed fingerprint within max_distance.
+
+        Returns:
+            (item_id, distance) of the closest match, or None
+        """
+        best = None
+        best_distance = self.max_distance + 1
+        fingerprints = self._fingerprints
+        for mask, table in zip(self._key_masks, self._tables):
+            for item_id in table.get(fingerprint & mask, ()):
+                distance = hamming_distance(fingerprint, fingerprints[item_id])
+                if distance < best_distance:
+                    best, best_distance = item_id, distance
+                    if distance == 0:
+                        return best, 0
+        return (best, best_distance) if best is not None else None
+
+
+def cluster_texts(
+    texts: Dict[Hashable, str],
+    min_similarity: float = 0.5,
+    num_perm: int = 64,
+    bands: int = 16
+) -> List[List[Hashable]]:
+    """
+    Convenience function to cluster near-duplicate texts.
+
+    Args:
+        texts: id -> text
+        min_similarity: Estimated Jaccard similarity needed to link two texts
+        num_perm: Signature length
+        bands: Number of LSH bands
+
+    Returns:
+        Clusters of ids, largest first
+    """
+    index = MinHashLSHIndex(num_perm=num_perm, bands=bands)
+    for item_id, text in texts.items():
+        index.add(item_id, text)
+    return index.clusters(min_similarity=min_similarity)
@@ -0,0 +1,363 @@
+"""
+Text normalization module for App Store Optimization.
+Shared tokenization (word and n-gram generators, per-language stop words),
+keyword normalization (plural folding) and multi-keyword matching for
+metadata, keyword, competitor and review analysis.
+"""
+
+from typing import Dict, List, Iterable, Iterator, FrozenSet, Optional, Callable, Tuple, Sequence
+from functools import lru_cache
+import re
+
+
+# English words ending in "s" that are already singular (or have no singular)
+_EN_INVARIANT_WORDS = frozenset({
+    'news', 'series', 'species', 'always', 'perhaps', 'sometimes', 'afterwards',
+    'towards', 'across', 'unless', 'whereas', 'thanks', 'kudos', 'chaos', 'cosmos',
+    'ethos', 'pathos', 'lens', 'canvas', 'atlas', 'alias', 'bias', 'christmas',
+    'means', 'headquarters', 'scissors', 'clothes', 'jeans', 'pants', 'shorts',
+    'abs', 'pilates', 'diabetes', 'aerobics', 'analytics', 'athletics', 'economics',
+    'electronics', 'ethics', 'genetics', 'graphics', 'gymnastics', 'linguistics',
+    'logistics', 'mathematics', 'maths', 'physics', 'politics', 'robotics', 'statistics',
+    'ios', 'ipados', 'macos', 'tvos', 'watchos', 'gps', 'sms', 'dns', 'aws', 'saas',
+    'paas', 'rss', 'css', 'yes', 'this', 'its', 'his', 'hers', 'ours', 'yours',
+    'theirs', 'was', 'has', 'does', 'goes', 'plus',
+})
+
+# English irregular plurals, plurals whose singular keeps a trailing "e" and
+# -es plurals of singulars ending in "s" (buses, not buse)
+_EN_IRREGULAR_PLURALS = {
+    'children': 'child', 'people': 'person', 'men': 'man', 'women': 'woman',
+    'mice': 'mouse', 'feet': 'foot', 'teeth': 'tooth', 'geese': 'goose',
+    'lives': 'life', 'wives': 'wife', 'knives': 'knife', 'leaves': 'leaf',
+    'halves': 'half', 'selves': 'self', 'shelves': 'shelf', 'wolves': 'wolf',
+    'thieves': 'thief', 'loaves': 'loaf', 'calves': 'calf',
+    'indices': 'index', 'matrices': 'matrix', 'vertices': 'vertex',
+    'analyses': 'analysis', 'crises': 'crisis', 'diagnoses': 'diagnosis',
+    'theses': 'thesis', 'criteria': 'criterion', 'phenomena': 'phenomenon',
+    'heroes': 'hero', 'potatoes': 'potato', 'tomatoes': 'tomato', 'echoes': 'echo',
+    'quizzes': 'quiz', 'menus': 'menu', 'gurus': 'guru',
+    'movies': 'movie', 'cookies': 'cookie', 'calories': 'calorie', 'zombies': 'zombie',
+    'selfies': 'selfie', 'rookies': 'rookie', 'hoodies': 'hoodie', 'goodies': 'goodie',
+    'smoothies': 'smoothie', 'brownies': 'brownie', 'foodies': 'foodie',
+    'newbies': 'newbie', 'freebies': 'freebie', 'genies': 'genie', 'techies': 'techie',
+    'caches': 'cache', 'niches': 'niche', 'aches': 'ache', 'headaches': 'headache',
+    'cliches': 'cliche', 'avalanches': 'avalanche', 'psyches': 'psyche',
+    'quiches': 'quiche', 'moustaches': 'moustache',
+    'buses': 'bus', 'gases': 'gas', 'bonuses': 'bonus', 'viruses': 'virus',
+    'campuses': 'campus', 'statuses': 'status', 'focuses': 'focus', 'geniuses': 'genius',
+    'choruses': 'chorus', 'censuses': 'census', 'syllabuses': 'syllabus',
+}
+
+
+def _singularize_en(
+    word: str,
+    invariant: FrozenSet[str],
+    irregular: Dict[str, str]
+) -> str:
+    """Fold an English plural to its singular; unknown or singular words pass through."""
+    if len(word) <= 3 or word in invariant:
+        return word
+
+    singular = irregular.get(word)
+    if singular is not None:
+        return singular
+
+    if not word.endswith('s') or word.endswith(('ss', 'us', 'is')):
+        return word
+
+    if word.endswith('ies') and len(word) > 4:
+        return word[:-3] + 'y'
+    if word.endswith(('sses', 'ches', 'shes', 'xes', 'zzes')):
+        return word[:-2]
+    if word.endswith('ses') and word[:-2] in invariant:
+        # lenses, canvases, aliases: plurals of the s-final singulars above
+        return word[:-2]
+    return word[:-1]
+
+
+class StemTable:
+    """Per-language plural/stem lookup with an LRU cache in front of the rules."""
+
+    def __init__(
+        self,
+        language: str,
+        invariant: Iterable[str] = (),
+        irregular: Optional[Dict[str, str]] = None,
+        rule: Optional[Callable[[str, FrozenSet[str], Dict[str, str]], str]] = None,
+        cache_size: int = 65536
+    ):
+        """
+        Initialize a stem table.
+
+        Args:
+            language: Two-letter language code
+            invariant: Words that must never be folded
+            irregular: Precomputed plural -> singular table
+            rule: Fallback folding rule for words not in the tables (default: identity)
+            cache_size: Maximum distinct tokens kept in the LRU cache
+        """
+        self.language = language
+        self.invariant = frozenset(invariant)
+        self.irregular = dict(irregular or {})
+        self._rule = rule
+        self.stem = lru_cache(maxsize=cache_size)(self._stem_uncached)
+
+    def _stem_uncached(self, token: str) -> str:
+        """Fold one token (cached through self.stem)."""
+        word = token.lower()
+        if self._rule is None:
+            return self.irregular.get(word, word)
+        return self._rule(word, self.invariant, self.irregular)
+
+    def stem_all(self, tokens: Iterable[str]) -> List[str]:
+        """Fold every token, preserving order."""
+        stem = self.stem
+        return [stem(token) for token in tokens]
+
+    def dedupe(self, keywords: Iterable[str]) -> List[str]:
+        """Fold keywords and drop repeats, keeping first occurrence order."""
+        stem = self.stem
+        seen = set()
+        deduplicated = []
+        for keyword in keywords:
+            folded = stem(keyword)
+            if folded not in seen:
+                seen.add(folded)
+                deduplicated.append(folded)
+        return deduplicated
+
+
+# Languages with folding rules; others fall back to lowercase identity
+_LANGUAGE_RULES = {
+    'en': (_EN_INVARIANT_WORDS, _EN_IRREGULAR_PLURALS, _singularize_en),
+}
+
+
+@lru_cache(maxsize=None)
+def _stem_table_for(language: str) -> StemTable:
+    invariant, irregular, rule = _LANGUAGE_RULES.get(language, ((), {}, None))
+    return StemTable(language, invariant, irregular, rule)
+
+
+def get_stem_table(language: str = 'en') -> StemTable:
+    """
+    Return the shared stem table for a language.
+
+    Args:
+        language: Language or locale code (e.g. 'en', 'en-US')
+
+    Returns:
+        Shared StemTable instance (one per language, built once per process)
+    """
+    return _stem_table_for(language.split('-')[0].lower())
+
+
+def singularize(token: str, language: str = 'en') -> str:
+    """
+    Fold a token to its singular form using the shared table.
+
+    Examples:
+        >>> singularize("trackers")
+        "tracker"
+
+        >>> singularize("business")
+        "business"
+    """
+    return get_stem_table(language).stem(token)
+
+
+# Word tokens are maximal runs of \w characters (same as re.sub(r'[^\w\s]', ' ', text).split())
+_WORD_RE = re.compile(r'\w+')
+
+# ASCII fast path: map every ASCII character that is neither a word character
+# nor whitespace to a space, then split (about 1.5x faster than the regex)
+_ASCII_SEPARATORS = str.maketrans({
+    code: ' ' for code in range(128)
+    if not (chr(code).isalnum() or chr(code) == '_' or chr(code).isspace())
+})
+
+# Function words dropped by keyword, theme and competitor analysis
+_STOP_WORDS = {
+    'en': frozenset({
+        'the', 'and', 'for', 'with', 'this', 'that', 'from', 'have',
+        'but', 'not', 'you', 'all', 'can', 'are', 'was', 'were', 'been'
+    }),
+}
+
+
+def split_words(text: str, lower: bool = True) -> List[str]:
+    """
+    Split text into word tokens.
+
+    Args:
+        text: Text to split
+        lower: Lowercase the text first
+
+    Returns:
+        Word tokens in order (punctuation and whitespace removed)
+    """
+    if lower:
+        text = text.lower()
+    if text.isascii():
+        return text.translate(_ASCII_SEPARATORS).split()
+    return _WORD_RE.findall(text)
+
+
+def iter_ngrams(tokens: Sequence[str], n: int = 2) -> Iterator[str]:
+    """Yield space-joined n-grams of consecutive tokens."""
+    if n == 1:
+        yield from tokens
+    elif n == 2:
+        for first, second in zip(tokens, tokens[1:]):
+            yield f"{first} {second}"
+    else:
+        for start in range(len(tokens) - n + 1):
+            yield ' '.join(tokens[start:start + n])
+
+
+@lru_cache(maxsize=None)
+def _stop_words_for(language: str) -> FrozenSet[str]:
+    return _STOP_WORDS.get(language, frozenset())
+
+
+def get_stop_words(language: str = 'en') -> FrozenSet[str]:
+    """
+    Return the shared stop-word set for a language.
+
+    Args:
+        language: Language or locale code (e.g. 'en', 'en-US')
+
+    Returns:
+        Frozen stop-word set (empty for languages without a list)
+    """
+    return _stop_words_for(language.split('-')[0].lower())
+
+
+class Tokenizer:
+    """Word tokenizer with length and stop-word filtering and optional plural folding."""
+
+    def __init__(
+        self,
+        language: str = 'en',
+        min_length: int = 1,
+        extra_stop_words: Iterable[str] = (),
+        stem: bool = False
+    ):
+        """
+        Initialize a tokenizer.
+
+        Args:
+            language: Language or locale code (selects stop words and stem table)
+            min_length: Shortest token kept (checked before folding)
+            extra_stop_words: Words dropped in addition to the language's stop words
+            stem: Fold tokens to singular form with the shared stem table
+        """
+        self.language = language
+        self.min_length = min_length
+        self.stop_words = get_stop_words(language) | frozenset(extra_stop_words)
+        self._stem = get_stem_table(language).stem if stem else None
+
+    def tokens(self, text: str) -> List[str]:
+        """Filtered (and optionally folded) lowercase tokens of a text, in order."""
+        stop_words = self.stop_words
+        min_length = self.min_length
+        stem = self._stem
+        if stem is None:
+            return [word for word in split_words(text) if len(word) >= min_length and word not in stop_words]
+        return [stem(word) for word in split_words(text) if len(word) >= min_length and word not in stop_words]
+
+    def iter_tokens(self, texts: Iterable[str]) -> Iterator[List[str]]:
+        """Yield the token list of each text."""
+        tokens = self.tokens
+        for text in texts:
+            yield tokens(text)
+
+    def ngrams(self, text: str, n: int = 2) -> List[str]:
+        """N-grams over a text's filtered tokens (an n-gram may span dropped stop words)."""
+        return list(iter_ngrams(self.tokens(text), n))
+
+
+@lru_cache(maxsize=64)
+def get_tokenizer(
+    language: str = 'en',
+    min_length: int = 1,
+    extra_stop_words: FrozenSet[str] = frozenset(),
+    stem: bool = False
+) -> Tokenizer:
+    """
+    Return a shared tokenizer for a configuration (built once per process).
+
+    Args:
+        language: Language or locale code
+        min_length: Shortest token kept
+        extra_stop_words: Additional stop words (a frozenset, so it can be cached)
+        stem: Fold tokens to singular form
+
+    Returns:
+        Tokenizer instance
+    """
+    return Tokenizer(language, min_length, extra_stop_words, stem)
+
+
+class KeywordAutomaton:
+    """
+    Matches many literal keywords against a text.
+
+    Positional queries (iter_matches) use a single zero-width lookahead
+    alternation, longest keyword first, so each text position reports its
+    longest keyword; shorter keywords starting at the same position are its
+    prefixes and come from a precomputed prefix table. Membership queries
+    (contains_any, matched_keywords) test each distinct keyword once with the
+    built-in substring search: for the 44 review detector keywords on
+    review-length texts that is 4-5x faster than scanning with the regex,
+    since ``re`` tries the alternation at every position. Matching is plain
+    substring matching, like ``keyword in text`` (no word boundaries).
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Compile keywords (lowercased, duplicates removed).
+
+        Args:
+            keywords: Literal keywords or phrases to find
+        """
+        self.keywords: Tuple[str, ...] = tuple(dict.fromkeys(
+            keyword.lower() for keyword in keywords if keyword
+        ))
+        ordered = sorted(self.keywords, key=len, reverse=True)
+        self._pattern = re.compile(
+            '(?=(' + '|'.join(re.escape(keyword) for keyword in ordered) + '))'
+        ) if ordered else None
+        self._prefixes: Dict[str, Tuple[str, ...]] = {
+            keyword: tuple(
+                other for other in self.keywords
+                if other != keyword and keyword.startswith(other)
+            )
+            for keyword in self.keywords
+        }
+
+    def contains_any(self, text_lower: str) -> bool:
+        """True when any keyword occurs in an already-lowercased text."""
+        return any(keyword in text_lower for keyword in self.keywords)
+
+    def iter_matches(self, text_lower: str) -> Iterator[Tuple[int, str]]:
+        """
+        Yield (position, keyword) for every keyword occurrence, overlaps included.
+
+        Args:
+            text_lower: Already-lowercased text
+        """
+        if self._pattern is None:
+            return
+        prefixes = self._prefixes
+        for match in self._pattern.finditer(text_lower):
+            position = match.start()
+            keyword = match.group(1)
+            yield position, keyword
+            for prefix in prefixes[keyword]:
+                yield position, prefix
+
+    def matched_keywords(self, text_lower: str) -> List[str]:
+        """Keywords occurring at least once, in keyword order."""
+        return [keyword for keyword in self.keywords if keyword in text_lower]
@@ -0,0 +1,6 @@
+"""Shared pytest setup: make the ASO modules importable by their plain names."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app-store-optimization"))
@@ -0,0 +1,163 @@
+"""Tests for ab_test_planner.py."""
+
+import pytest
+from ab_test_planner import ABTestPlanner
+
+
+def _track(planner, test_id, conversions_b):
+    """One sequential look: 10% vs conversions_b over 10,000 visitors per variant."""
+    return planner.track_test_results(
+        test_id,
+        {
+            "variant_a_conversions": 1000,
+            "variant_a_visitors": 10000,
+            "variant_b_conversions": conversions_b,
+            "variant_b_visitors": 10000,
+            "required_sample_size": 100000,
+        },
+        sequential=True,
+    )
+
+
+def test_sequential_stop_replaces_progress_recommendation():
+    planner = ABTestPlanner()
+    test_id = planner.design_test("title", {}, {}, "Shorter title converts better")["test_id"]
+
+    report = _track(planner, test_id, 1300)
+
+    assert report["progress"]["progress_percentage"] == 20.0
+    assert report["sequential"]["can_stop_early"]
+    assert report["progress"]["is_complete"]
+    assert len(report["recommendations"]) == 1
+    assert "safe to conclude" in report["recommendations"][0]
+    assert not any("continue collecting" in text for text in report["recommendations"])
+
+
+def test_sequential_stop_agrees_with_implementation_threshold():
+    planner = ABTestPlanner()
+    test_id = planner.design_test("title", {}, {}, "Shorter title converts better")["test_id"]
+
+    report = _track(planner, test_id, 1300)
+
+    assert report["sequential"]["alpha"] == 0.05
+    assert report["sequential"]["always_valid_p_value"] < 0.05
+    assert report["sequential"]["decision"]["decision"] == "implement_b"
+    assert report["current_results"]["decision"]["decision"] == "implement_b"
+    assert report["next_steps"].startswith("Implement Variant B")
+
+
+def test_sequential_does_not_stop_between_90_and_95_percent_evidence():
+    planner = ABTestPlanner()
+    test_id = planner.design_test("title", {}, {}, "Shorter title converts better")["test_id"]
+
+    report = _track(planner, test_id, 1145)
+
+    assert 0.05 < report["sequential"]["always_valid_p_value"] < 0.10
+    assert not report["sequential"]["can_stop_early"]
+    assert report["sequential"]["decision"]["decision"] == "continue"
+    assert not report["progress"]["is_complete"]
+
+
+def test_significance_batch_matches_calculate_significance():
+    planner = ABTestPlanner()
+    tests = [(100, 1000, 130, 1000), (500, 10000, 480, 9800), (0, 0, 5, 50), (7, 20, 7, 20), (0, 400, 12, 400)]
+
+    batch = planner.calculate_significance_batch(*zip(*tests))
+
+    for index, test in enumerate(tests):
+        single = planner.calculate_significance(*test)
+        analysis = single["statistical_analysis"]
+        assert round(batch["conversion_rate_a"][index], 4) == single["variant_a"]["conversion_rate"]
+        assert round(batch["conversion_rate_b"][index], 4) == single["variant_b"]["conversion_rate"]
+        assert round(batch["absolute_improvement"][index], 4) == single["improvement"]["absolute"]
+        assert round(batch["relative_improvement"][index] * 100, 2) == single["improvement"]["relative_percentage"]
+        assert round(batch["z_scores"][index], 3) == analysis["z_score"]
+        assert round(batch["p_values"][index], 4) == analysis["p_value"]
+        assert batch["is_significant_95"][index] == analysis["is_significant_95"]
+        assert batch["is_significant_90"][index] == analysis["is_significant_90"]
+
+
+def test_significance_batch_empty_and_mismatched_lengths():
+    planner = ABTestPlanner()
+
+    assert planner.calculate_significance_batch([], [], [], []) == {
+        "conversion_rate_a": [],
+        "conversion_rate_b": [],
+        "absolute_improvement": [],
+        "relative_improvement": [],
+        "z_scores": [],
+        "p_values": [],
+        "is_significant_95": [],
+        "is_significant_90": [],
+    }
+    with pytest.raises(ValueError, match="same length"):
+        planner.calculate_significance_batch([1, 2], [10, 20], [1], [10, 20])
+
+
+@pytest.mark.parametrize("confidence_level", ["high", "standard", "exploratory"])
+def test_sample_size_grid_cells_match_calculate_sample_size(confidence_level):
+    planner = ABTestPlanner()
+    baselines = [0.02, 0.05, 0.31]
+    effects = [0.03, 0.1, 0.25]
+    powers = [0.8, 0.9]
+
+    grid = planner.calculate_sample_size_grid(baselines, effects, powers, confidence_level)
+
+    assert len(grid["rows"]) == len(baselines) * len(effects) * len(powers)
+    for b, baseline in enumerate(baselines):
+        for e, effect in enumerate(effects):
+            for p, power in enumerate(powers):
+                single = planner.calculate_sample_size(baseline, effect, confidence_level, power)
+                assert grid["sample_size_per_variant"][b][e][p] == single["sample_size_per_variant"]
+    for row in grid["rows"]:
+        single = planner.calculate_sample_size(
+            row["baseline_conversion"], row["minimum_detectable_effect"], confidence_level, row["statistical_power"]
+        )
+        assert row["total_sample_size"] == single["total_sample_size"]
+
+
+def test_sample_size_grid_empty_axes_and_bad_power():
+    planner = ABTestPlanner()
+
+    assert planner.calculate_sample_size_grid([], [0.1])["sample_size_per_variant"] == []
+    assert planner.calculate_sample_size_grid([0.05], [])["rows"] == []
+    assert planner.calculate_sample_size_grid([0.05], [0.1], powers=[])["sample_size_per_variant"] == [[[]]]
+    with pytest.raises(ValueError, match="Percentile"):
+        planner.calculate_sample_size_grid([0.05], [0.1], powers=[1.0])
+
+
+@pytest.mark.parametrize(
+    ("percentile", "z_score"),
+    [
+        (0.5, 0.0),
+        (0.8, 0.8416212335729143),
+        (0.9, 1.2815515655446004),
+        (0.95, 1.6448536269514722),
+        (0.975, 1.959963984540054),
+        (0.99, 2.3263478740408408),
+        (0.995, 2.5758293035489004),
+        (0.025, -1.959963984540054),
+    ],
+)
+def test_z_score_matches_known_normal_quantiles(percentile, z_score):
+    planner = ABTestPlanner()
+
+    assert planner._get_z_score(percentile) == pytest.approx(z_score, abs=1e-12)
+    assert planner._standard_normal_cdf(z_score) == pytest.approx(percentile, abs=1e-12)
+
+
+@pytest.mark.parametrize("percentile", [0.0, 1.0, -0.1, 1.5])
+def test_z_score_rejects_percentiles_outside_the_open_unit_interval(percentile):
+    planner = ABTestPlanner()
+
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        planner._get_z_score(percentile)
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        planner._get_z_scores([0.5, percentile])
+
+
+def test_z_scores_match_single_lookups():
+    planner = ABTestPlanner()
+    percentiles = [0.8, 0.9, 0.95, 0.975]
+
+    assert planner._get_z_scores(percentiles) == [planner._get_z_score(p) for p in percentiles]
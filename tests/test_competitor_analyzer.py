@@ -0,0 +1,243 @@
+"""Tests for competitor_analyzer.py."""
+
+import random
+
+import competitor_analyzer
+import pytest
+from competitor_analyzer import (
+    CTA_KEYWORDS,
+    DIFFERENTIATOR_KEYWORDS,
+    CompetitorAggregate,
+    CompetitorAnalyzer,
+    KeywordUsageIndex,
+)
+
+UNNAMED_APPS = [
+    {
+        "app_name": "",
+        "title": "Photo Editor Filters",
+        "description": "Edit photos with filters and collage tools.",
+        "rating": 4.5,
+        "ratings_count": 1000,
+        "keywords": ["photo", "editor"],
+    },
+    {
+        "app_name": "",
+        "title": "Collage Maker Photo",
+        "description": "Make photo collage layouts fast.",
+        "rating": 4.2,
+        "ratings_count": 500,
+        "keywords": ["collage", "photo"],
+    },
+]
+NAMED_APP = {
+    "app_name": "Snapper",
+    "title": "Snapper Camera",
+    "description": "Camera with manual controls.",
+    "rating": 4.0,
+    "ratings_count": 300,
+    "keywords": ["camera", "manual"],
+}
+
+
+def test_aggregate_usage_index_keeps_apps_with_the_same_name_apart():
+    analyzer = CompetitorAnalyzer("Photo", "apple")
+    aggregate = CompetitorAggregate(analyzer)
+    keys = [aggregate.add(app)["content_hash"] for app in UNNAMED_APPS]
+    aggregate.add(NAMED_APP)
+
+    gaps = aggregate.snapshot()["keyword_gaps"]
+
+    assert len(aggregate) == 3
+    assert [gap["keyword"] for gap in gaps] == ["photo"]
+    assert gaps[0]["used_by"] == keys
+    assert gaps == analyzer.compare_competitors([*UNNAMED_APPS, NAMED_APP])["keyword_gaps"]
+
+
+def test_aggregate_remove_only_drops_that_apps_keywords():
+    analyzer = CompetitorAnalyzer("Photo", "apple")
+    aggregate = CompetitorAggregate(analyzer)
+    keys = [aggregate.add(app)["content_hash"] for app in UNNAMED_APPS]
+    aggregate.add(NAMED_APP)
+
+    assert aggregate.remove(keys[0])
+    assert aggregate.snapshot()["keyword_gaps"] == []
+    assert aggregate.remove(keys[1])
+    assert len(aggregate) == 1
+
+
+def _competitor(index):
+    return {
+        "app_name": f"Planner {index}",
+        "title": f"Planner {index} - Task List: Todo",
+        "description": f"Plan tasks fast. Download now! The only planner with {index} boards.\n• Lists\n• Reminders",
+        "rating": 4.0 + index % 10 / 10,
+        "ratings_count": 100 * index,
+        "keywords": ["task", "todo", f"board{index}"],
+    }
+
+
+def test_small_batches_are_analyzed_without_a_pool(monkeypatch):
+    def no_pool(*_args, **_kwargs):
+        raise AssertionError("process pool started for a small batch")
+
+    monkeypatch.setattr(competitor_analyzer, "ProcessPoolExecutor", no_pool)
+    competitors = [_competitor(index) for index in range(5)]
+
+    analyses = CompetitorAnalyzer("productivity").analyze_competitors(competitors, max_workers=4)
+
+    sequential = CompetitorAnalyzer("productivity")
+    assert analyses == [sequential.analyze_competitor(competitor) for competitor in competitors]
+
+
+def test_pooled_analyses_equal_sequential_analyze_competitor(monkeypatch):
+    monkeypatch.setattr(CompetitorAnalyzer, "MIN_POOLED_ANALYSES", 1)
+    competitors = [_competitor(index) for index in range(6)] + [_competitor(2)]
+    analyzer = CompetitorAnalyzer("productivity")
+    analyzer.analyze_competitor(competitors[0])
+
+    pooled = analyzer.analyze_competitors(competitors, max_workers=2, chunk_size=2)
+
+    sequential = CompetitorAnalyzer("productivity")
+    assert pooled == [sequential.analyze_competitor(competitor) for competitor in competitors]
+    assert pooled[2] is pooled[6]
+
+
+def test_content_hash_cache_hits_and_misses(monkeypatch):
+    analyzer = CompetitorAnalyzer("productivity", cache_size=2)
+    calls = []
+    analyze_uncached = analyzer._analyze_uncached
+    monkeypatch.setattr(analyzer, "_analyze_uncached", lambda data, key: calls.append(key) or analyze_uncached(data, key))
+
+    first = analyzer.analyze_competitor(_competitor(1))
+    assert analyzer.analyze_competitor({**_competitor(1), "icon_url": "https://example.com/a.png"}) is first
+    assert analyzer.analyze_competitor({**_competitor(1), "rating": 3.1}) is not first
+    assert len(calls) == 2
+
+    analyzer.analyze_competitor(_competitor(2))
+    analyzer.analyze_competitor(_competitor(1))
+    assert len(calls) == 4
+    assert len(analyzer._analysis_cache) == 2
+
+
+def test_registry_keeps_the_latest_analysis_per_app_within_max_competitors():
+    analyzer = CompetitorAnalyzer("productivity", max_competitors=3)
+
+    for index in range(5):
+        analyzer.analyze_competitor(_competitor(index))
+    updated = analyzer.analyze_competitor({**_competitor(3), "rating": 2.0})
+
+    assert [analysis["app_name"] for analysis in analyzer.competitors] == ["Planner 2", "Planner 4", "Planner 3"]
+    assert analyzer.competitors[-1] is updated
+
+
+def _scan_gaps(keywords_by_app):
+    """The pre-index gap scan: every keyword against every app."""
+    all_keywords = set().union(*keywords_by_app.values())
+    gaps = []
+    for keyword in all_keywords:
+        using_apps = [app for app, keywords in keywords_by_app.items() if keyword in keywords]
+        if 1 < len(using_apps) < len(keywords_by_app):
+            gaps.append({
+                "keyword": keyword,
+                "used_by": using_apps,
+                "usage_percentage": round(len(using_apps) / len(keywords_by_app) * 100, 1),
+            })
+    return gaps
+
+
+def _by_keyword(gaps):
+    """Gaps in keyword order (equal usage counts have no defined order)."""
+    return sorted(gaps, key=lambda gap: gap["keyword"])
+
+
+def _random_keyword_sets(seed, apps=40, vocabulary=60):
+    rng = random.Random(seed)
+    words = [f"kw{index}" for index in range(vocabulary)]
+    return {f"app{index}": set(rng.sample(words, rng.randint(1, 12))) for index in range(apps)}
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_usage_index_gaps_match_the_pairwise_scan(seed):
+    keywords_by_app = _random_keyword_sets(seed)
+    index = KeywordUsageIndex()
+    for app, keywords in keywords_by_app.items():
+        index.add_app(app, keywords)
+
+    gaps = index.gaps(top_n=1000)
+
+    assert _by_keyword(gaps) == _by_keyword(_scan_gaps(keywords_by_app))
+    assert [gap["usage_percentage"] for gap in gaps] == sorted((gap["usage_percentage"] for gap in gaps), reverse=True)
+    top = index.gaps(top_n=5)
+    assert [gap["usage_percentage"] for gap in top] == [gap["usage_percentage"] for gap in gaps[:5]]
+
+
+def test_usage_index_reindex_and_remove_match_a_fresh_index():
+    keywords_by_app = _random_keyword_sets(4, apps=10)
+    index = KeywordUsageIndex()
+    for app, keywords in keywords_by_app.items():
+        index.add_app(app, keywords)
+    index.add_app("app3", {"kw1", "kw2"})
+    index.remove_app("app7")
+
+    keywords_by_app["app3"] = {"kw1", "kw2"}
+    del keywords_by_app["app7"]
+    fresh = KeywordUsageIndex()
+    for app, keywords in keywords_by_app.items():
+        fresh.add_app(app, keywords)
+
+    assert len(index) == len(fresh) == 9
+    assert _by_keyword(index.gaps(top_n=1000)) == _by_keyword(fresh.gaps(top_n=1000))
+    assert _by_keyword(index.app_gaps("app3", top_n=1000)) == _by_keyword(fresh.app_gaps("app3", top_n=1000))
+
+
+def _sentence_scan_differentiators(description):
+    """The per-sentence differentiator check the single-pass scan replaced."""
+    differentiators = []
+    for sentence in description.split("."):
+        if any(keyword in sentence.lower() for keyword in DIFFERENTIATOR_KEYWORDS):
+            differentiators.append(sentence.strip())
+    return differentiators[:5]
+
+
+@pytest.mark.parametrize(
+    "description",
+    [
+        "The only planner you need. Best and first in its class. Plain sentence. Download today",
+        "Unique boards. Leading sync. Award winning. Innovative widgets. Exclusive themes. Patent pending",
+        "Nothing special here. Just lists",
+        "Together we bestow calm. No trial required",
+        "İstanbul's best planner. Only here. Join us",
+        "Trailing differentiator without a period: revolutionary",
+    ],
+)
+def test_scan_detects_ctas_and_differentiators_like_the_per_sentence_checks(description):
+    scan = CompetitorAnalyzer("productivity")._scan_description(description)
+
+    assert scan["differentiators"] == _sentence_scan_differentiators(description)
+    assert scan["has_call_to_action"] == any(cta in description.lower() for cta in CTA_KEYWORDS)
+
+
+def test_aggregate_snapshot_equals_compare_competitors_after_updates():
+    competitors = [_competitor(index) for index in range(8)]
+    aggregate = CompetitorAggregate(CompetitorAnalyzer("productivity"))
+    aggregate.update_many(competitors)
+
+    competitors[2] = {**competitors[2], "rating": 2.5, "title": "Planner 2 - Habit Tracker"}
+    aggregate.update(competitors[2])
+    aggregate.remove("Planner 5")
+    del competitors[5]
+    aggregate.add(_competitor(9))
+    competitors.append(_competitor(9))
+
+    assert len(aggregate) == 8
+    assert aggregate.snapshot() == CompetitorAnalyzer("productivity").compare_competitors(competitors)
+
+
+def test_aggregate_snapshot_of_a_single_app_equals_compare_competitors():
+    aggregate = CompetitorAggregate(CompetitorAnalyzer("productivity"))
+    aggregate.add(_competitor(1))
+    aggregate.add(_competitor(2))
+    aggregate.remove("Planner 2")
+
+    assert aggregate.snapshot() == CompetitorAnalyzer("productivity").compare_competitors([_competitor(1)])
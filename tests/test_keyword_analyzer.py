@@ -0,0 +1,29 @@
+"""Tests for keyword_analyzer.py."""
+
+import re
+from collections import Counter
+
+import pytest
+from keyword_analyzer import KeywordAnalyzer
+
+STOP_WORDS = {"the", "and", "for", "with", "this", "that", "from", "have", "but", "not", "you", "all", "can", "are", "was", "were", "been"}
+
+
+def _regex_keywords(text, min_word_length=3):
+    """Keyword extraction as it was before the shared tokenizer."""
+    words = re.sub(r"[^\w\s]", " ", text.lower()).split()
+    words = [w for w in words if len(w) >= min_word_length and w not in STOP_WORDS]
+    phrases = Counter(f"{a} {b}" for a, b in zip(words, words[1:]))
+    keywords = list(Counter(words).items()) + list(phrases.items())
+    keywords.sort(key=lambda item: item[1], reverse=True)
+    return keywords[:50]
+
+
+@pytest.mark.parametrize("min_word_length", [2, 3, 5])
+def test_extract_keywords_from_text_is_unchanged(min_word_length):
+    text = (
+        "Task planner & to-do list: the best task planner for teams. "
+        "Plan tasks, share lists, and sync your to-do list with the calendar — café friendly!"
+    ) * 3
+
+    assert KeywordAnalyzer().extract_keywords_from_text(text, min_word_length) == _regex_keywords(text, min_word_length)
@@ -0,0 +1,27 @@
+"""Tests for localization_helper.py."""
+
+import pytest
+from localization_helper import LocalizationHelper
+
+
+@pytest.mark.parametrize("platform", ["google", "amazon", ""])
+def test_non_apple_platforms_use_google_limits(platform):
+    report = LocalizationHelper().validate_translations(
+        {"title": "x" * 45, "short_description": "y" * 90}, "de", platform
+    )
+
+    assert report["field_validations"]["title"]["limit"] == 50
+    assert report["field_validations"]["short_description"]["limit"] == 80
+    assert report["errors"] == ["short_description exceeds limit: 90/80 characters"]
+
+
+def test_apple_limits_and_translate_metadata_fallback():
+    helper = LocalizationHelper()
+
+    assert helper.validate_translations({"title": "x" * 45}, "de", "apple")["field_validations"]["title"]["limit"] == 30
+    localized = helper.translate_metadata({"title": "Task Planner"}, "en", "de", platform="windows")
+    expected = helper.translate_metadata({"title": "Task Planner"}, "en", "de", platform="google")
+    assert localized["platform"] == "windows"
+    assert {key: value for key, value in localized.items() if key != "platform"} == {
+        key: value for key, value in expected.items() if key != "platform"
+    }
@@ -0,0 +1,180 @@
+"""Tests for metadata_optimizer.py."""
+
+import json
+
+from metadata_optimizer import (
+    TITLE_POSITION_DECAY,
+    MetadataOptimizer,
+    _DescriptionBudget,
+    iter_optimized_metadata,
+    optimize_app_metadata_bulk,
+)
+
+KEYWORDS = ["photo editor", "filters", "collage maker", "retouch", "ai art"]
+
+
+def test_title_search_places_brand_by_score():
+    optimizer = MetadataOptimizer("apple")
+
+    brand_heavy = optimizer.search_title_combinations("PhotoFix", KEYWORDS, brand_value=5.0)
+    keyword_heavy = optimizer.search_title_combinations("PhotoFix", KEYWORDS, brand_value=0.5)
+
+    assert {option["strategy"] for option in brand_heavy["options"]} == {"brand_first"}
+    assert {option["strategy"] for option in keyword_heavy["options"]} == {"brand_last"}
+    top = keyword_heavy["options"][0]
+    assert top["title"].endswith("PhotoFix")
+    assert top["score"] == round(top["keyword_score"] + 0.5 * TITLE_POSITION_DECAY, 4)
+
+
+def test_title_search_uses_shorter_separator_only_when_needed():
+    optimizer = MetadataOptimizer("apple")
+
+    options = optimizer.search_title_combinations("PhotoFix", KEYWORDS)["options"]
+
+    for option in options:
+        if option["separator"] == ":":
+            assert len(option["title"]) + 1 > optimizer.limits["title"]
+        else:
+            assert option["separator"] == "-"
+    assert {option["separator"] for option in options} == {"-", ":"}
+
+
+def test_screenshot_strategy_sections_are_independent_per_call():
+    optimizer = MetadataOptimizer("apple")
+    app_info = {"name": "TaskFlow", "category": "productivity", "has_ipad": True}
+
+    first = optimizer.generate_screenshot_strategy(app_info)
+    pristine = optimizer.generate_screenshot_strategy(app_info)
+    first["key_principles"].append("extra")
+    first["text_overlay_guidelines"]["general_rules"].clear()
+    first["text_overlay_guidelines"]["font_size_guidance"]["headline"] = "changed"
+    first["device_coverage"]["required"][0]["device"] = "changed"
+    first["video_strategy"]["structure"].pop()
+    first["video_strategy"]["specs"]["duration"] = "changed"
+    first["ab_testing_visuals"][0]["priority"] = 99
+    first["screenshot_count"]["minimum"] = 0
+
+    second = optimizer.generate_screenshot_strategy(app_info)
+    assert second == pristine
+    assert second["video_strategy"]["structure"][0]["content"].startswith("Hook — show TaskFlow")
+
+
+def test_screenshot_template_is_cached_per_platform_ipad_and_category():
+    optimizer = MetadataOptimizer("apple")
+    MetadataOptimizer._screenshot_template.cache_clear()
+
+    optimizer.generate_screenshot_strategy({"name": "A", "category": "games"})
+    optimizer.generate_screenshot_strategy({"name": "B", "category": "games"})
+    optimizer.generate_screenshot_strategy({"name": "C", "category": "games", "has_ipad": True})
+
+    info = MetadataOptimizer._screenshot_template.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+
+
+GOOD_SPECS = [
+    {"app_id": f"app-{index}", "platform": platform, "app_info": {"name": name, "category": "productivity"},
+     "target_keywords": ["task planner", "todo list", "productivity"]}
+    for index, (platform, name) in enumerate([("apple", "TaskFlow"), ("google", "ListMate"), ("apple", "FocusPad")])
+]
+
+
+def _read_jsonl(path):
+    with path.open(encoding="utf-8") as handle:
+        return [json.loads(line) for line in handle]
+
+
+def test_bulk_reports_malformed_specs_per_app(tmp_path):
+    specs = [GOOD_SPECS[0], ["not", "a", "spec"], GOOD_SPECS[1], {"platform": "google"}, {"app_info": "oops"}, GOOD_SPECS[2]]
+    output = tmp_path / "results.jsonl"
+
+    summary = optimize_app_metadata_bulk(specs, str(output), max_workers=1, chunk_size=4)
+
+    results = _read_jsonl(output)
+    assert summary["apps_processed"] == 6
+    assert summary["apps_failed"] == 3
+    assert [result["app_id"] for result in results] == ["app-0", None, "app-1", None, None, "app-2"]
+    assert results[1]["error"].startswith("AttributeError")
+    assert results[3]["error"].startswith("KeyError") and results[3]["platform"] == "google"
+    assert results[4]["error"].startswith("TypeError")
+    assert all("error" not in results[index] for index in (0, 2, 5))
+
+
+def test_bulk_parallel_output_equals_sequential(tmp_path):
+    specs = [*GOOD_SPECS, ["bad"], *GOOD_SPECS]
+    sequential = tmp_path / "sequential.jsonl"
+    parallel = tmp_path / "parallel.jsonl"
+
+    optimize_app_metadata_bulk(specs, str(sequential), max_workers=1, chunk_size=2)
+    summary = optimize_app_metadata_bulk(specs, str(parallel), max_workers=2, chunk_size=2)
+
+    assert summary["apps_failed"] == 1
+    assert _read_jsonl(parallel) == _read_jsonl(sequential)
+    assert list(iter_optimized_metadata(specs, max_workers=2, chunk_size=3)) == _read_jsonl(sequential)
+
+
+CTA = "Download now and start experiencing the difference!"
+
+
+def test_description_budget_counts_match_a_full_text_scan():
+    budget = _DescriptionBudget(100, ["Task Planner", "todo"])
+    sections = ["Task planner for teams.\n\n", "KEY FEATURES:\n• Todo lists\n• task planner sync\n\n", "Todo today!"]
+
+    for section in sections:
+        budget.append(section)
+
+    text = "".join(sections)
+    assert budget.text() == text
+    assert budget.remaining == 100 - len(text)
+    assert budget.total_words == len(text.split())
+    assert budget.occurrences == {"Task Planner": 2, "todo": 2}
+
+
+def test_allocation_shortens_features_then_drops_whole_sections_in_priority_order():
+    hook = "Plan smarter.\n\n"
+    features = ["• " + "a" * 20 + "\n", "• " + "b" * 20 + "\n", "• " + "c" * 20 + "\n"]
+    benefits = "PERFECT FOR:\n" + "x" * 40 + "\n\n"
+    social_proof = "LOVED BY USERS\n\n"
+    max_length = len(hook) + len(CTA) + len("KEY FEATURES:\n\n") + 2 * len(features[0]) + len(social_proof)
+
+    kept_hook, kept_features, optional, dropped, shortened = MetadataOptimizer._allocate_description_sections(
+        max_length, hook, features, (("benefits", benefits), ("social_proof", social_proof)), CTA
+    )
+
+    assert kept_hook == hook
+    assert kept_features == features[:2]
+    assert optional == {"social_proof": social_proof}
+    assert dropped == ["benefits"]
+    assert shortened == ["features"]
+
+
+def test_oversized_features_are_shortened_within_the_limit():
+    app_info = {
+        "name": "TaskFlow",
+        "unique_value": "Plan smarter.",
+        "key_features": ["Feature " + "x" * 900 for _ in range(5)],
+        "target_audience": "busy people",
+    }
+
+    result = MetadataOptimizer("apple").optimize_description(app_info, ["task planner"], "full")
+
+    assert result["shortened_sections"] == ["features"]
+    assert result["dropped_sections"] == []
+    assert result["structure"]["has_benefits"]
+    assert result["full_description"].count("• Feature") == 4
+    assert len(result["full_description"]) == result["length"] <= 4000
+
+
+def test_oversized_unique_value_drops_optional_sections_but_keeps_cta():
+    app_info = {
+        "name": "TaskFlow",
+        "unique_value": "plan " * 900,
+        "key_features": ["Shared lists", "Reminders"],
+        "target_audience": "busy people",
+    }
+
+    result = MetadataOptimizer("google").optimize_description(app_info, ["task planner"], "full")
+
+    assert result["dropped_sections"] == ["features", "benefits", "social_proof"]
+    assert result["full_description"].endswith("...\n\n" + CTA)
+    assert len(result["full_description"]) == result["length"] <= 4000
+    assert not result["structure"]["has_features"]
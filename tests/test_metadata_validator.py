@@ -0,0 +1,29 @@
+"""Tests for metadata_validator.py."""
+
+import pytest
+from metadata_validator import LIMIT_TABLE, BatchMetadataValidator, CompiledLimitTable
+
+
+def test_limits_for_is_read_only_and_shared_table_unchanged():
+    limits = LIMIT_TABLE.limits_for("apple")
+
+    with pytest.raises(TypeError):
+        limits["title"] = 1000
+    assert LIMIT_TABLE.limits_for("apple")["title"] == 30
+    assert LIMIT_TABLE.lookup("apple", "title") == ("title", 30)
+    assert LIMIT_TABLE.limits_for("google")["description"] == LIMIT_TABLE.limits_for("google")["full_description"]
+
+
+def test_limits_for_rejects_unknown_platform():
+    with pytest.raises(ValueError, match="Invalid platform"):
+        CompiledLimitTable().limits_for("amazon")
+
+
+def test_iter_full_reports_covers_invalid_or_all_entries():
+    result = BatchMetadataValidator().validate([
+        {"platform": "apple", "locale": "en-US", "fields": {"title": "x" * 31}},
+        {"platform": "google", "locale": "de-DE", "fields": {"title": "ok"}},
+    ])
+
+    assert [report["locale"] for report in result.iter_full_reports()] == ["en-US"]
+    assert [report["locale"] for report in result.iter_full_reports(only_invalid=False)] == ["en-US", "de-DE"]
@@ -0,0 +1,400 @@
+"""Tests for review_analyzer.py."""
+
+import csv
+import gzip
+import io
+import json
+import random
+from collections import Counter
+from datetime import date, timedelta
+
+import pytest
+from review_analyzer import (
+    DEFAULT_REVIEW_CACHE_SIZE,
+    ReviewAnalyzer,
+    ReviewDeduplicator,
+    SentimentTrendAggregator,
+    _coerce_csv_review,
+    analyze_reviews,
+    iter_reviews,
+)
+from sentiment_scorer import LexiconSentimentScorer
+
+START = date(2026, 3, 1)
+
+
+def _crash_reviews(day_offset, count):
+    day = (START + timedelta(days=day_offset)).isoformat()
+    return [
+        {"id": f"{day}-{i}", "text": "App keeps crashing on launch", "rating": 1, "date": day}
+        for i in range(count)
+    ]
+
+
+def _praise_reviews(day_offset, count):
+    day = (START + timedelta(days=day_offset)).isoformat()
+    return [{"text": "Great app, love it", "rating": 5, "date": day} for _ in range(count)]
+
+
+def test_no_spike_alert_without_baseline_history():
+    index = ReviewAnalyzer("TestApp").create_issue_index()
+
+    alerts = index.add_many(_crash_reviews(0, 25))
+
+    assert alerts == []
+    assert index.alerts == []
+
+
+def test_no_spike_alert_before_min_baseline_days():
+    index = ReviewAnalyzer("TestApp").create_issue_index(min_baseline_days=3)
+    index.add_many(_praise_reviews(0, 5))
+
+    assert index.add_many(_crash_reviews(2, 25)) == []
+
+
+def test_spike_alert_once_baseline_history_exists():
+    index = ReviewAnalyzer("TestApp").create_issue_index(min_baseline_days=3)
+    for day_offset in range(3):
+        index.add_many(_praise_reviews(day_offset, 5))
+        index.add_many(_crash_reviews(day_offset, 1))
+
+    alerts = index.add_many(_crash_reviews(3, 25))
+
+    assert len(alerts) == 1
+    assert alerts[0]["category"] == "crashes"
+    assert alerts[0]["date"] == (START + timedelta(days=3)).isoformat()
+    assert alerts[0]["baseline_daily_average"] == 1.0
+
+
+def _trend_aggregator():
+    aggregator = SentimentTrendAggregator(ReviewAnalyzer("TestApp"))
+    for day_offset in range(10):
+        aggregator.add_many(_praise_reviews(day_offset, day_offset + 1))
+    aggregator.add({"text": "No date on this one", "rating": 2})
+    return aggregator
+
+
+def test_trend_window_bounds_are_inclusive():
+    aggregator = _trend_aggregator()
+
+    entry = aggregator.window(START + timedelta(days=2), (START + timedelta(days=4)).isoformat())
+
+    assert entry["total_reviews"] == 3 + 4 + 5
+    assert entry["period"] == "2026-03-03..2026-03-05"
+    assert aggregator.window(START, START)["total_reviews"] == 1
+    assert aggregator.window(START + timedelta(days=4), START)["total_reviews"] == 0
+    assert aggregator.undated_reviews == 1
+
+
+def test_trend_rolling_point_counts():
+    aggregator = _trend_aggregator()
+
+    assert len(aggregator.rolling(days=7)) == 10
+    line = aggregator.rolling(days=3, end=START + timedelta(days=9), points=4)
+    assert [entry["period"] for entry in line] == ["2026-03-07", "2026-03-08", "2026-03-09", "2026-03-10"]
+    assert [entry["total_reviews"] for entry in line] == [5 + 6 + 7, 6 + 7 + 8, 7 + 8 + 9, 8 + 9 + 10]
+
+
+def test_trend_between_releases_windows():
+    aggregator = _trend_aggregator()
+
+    entries = aggregator.between_releases({"2.0": "2026-03-06", "1.0": START})
+
+    assert [entry["period"] for entry in entries] == ["1.0", "2.0"]
+    assert [entry["total_reviews"] for entry in entries] == [1 + 2 + 3 + 4 + 5, 6 + 7 + 8 + 9 + 10]
+
+
+@pytest.mark.parametrize(
+    ("query", "message"),
+    [
+        (lambda agg: agg.window("not-a-date", START), "start"),
+        (lambda agg: agg.window(START, None), "end"),
+        (lambda agg: agg.rolling(end="2026-13-01"), "end"),
+        (lambda agg: agg.rolling(days=0), "days"),
+        (lambda agg: agg.between_releases({"1.0": START, "2.0": "soon"}), "'2.0'"),
+    ],
+)
+def test_trend_queries_reject_bad_dates(query, message):
+    with pytest.raises(ValueError, match=message):
+        query(_trend_aggregator())
+
+
+class _CountingScorer(LexiconSentimentScorer):
+    """Lexicon scorer that counts the texts it scores."""
+
+    scored = 0
+
+    def score_texts(self, texts, ratings=None):
+        self.scored += len(texts)
+        return super().score_texts(texts, ratings)
+
+
+CACHE_REVIEWS = [
+    {"id": "a", "text": "Love it, great app", "rating": 5},
+    {"id": "b", "text": "Crashes on launch, please add offline mode", "rating": 1},
+    {"text": "Slow and buggy", "rating": 2},
+]
+
+
+def _full_report(analyzer, reviews):
+    accumulator = analyzer.create_accumulator()
+    accumulator.add_many(reviews)
+    return accumulator.report()
+
+
+def test_review_cache_is_off_by_default(tmp_path):
+    analyzer = ReviewAnalyzer("TestApp")
+    _full_report(analyzer, CACHE_REVIEWS)
+
+    assert analyzer.cache_size == 0
+    assert len(analyzer.analysis_cache) == 0
+    assert (analyzer.cache_hits, analyzer.cache_misses) == (0, 0)
+    assert ReviewAnalyzer("TestApp", cache_path=str(tmp_path / "cache.json")).cache_size == DEFAULT_REVIEW_CACHE_SIZE
+
+
+def test_review_cache_hit_path_reuses_features_and_scores():
+    scorer = _CountingScorer()
+    cached = ReviewAnalyzer("TestApp", cache_size=10, sentiment_scorer=scorer)
+
+    first = _full_report(cached, CACHE_REVIEWS)
+    second = _full_report(cached, CACHE_REVIEWS)
+
+    assert first == second == _full_report(ReviewAnalyzer("TestApp", sentiment_scorer=LexiconSentimentScorer()), CACHE_REVIEWS)
+    assert (cached.cache_hits, cached.cache_misses) == (3, 3)
+    assert scorer.scored == 3
+
+
+def test_edited_review_replaces_its_cache_entry():
+    analyzer = ReviewAnalyzer("TestApp", cache_size=10)
+    _full_report(analyzer, CACHE_REVIEWS)
+
+    edited = [dict(CACHE_REVIEWS[0], text="Terrible, it crashes constantly", rating=1)]
+    report = _full_report(analyzer, edited)
+
+    assert analyzer.cache_misses == 4
+    assert len(analyzer.analysis_cache) == 3
+    assert report["sentiment_analysis"]["sentiment_distribution"]["negative"] == 100.0
+    assert report == _full_report(ReviewAnalyzer("TestApp"), edited)
+
+    # A rating-only edit changes the score, so it invalidates the entry too
+    _full_report(analyzer, [dict(edited[0], rating=5)])
+    assert analyzer.cache_misses == 5
+
+
+def test_review_cache_path_round_trip(tmp_path):
+    path = str(tmp_path / "review-cache.json")
+    analyzer = ReviewAnalyzer("TestApp", cache_path=path, sentiment_scorer=LexiconSentimentScorer())
+    expected = _full_report(analyzer, CACHE_REVIEWS)
+    analyzer.save_cache()
+
+    scorer = _CountingScorer()
+    reloaded = ReviewAnalyzer("TestApp", cache_path=path, sentiment_scorer=scorer)
+    assert len(reloaded.analysis_cache) == 3
+    assert _full_report(reloaded, CACHE_REVIEWS) == expected
+    assert (reloaded.cache_hits, reloaded.cache_misses) == (3, 0)
+    assert scorer.scored == 0
+
+    # Scores saved under a different scorer are recomputed, features are reused
+    other = _CountingScorer(negation_window=1)
+    different = ReviewAnalyzer("TestApp", cache_path=path, sentiment_scorer=other)
+    _full_report(different, CACHE_REVIEWS)
+    assert (different.cache_hits, other.scored) == (3, 3)
+
+
+COMPLAINT = (
+    "This app used to be great but after the latest update it crashes every time I open the camera "
+    "and my saved projects are gone so please fix this soon or I will switch to another editor for good"
+)
+PRAISE = (
+    "Lovely little planner with clean widgets and reminders that actually work across my phone and tablet "
+    "and the sync never loses a task even offline which is more than I can say for the others"
+)
+
+
+def test_deduplicator_flags_exact_duplicates_after_normalization():
+    deduplicator = ReviewDeduplicator()
+
+    assert deduplicator.check({"text": COMPLAINT}) is None
+    assert deduplicator.check({"text": "  " + COMPLAINT.upper().replace(" ", "\n  ")}) == "exact"
+    assert deduplicator.check({"text": "great app"}) is None
+    assert deduplicator.check({"text": "great app"}) is None
+    assert deduplicator.stats() == {
+        "reviews_seen": 4,
+        "reviews_kept": 3,
+        "exact_duplicates": 1,
+        "near_duplicates": 0,
+        "suppressed": 1,
+        "suppression_rate": 25.0,
+    }
+
+
+def test_deduplicator_near_duplicate_threshold():
+    one_word_edit = {"text": COMPLAINT.replace("camera", "gallery")}  # 6 bits from COMPLAINT
+
+    at_threshold = ReviewDeduplicator(max_distance=6)
+    at_threshold.check({"text": COMPLAINT})
+    below_threshold = ReviewDeduplicator(max_distance=4)
+    below_threshold.check({"text": COMPLAINT})
+    exact_only = ReviewDeduplicator(near_duplicates=False)
+    exact_only.check({"text": COMPLAINT})
+
+    assert at_threshold.check(one_word_edit) == "near"
+    assert at_threshold.check({"text": PRAISE}) is None
+    assert below_threshold.check(one_word_edit) is None
+    assert exact_only.check(one_word_edit) is None
+    assert at_threshold.stats()["near_duplicates"] == 1
+
+
+def test_analyze_parallel_drops_duplicates_before_sharding():
+    reviews = [
+        {"id": 1, "text": COMPLAINT, "rating": 1, "date": "2026-03-01"},
+        {"id": 2, "text": COMPLAINT, "rating": 1, "date": "2026-03-01"},
+        {"id": 3, "text": COMPLAINT.replace("camera", "gallery"), "rating": 2, "date": "2026-03-02"},
+        {"id": 4, "text": PRAISE, "rating": 5, "date": "2026-03-02"},
+        {"id": 5, "text": "great app", "rating": 5, "date": "2026-03-03"},
+        {"id": 6, "text": "great app", "rating": 4, "date": "2026-03-03"},
+    ]
+    analyzer = ReviewAnalyzer("TestApp")
+
+    report = analyzer.analyze_parallel(reviews, max_workers=1, shard_size=2, deduplicator=ReviewDeduplicator())
+
+    deduplication = report.pop("deduplication")
+    assert deduplication["exact_duplicates"] == 1
+    assert deduplication["near_duplicates"] == 1
+    assert report == analyzer.analyze_stream([reviews[0], reviews[3], reviews[4], reviews[5]], chunk_size=2)
+
+
+STREAM_REVIEWS = [
+    {"id": "r1", "text": "App keeps crashing on launch, please fix", "rating": 1, "date": "2026-03-01", "version": "2.1"},
+    {"id": "r2", "text": "Great app, love the widgets", "rating": 5, "date": "2026-03-01", "version": "2.1"},
+    {"id": "r3", "text": "Please add dark mode and calendar sync", "rating": 4, "date": "2026-03-02", "version": "2.1"},
+    {"id": "r4", "text": 'Too slow since the update, "sync" never finishes', "rating": 2, "date": "2026-03-03", "version": "2.2"},
+    {"id": "r5", "text": "Works fine, would love an export option", "rating": 4, "date": "2026-03-04", "version": "2.2"},
+]
+
+
+def _write_reviews(path, reviews):
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "wt", encoding="utf-8", newline="") as handle:
+        if ".csv" in path.suffixes:
+            writer = csv.DictWriter(handle, fieldnames=list(reviews[0]))
+            writer.writeheader()
+            writer.writerows(reviews)
+        else:
+            handle.writelines(json.dumps(review) + "\n" for review in reviews)
+
+
+@pytest.mark.parametrize("filename", ["reviews.jsonl", "reviews.jsonl.gz", "reviews.csv", "reviews.csv.gz"])
+def test_analyze_stream_reads_files_like_analyze_reviews(tmp_path, filename):
+    path = tmp_path / filename
+    _write_reviews(path, STREAM_REVIEWS)
+
+    assert list(iter_reviews(str(path))) == STREAM_REVIEWS
+    assert ReviewAnalyzer("TestApp").analyze_stream(str(path), chunk_size=2) == analyze_reviews("TestApp", STREAM_REVIEWS)
+
+
+def test_analyze_stream_reads_open_files_and_skips_blank_lines(tmp_path):
+    path = tmp_path / "reviews.jsonl"
+    _write_reviews(path, STREAM_REVIEWS)
+    path.write_text(path.read_text(encoding="utf-8").replace("\n", "\n\n", 2), encoding="utf-8")
+
+    with path.open(encoding="utf-8") as handle:
+        report = ReviewAnalyzer("TestApp").analyze_stream(handle, chunk_size=3)
+
+    assert report == analyze_reviews("TestApp", STREAM_REVIEWS)
+
+
+def test_csv_ratings_are_coerced_and_empty_cells_dropped():
+    rows = csv.DictReader(io.StringIO("id,text,rating,version\nr1,Nice,4.0,\nr2,Meh,3.5,1.0\nr3,Odd,n/a,\n"))
+
+    assert [_coerce_csv_review(row) for row in rows] == [
+        {"id": "r1", "text": "Nice", "rating": 4},
+        {"id": "r2", "text": "Meh", "rating": 3.5, "version": "1.0"},
+        {"id": "r3", "text": "Odd"},
+    ]
+
+
+def _mixed_reviews(count):
+    reviews = []
+    for index in range(count):
+        review = dict(STREAM_REVIEWS[index % len(STREAM_REVIEWS)])
+        review["id"] = f"r{index}"
+        review["text"] = f"{review['text']} #{index % 7}"
+        review["date"] = (START + timedelta(days=index % 9)).isoformat()
+        reviews.append(review)
+    return reviews
+
+
+def test_analyze_parallel_equals_analyze_stream():
+    reviews = _mixed_reviews(60)
+    analyzer = ReviewAnalyzer("TestApp")
+
+    parallel = analyzer.analyze_parallel(reviews, max_workers=2, shard_size=5)
+
+    assert parallel == ReviewAnalyzer("TestApp").analyze_stream(reviews, chunk_size=7)
+    assert parallel["sentiment_analysis"]["total_reviews_analyzed"] == 60
+
+
+def test_analyze_parallel_reads_files_and_uses_the_custom_scorer(tmp_path):
+    path = tmp_path / "reviews.csv.gz"
+    reviews = _mixed_reviews(12)
+    _write_reviews(path, reviews)
+    scorer = LexiconSentimentScorer({"crashing": -3.0, "love": 2.0})
+
+    parallel = ReviewAnalyzer("TestApp", sentiment_scorer=scorer).analyze_parallel(str(path), max_workers=2, shard_size=4)
+
+    assert parallel == ReviewAnalyzer("TestApp", sentiment_scorer=scorer).analyze_stream(reviews)
+
+
+def _pairwise_leader_clusters(groups, min_similarity):
+    """Leader clustering that compares every key set with every leader."""
+    leaders, members = [], []
+    for key in sorted(groups, key=lambda k: (-len(groups[k]), groups[k][0])):
+        best, best_similarity = -1, min_similarity
+        for index, leader in enumerate(leaders):
+            similarity = len(key & leader) / len(key | leader)
+            if similarity > best_similarity or (similarity == best_similarity and best < 0):
+                best, best_similarity = index, similarity
+        if best >= 0:
+            members[best].append(key)
+        else:
+            leaders.append(key)
+            members.append([key])
+    return members
+
+
+@pytest.mark.parametrize("min_similarity", [0.3, 0.5, 0.75, 1.0])
+@pytest.mark.parametrize("seed", [1, 2])
+def test_indexed_leader_clusters_match_pairwise_leader_clusters(seed, min_similarity):
+    rng = random.Random(seed)
+    words = [f"word{index}" for index in range(25)]
+    groups = {}
+    for request_index in range(300):
+        key = frozenset(rng.sample(words[: rng.randint(6, 25)], rng.randint(1, 6)))
+        groups.setdefault(key, []).append(request_index)
+    frequency = Counter(word for key in groups for word in key)
+    rank = {word: position for position, word in enumerate(sorted(frequency, key=lambda w: (frequency[w], w)))}
+
+    members = ReviewAnalyzer._leader_clusters(groups, rank, min_similarity)
+
+    assert members == _pairwise_leader_clusters(groups, min_similarity)
+
+
+def test_feature_requests_with_shared_key_words_are_clustered():
+    analyzer = ReviewAnalyzer("TestApp")
+    requests = [
+        {"request_text": "please add offline editing"},
+        {"request_text": "add calendar export"},
+        {"request_text": "offline editing would be great"},
+        {"request_text": "add it"},
+        {"request_text": "calendar export please"},
+        {"request_text": "offline editing"},
+    ]
+
+    clusters = analyzer._cluster_feature_requests(requests)
+
+    assert [(cluster["feature_theme"], cluster["request_count"]) for cluster in clusters] == [
+        ("editing offline", 3),
+        ("calendar export", 2),
+    ]
+    assert clusters[0]["examples"] == [requests[0], requests[2], requests[5]]
@@ -0,0 +1,80 @@
+"""Tests for sentiment_scorer.py."""
+
+import pickle
+
+import pytest
+from sentiment_scorer import LexiconSentimentScorer, score_review_sentiment
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("great", 1.0),
+        ("not great", -1.0),
+        ("not really very great", -1.0),
+        ("not really very truly great", 1.0),
+        ("not good, great", 1.0),
+        ("never crashes, but slow", 0.0),
+    ],
+)
+def test_negation_window(text, expected):
+    scorer = LexiconSentimentScorer({"great": 1.0, "crash": -1.0, "slow": -1.0}, negation_window=3)
+
+    assert scorer.text_score(text) == expected
+
+
+def test_intensity_weights_and_phrases():
+    scorer = LexiconSentimentScorer({"good": 1.0, "amazing": 2.5, "not working": -2.0})
+
+    assert scorer.text_score("Good and AMAZING") == 3.5
+    assert scorer.text_score("amazing amazing") == 5.0
+    # The phrase wins over the negation it starts with
+    assert scorer.text_score("not working at all") == -2.0
+    assert scorer.text_score("not amazing") == -2.5
+
+
+def test_score_combines_rating_and_text_and_clamps():
+    scorer = LexiconSentimentScorer({"love": 1.0}, text_scale=2.0)
+
+    assert scorer.score("love", rating=3) == pytest.approx(0.2)
+    assert scorer.score("love " * 20, rating=5) == 1.0
+    assert scorer.score("", rating=1) == pytest.approx(-0.6)
+
+
+def test_score_texts_matches_score_element_by_element():
+    scorer = LexiconSentimentScorer(negation_window=2)
+    texts = [
+        "Love it, works great",
+        "Crashes constantly. Not great, terrible",
+        "",
+        "don't hate it, it's not bad",
+        "Never slow!",
+        "contains a \x00 separator, still great",
+        "LOVE LOVE love",
+    ]
+    ratings = [5, 1, 3, 4, 2, 3, 5]
+
+    assert scorer.score_texts(texts, ratings) == [scorer.score(text, rating) for text, rating in zip(texts, ratings)]
+    assert scorer.text_scores(texts) == [scorer.text_score(text) for text in texts]
+    assert scorer.score_texts([]) == []
+    assert score_review_sentiment([{"text": text, "rating": rating} for text, rating in zip(texts, ratings)]) == (
+        LexiconSentimentScorer().score_texts(texts, ratings)
+    )
+
+
+def test_score_texts_rejects_mismatched_ratings():
+    with pytest.raises(ValueError, match="same length"):
+        LexiconSentimentScorer().score_texts(["a", "b"], [5])
+
+
+def test_equality_hash_and_pickle():
+    scorer = LexiconSentimentScorer.from_keywords(["love"], ["crash"])
+    same = LexiconSentimentScorer({"love": 1.0, "crash": -1.0})
+    different = LexiconSentimentScorer({"love": 1.0, "crash": -1.0}, negation_window=1)
+
+    assert scorer == same
+    assert hash(scorer) == hash(same)
+    assert scorer != different
+    restored = pickle.loads(pickle.dumps(scorer))
+    assert restored == scorer
+    assert restored.text_score("no crashes") == scorer.text_score("no crashes") == 1.0
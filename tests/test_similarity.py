@@ -0,0 +1,25 @@
+"""Tests for similarity.py."""
+
+from similarity import MinHashLSHIndex
+
+BASE_TEXT = "the quick brown fox jumps over the lazy dog near the river bank today"
+
+
+def test_clusters_after_remove_then_add():
+    index = MinHashLSHIndex()
+    index.add("a", BASE_TEXT)
+    index.add("b", BASE_TEXT + " again")
+    index.remove("a")
+    index.add("c", BASE_TEXT + " again now")
+
+    assert len(set(index._order.values())) == len(index)
+    assert index.clusters() == [["b", "c"]]
+
+
+def test_readded_item_moves_to_end_of_order():
+    index = MinHashLSHIndex()
+    index.add("a", BASE_TEXT)
+    index.add("b", BASE_TEXT + " again")
+    index.add("a", BASE_TEXT + " again now")
+
+    assert index.clusters() == [["b", "a"]]
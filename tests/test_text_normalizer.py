@@ -0,0 +1,119 @@
+"""Tests for text_normalizer.py."""
+
+import re
+
+import pytest
+from text_normalizer import (
+    KeywordAutomaton,
+    Tokenizer,
+    get_stem_table,
+    get_stop_words,
+    get_tokenizer,
+    iter_ngrams,
+    split_words,
+)
+
+
+def test_overlapping_keywords_are_all_reported():
+    automaton = KeywordAutomaton(["crash", "crashes", "app crash", "shes", "not working", "working"])
+    text = "the app crashes and is not working"
+
+    assert sorted(automaton.iter_matches(text)) == [
+        (4, "app crash"),
+        (8, "crash"),
+        (8, "crashes"),
+        (11, "shes"),
+        (23, "not working"),
+        (27, "working"),
+    ]
+    assert automaton.matched_keywords(text) == ["crash", "crashes", "app crash", "shes", "not working", "working"]
+    assert automaton.contains_any(text)
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("found a bug", ["bug"]),
+        ("debugging is painful", ["bug"]),
+        ("bugs everywhere", ["bug"]),
+        ("slowly but surely", ["slow"]),
+        ("no problems here", []),
+        ("", []),
+    ],
+)
+def test_matching_ignores_word_boundaries_like_substring_search(text, expected):
+    automaton = KeywordAutomaton(["bug", "slow"])
+
+    assert automaton.matched_keywords(text) == expected
+    assert automaton.contains_any(text) == bool(expected)
+    assert sorted({keyword for _, keyword in automaton.iter_matches(text)}) == expected
+    assert automaton.matched_keywords(text) == [keyword for keyword in ("bug", "slow") if keyword in text]
+
+
+def test_keywords_are_lowercased_and_deduplicated_in_order():
+    automaton = KeywordAutomaton(["Love", "love", "", "GREAT"])
+
+    assert automaton.keywords == ("love", "great")
+    assert automaton.matched_keywords("great, love it") == ["love", "great"]
+    assert KeywordAutomaton([]).matched_keywords("anything") == []
+    assert list(KeywordAutomaton([]).iter_matches("anything")) == []
+    assert not KeywordAutomaton([]).contains_any("anything")
+
+
+@pytest.mark.parametrize(
+    ("word", "expected"),
+    [
+        ("business", "business"),
+        ("news", "news"),
+        ("glasses", "glass"),
+        ("status", "status"),
+        ("statuses", "status"),
+        ("series", "series"),
+        ("buses", "bus"),
+        ("boxes", "box"),
+        ("lenses", "lens"),
+        ("houses", "house"),
+        ("apps", "app"),
+    ],
+)
+def test_english_singular_folding(word, expected):
+    assert get_stem_table("en").stem(word) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Photo-Editor: filters, collage & AI art!",
+        "snake_case words\tand 3D tabs\nnew_lines",
+        "Café crème — naïve “quotes” and emoji 📷 here",
+        "",
+        "...!!!",
+    ],
+)
+def test_split_words_matches_the_regex_substitute_and_split(text):
+    assert split_words(text) == re.sub(r"[^\w\s]", " ", text.lower()).split()
+    assert split_words(text, lower=False) == re.sub(r"[^\w\s]", " ", text).split()
+
+
+def test_iter_ngrams_joins_consecutive_tokens():
+    tokens = ["task", "planner", "with", "reminders"]
+
+    assert list(iter_ngrams(tokens, 1)) == tokens
+    assert list(iter_ngrams(tokens, 2)) == [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    assert list(iter_ngrams(tokens, 3)) == ["task planner with", "planner with reminders"]
+    assert list(iter_ngrams(tokens, 5)) == []
+
+
+def test_tokenizer_filters_length_and_stop_words_before_folding():
+    tokenizer = Tokenizer("en-US", min_length=4, extra_stop_words={"app"}, stem=True)
+
+    assert tokenizer.tokens("The best apps for Photos and Filters, with buses!") == ["best", "app", "photo", "filter", "bus"]
+    assert tokenizer.ngrams("Photos with Filters", 2) == ["photo filter"]
+    assert list(tokenizer.iter_tokens(["Photos", "", "were been"])) == [["photo"], [], []]
+
+
+def test_get_tokenizer_shares_one_instance_per_configuration():
+    assert get_tokenizer("en", 4, stem=True) is get_tokenizer("en", 4, stem=True)
+    assert get_tokenizer("en", 4) is not get_tokenizer("en", 4, stem=True)
+    assert get_stop_words("EN-gb") == get_stop_words("en")
+    assert get_stop_words("xx") == frozenset()